@@ -7,29 +7,190 @@ Enhanced with:
 - CSRF protection
 - Rate limiting
 - Security headers
-- Audit logging
+- Audit logging (batched background writes)
 """
 
+import logging
 import os
+import time
 from datetime import datetime
-from flask import Flask, request, g
+from pathlib import Path
+
+import click
+from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
+from jinja2 import FileSystemBytecodeCache
+from sqlalchemy import event
 
 # Initialize extensions
 db = SQLAlchemy()
 
 
+class TimingMiddleware:
+    """
+    WSGI middleware that logs each request's method, path, status and duration.
+    
+    Timing lives in the WSGI call's local scope, so no per-request state is
+    stored on flask.g.
+    """
+    
+    def __init__(self, wsgi_app, logger):
+        self.wsgi_app = wsgi_app
+        self.logger = logger
+    
+    def __call__(self, environ, start_response):
+        if not self.logger.isEnabledFor(logging.INFO):
+            return self.wsgi_app(environ, start_response)
+        
+        start = time.perf_counter()
+        status = []
+        
+        def timed_start_response(status_line, headers, exc_info=None):
+            status.append(status_line)
+            return start_response(status_line, headers, exc_info)
+        
+        try:
+            return self.wsgi_app(environ, timed_start_response)
+        finally:
+            self.logger.info(
+                '%s %s - %s - %.3fs',
+                environ.get('REQUEST_METHOD'), environ.get('PATH_INFO'),
+                status[0].split(' ', 1)[0] if status else '-',
+                time.perf_counter() - start
+            )
+
+
+def init_db() -> int:
+    """
+    Create database tables, upgrade existing audit tables and seed the
+    default data retention policy.
+    
+    Audit records left in the main database by earlier releases are copied
+    into the 'audit' bind.
+    
+    Returns:
+        Number of legacy audit records copied
+    """
+    db.create_all()
+    
+    from app.audit_logger import import_legacy_audit_log, upgrade_audit_schema
+    upgrade_audit_schema()
+    copied = import_legacy_audit_log()
+    
+    # Create default data retention policy if none exists
+    from app.models import DataRetentionPolicy
+    if db.session.query(DataRetentionPolicy.id).first() is None:
+        default_policy = DataRetentionPolicy()
+        db.session.add(default_policy)
+        db.session.commit()
+    
+    return copied
+
+
+# Connection pool settings for server databases (PostgreSQL etc.)
+POOL_ENGINE_OPTIONS = {
+    'pool_size': 10,
+    'max_overflow': 20,
+    'pool_timeout': 30,
+    'pool_recycle': 1800,  # 30 minutes
+    'pool_pre_ping': True,
+}
+
+
+def engine_options_for(database_uri: str) -> dict:
+    """
+    Get SQLAlchemy engine options for a database URI.
+    
+    SQLite is left to Flask-SQLAlchemy's defaults (which already use a
+    StaticPool for in-memory databases); pool sizing only applies to
+    server databases.
+    """
+    if database_uri.startswith('sqlite'):
+        return {}
+    return dict(POOL_ENGINE_OPTIONS)
+
+
+def audit_database_uri_for(database_uri: str) -> str:
+    """
+    Get the default URI for the 'audit' bind.
+    
+    SQLite file databases get a sibling audit.db so audit and submission
+    writes take independent file locks. Other URIs are returned unchanged:
+    server databases keep audit tables alongside the rest, and in-memory
+    SQLite gets a second, private in-memory database for the bind.
+    """
+    prefix = 'sqlite:///'
+    path = database_uri[len(prefix):] if database_uri.startswith(prefix) else ''
+    if path and path != ':memory:':
+        return prefix + os.path.join(os.path.dirname(path), 'audit.db')
+    return database_uri
+
+
+# Applied to every new SQLite connection: WAL lets readers proceed while
+# the (single) writer commits, and NORMAL sync is durable under WAL
+SQLITE_PRAGMAS = (
+    'journal_mode=WAL',
+    'synchronous=NORMAL',
+    'temp_store=MEMORY',
+    'mmap_size=268435456',  # 256 MB
+)
+
+
+def configure_sqlite_engine(engine):
+    """Apply SQLITE_PRAGMAS on connect. No-op for non-SQLite engines."""
+    if engine.dialect.name != 'sqlite':
+        return
+    
+    @event.listens_for(engine, 'connect')
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(f'PRAGMA {pragma}')
+        cursor.close()
+
+
+def _env_config():
+    """
+    Read environment-derived settings.
+    
+    Read on every create_app call, so environment changes made after
+    startup (test fixtures, monkeypatch.setenv) are picked up.
+    """
+    return {
+        'SECRET_KEY': os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production'),
+        'SQLALCHEMY_DATABASE_URI': os.environ.get('DATABASE_URL', 'sqlite:///will_generator.db'),
+        'AUDIT_DATABASE_URI': os.environ.get('AUDIT_DATABASE_URL', ''),
+        'ADMIN_USERNAME': os.environ.get('ADMIN_USERNAME', ''),
+        'ADMIN_PASSWORD_HASH': os.environ.get('ADMIN_PASSWORD_HASH', ''),
+        
+        # Rate limiting storage
+        'RATELIMIT_STORAGE_URI': os.environ.get('REDIS_URL', 'memory://'),
+        
+        # Email settings
+        'SMTP_HOST': os.environ.get('SMTP_HOST', ''),
+        'SMTP_PORT': int(os.environ.get('SMTP_PORT', 587)),
+        'SMTP_USERNAME': os.environ.get('SMTP_USERNAME', ''),
+        'SMTP_PASSWORD': os.environ.get('SMTP_PASSWORD', ''),
+        'SMTP_USE_TLS': os.environ.get('SMTP_USE_TLS', 'true').lower() == 'true',
+        'EMAIL_FROM_ADDRESS': os.environ.get('EMAIL_FROM_ADDRESS', 'wills@example.com'),
+        'EMAIL_FROM_NAME': os.environ.get('EMAIL_FROM_NAME', 'Will Generator'),
+        
+        # Page template bytecode cache (empty uses Jinja's per-user temp dir)
+        'JINJA_BYTECODE_CACHE_DIR': os.environ.get('JINJA_BYTECODE_CACHE_DIR', ''),
+    }
+
+
 def create_app(test_config=None):
     """Application factory pattern."""
     app = Flask(__name__, instance_relative_config=True)
     
     # Default configuration
+    app.config.from_mapping(_env_config())
     app.config.from_mapping(
-        SECRET_KEY=os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production'),
-        SQLALCHEMY_DATABASE_URI=os.environ.get('DATABASE_URL', 'sqlite:///will_generator.db'),
         SQLALCHEMY_TRACK_MODIFICATIONS=False,
-        ADMIN_USERNAME=os.environ.get('ADMIN_USERNAME', ''),
-        ADMIN_PASSWORD_HASH=os.environ.get('ADMIN_PASSWORD_HASH', ''),
+        ENABLE_ADMIN=True,
+        AUTO_CREATE_DB=False,
+        SQLITE_WAL=True,
         SESSION_TYPE='filesystem',
         PERMANENT_SESSION_LIFETIME=3600,  # 1 hour
         
@@ -39,19 +200,18 @@ def create_app(test_config=None):
         WTF_CSRF_SSL_STRICT=False,  # Disabled for development
         
         # Rate limiting settings
-        RATELIMIT_STORAGE_URI=os.environ.get('REDIS_URL', 'memory://'),
         RATELIMIT_STRATEGY='fixed-window',
         RATELIMIT_DEFAULT='100 per minute',
         RATELIMIT_HEADERS_ENABLED=True,
         
-        # Email settings
-        SMTP_HOST=os.environ.get('SMTP_HOST', ''),
-        SMTP_PORT=int(os.environ.get('SMTP_PORT', 587)),
-        SMTP_USERNAME=os.environ.get('SMTP_USERNAME', ''),
-        SMTP_PASSWORD=os.environ.get('SMTP_PASSWORD', ''),
-        SMTP_USE_TLS=os.environ.get('SMTP_USE_TLS', 'true').lower() == 'true',
-        EMAIL_FROM_ADDRESS=os.environ.get('EMAIL_FROM_ADDRESS', 'wills@example.com'),
-        EMAIL_FROM_NAME=os.environ.get('EMAIL_FROM_NAME', 'Will Generator'),
+        # Audit log settings
+        AUDIT_LOG_ASYNC=True,
+        AUDIT_LOG_BATCH_SIZE=100,
+        AUDIT_LOG_FLUSH_INTERVAL=1.0,  # seconds
+        AUDIT_VERIFY_WORKERS=1,  # verification processes; None uses the CPU count
+        
+        # Share compiled page templates between worker processes
+        JINJA_BYTECODE_CACHE=True,
     )
     
     if test_config is None:
@@ -61,31 +221,50 @@ def create_app(test_config=None):
         # Load test config
         app.config.from_mapping(test_config)
     
-    # Ensure instance folder exists
-    try:
-        os.makedirs(app.instance_path)
-    except OSError:
-        pass
+    # Must be set before app.jinja_env is first created (extensions such as
+    # CSRFProtect touch it during init_app)
+    if app.config.get('JINJA_BYTECODE_CACHE', True):
+        app.jinja_options = {
+            **app.jinja_options,
+            'bytecode_cache': FileSystemBytecodeCache(
+                app.config.get('JINJA_BYTECODE_CACHE_DIR') or None
+            ),
+        }
     
-    # Create PDFs directory
-    pdfs_dir = os.path.join(app.instance_path, 'pdfs')
-    try:
-        os.makedirs(pdfs_dir, exist_ok=True)
-    except OSError:
-        pass
+    # Ensure instance folder and PDFs directory exist
+    pdfs_dir = Path(app.instance_path) / 'pdfs'
+    if not pdfs_dir.is_dir():
+        pdfs_dir.mkdir(parents=True, exist_ok=True)
     
     # Initialize extensions with app
+    app.config.setdefault(
+        'SQLALCHEMY_ENGINE_OPTIONS',
+        engine_options_for(app.config['SQLALCHEMY_DATABASE_URI'])
+    )
+    binds = dict(app.config.get('SQLALCHEMY_BINDS') or {})
+    binds.setdefault('audit', app.config.get('AUDIT_DATABASE_URI') or
+                     audit_database_uri_for(app.config['SQLALCHEMY_DATABASE_URI']))
+    app.config['SQLALCHEMY_BINDS'] = binds
     db.init_app(app)
+    if app.config.get('SQLITE_WAL', True):
+        with app.app_context():
+            for engine in db.engines.values():
+                configure_sqlite_engine(engine)
     
     # Import and initialize security (after db init to avoid circular imports)
-    from app.security import csrf, limiter, add_security_headers, init_security
+    from app.security import add_security_headers, init_security
     init_security(app)
     
-    # Register blueprints
+    # Start batched audit log writer
+    from app.audit_logger import init_audit_queue
+    init_audit_queue(app)
+    
+    # Register blueprints (admin only when ENABLE_ADMIN is on)
     from app.routes import main_bp, api_bp, admin_bp
     app.register_blueprint(main_bp)
     app.register_blueprint(api_bp)
-    app.register_blueprint(admin_bp)
+    if app.config.get('ENABLE_ADMIN', True):
+        app.register_blueprint(admin_bp)
     
     # Add security headers to all responses
     @app.after_request
@@ -94,31 +273,23 @@ def create_app(test_config=None):
         return add_security_headers(response)
     
     # Request logging
-    @app.before_request
-    def before_request():
-        """Log request start."""
-        g.request_start_time = datetime.utcnow()
+    app.wsgi_app = TimingMiddleware(app.wsgi_app, app.logger)
     
-    @app.after_request
-    def log_request(response):
-        """Log request completion."""
-        if hasattr(g, 'request_start_time'):
-            duration = (datetime.utcnow() - g.request_start_time).total_seconds()
-            app.logger.info(
-                f'{request.method} {request.path} - {response.status_code} - {duration:.3f}s'
-            )
-        return response
+    # Create database tables (dev/test only; production runs `flask init-db`)
+    if app.config.get('AUTO_CREATE_DB', False):
+        with app.app_context():
+            init_db()
     
-    # Create database tables
-    with app.app_context():
-        db.create_all()
-        
-        # Create default data retention policy if none exists
-        from app.models import DataRetentionPolicy
-        if not DataRetentionPolicy.query.first():
-            default_policy = DataRetentionPolicy()
-            db.session.add(default_policy)
-            db.session.commit()
+    @app.cli.command('init-db')
+    def init_db_command():
+        """Create database tables and seed default data."""
+        try:
+            copied = init_db()
+        except RuntimeError as e:
+            raise click.ClickException(str(e))
+        if copied:
+            click.echo(f'Copied {copied} audit records into the audit database.')
+        click.echo('Initialized the database.')
     
     # Template globals
     @app.context_processor
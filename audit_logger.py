@@ -3,15 +3,33 @@ Audit logging module for immutable audit trail.
 
 All significant actions are logged with integrity verification.
 This module is append-only - records are never modified or deleted.
+
+Writes are batched through an in-process queue drained by a background
+thread, so request handlers do not pay a commit per audit record.
 """
 
-import json
+import atexit
+import functools
+import multiprocessing
+import os
+import queue
+import threading
+import weakref
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, Optional
-from flask import request, current_app
+from typing import Dict, Any, Optional, List
+
+import orjson
+from flask import request, current_app, g, has_request_context
+from sqlalchemy import func, insert, inspect, select, text
+from sqlalchemy.exc import IntegrityError
 
 from app import db
-from app.models import AuditLog
+from app.models import (
+    AuditLog, AuditLogSegment, DEFAULT_HASH_ALGO, HASH_ALGO_SHA256,
+    compute_audit_hash, compute_merkle_root
+)
 
 
 class AuditAction:
@@ -60,6 +78,230 @@ class AuditCategory:
     SYSTEM = 'system'
 
 
+# Canonical details encoding: sorted keys so equal details hash identically
+_DETAILS_JSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+
+def _serialize_details(details: Dict[str, Any]) -> str:
+    """Serialize audit details to canonical JSON text."""
+    return orjson.dumps(details, option=_DETAILS_JSON_OPTIONS).decode()
+
+
+# Columns written by batch INSERTs (id is assigned by the database)
+_INSERT_COLUMNS = tuple(
+    column.key for column in AuditLog.__table__.columns if column.key != 'id'
+)
+
+
+class AuditLogQueue:
+    """
+    Batches audit log writes off the request path.
+    
+    Records are queued by log_action and written by a daemon thread in a
+    single transaction per batch, using one Core executemany INSERT rather
+    than the ORM unit of work. A batch is written once batch_size
+    records are waiting, flush_interval seconds have passed since its
+    first record, or flush() is called, whichever comes first.
+    
+    The writer thread is started by the first put() in each process; a
+    forked child (e.g. under gunicorn --preload) starts with an empty
+    queue and its own writer. close() writes anything still queued and
+    stops the writer, and is run at interpreter exit.
+    """
+    
+    def __init__(self, app, maxsize: int = 10000, batch_size: int = 100,
+                 flush_interval: float = 1.0):
+        self.app = app
+        self.maxsize = maxsize
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.closed = False
+        self._exit_hook_registered = False
+        self._reset()
+        _QUEUES.add(self)
+    
+    def _reset(self) -> None:
+        """Create the per-process queue, locks and wake event."""
+        self._queue = queue.Queue(maxsize=self.maxsize)
+        self._wake = threading.Event()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+    
+    @property
+    def running(self) -> bool:
+        """Whether this process's writer thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self) -> None:
+        """Start the background writer thread if it is not running."""
+        with self._start_lock:
+            if self.running or self.closed:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name='audit-log-writer', daemon=True
+            )
+            self._thread.start()
+            if not self._exit_hook_registered:
+                atexit.register(self.close)
+                self._exit_hook_registered = True
+    
+    def put(self, audit_log: AuditLog) -> None:
+        """Queue a record for writing, blocking if the queue is full."""
+        if self.closed:
+            self._write([audit_log])
+            return
+        if not self.running:
+            self.start()
+        
+        try:
+            self._queue.put_nowait(audit_log)
+        except queue.Full:
+            # Backpressure: wait for the writer rather than dropping records
+            self._queue.put(audit_log)
+        
+        if self._queue.qsize() >= self.batch_size:
+            self._wake.set()
+    
+    def flush(self) -> None:
+        """Block until every record queued so far has been written."""
+        if self.running:
+            # Cut the writer's wait short, then wait for it to catch up,
+            # including any batch it has already taken off the queue
+            self._wake.set()
+            self._queue.join()
+            return
+        
+        while True:
+            batch = self._drain(self.batch_size)
+            if not batch:
+                break
+            try:
+                self._write(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+    
+    def close(self) -> None:
+        """Write any queued records and stop the writer thread."""
+        if self.closed:
+            return
+        # Records put from now on are written synchronously
+        self.closed = True
+        if self.running:
+            self._queue.put(_STOP_WRITER)
+            self._wake.set()
+            self._thread.join()
+        self.flush()
+        
+        if self._exit_hook_registered:
+            atexit.unregister(self.close)
+            self._exit_hook_registered = False
+    
+    def _drain(self, limit: int) -> List[AuditLog]:
+        """Take up to limit records from the queue without blocking."""
+        batch = []
+        while len(batch) < limit:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+    
+    def _run(self) -> None:
+        """Writer loop: collect a batch, then write it in one transaction."""
+        while True:
+            first = self._queue.get()
+            if self._queue.qsize() + 1 < self.batch_size:
+                self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            
+            batch = [first] + self._drain(self.batch_size - 1)
+            records = [item for item in batch if item is not _STOP_WRITER]
+            try:
+                if records:
+                    self._write(records)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if len(records) < len(batch):
+                return
+    
+    def _write(self, batch: List[AuditLog]) -> None:
+        """
+        Persist a batch of records with a single INSERT and commit.
+        
+        Integrity hashes are computed by log_action before queueing, so
+        rows need no follow-up UPDATE.
+        """
+        with self._write_lock, self.app.app_context():
+            try:
+                rows = [{key: getattr(log, key) for key in _INSERT_COLUMNS} for log in batch]
+                db.session.execute(insert(AuditLog.__table__), rows)
+                db.session.commit()
+                seal_audit_segments()
+            except Exception as e:
+                db.session.rollback()
+                self.app.logger.error(f'Failed to write {len(batch)} audit log records: {str(e)}')
+
+
+# Queued by close() to stop the writer thread
+_STOP_WRITER = object()
+
+# Every AuditLogQueue, so forked children can reset them
+_QUEUES = weakref.WeakSet()
+
+
+def _reset_queues_after_fork() -> None:
+    """Drop state inherited from the parent: its writer does not exist here."""
+    for audit_queue in list(_QUEUES):
+        audit_queue._reset()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_queues_after_fork)
+
+
+def init_audit_queue(app) -> Optional[AuditLogQueue]:
+    """
+    Attach a batching audit log queue to the app.
+    
+    The writer thread starts with the first queued record. Disabled when
+    AUDIT_LOG_ASYNC is false, in which case log_action writes each record
+    synchronously.
+    """
+    if not app.config.get('AUDIT_LOG_ASYNC', True):
+        return None
+    
+    audit_queue = AuditLogQueue(
+        app,
+        batch_size=app.config.get('AUDIT_LOG_BATCH_SIZE', 100),
+        flush_interval=app.config.get('AUDIT_LOG_FLUSH_INTERVAL', 1.0)
+    )
+    app.extensions['audit_log_queue'] = audit_queue
+    return audit_queue
+
+
+def flush_audit_queue() -> None:
+    """Write any queued audit records for the current app immediately."""
+    audit_queue = current_app.extensions.get('audit_log_queue')
+    if audit_queue is not None:
+        audit_queue.flush()
+
+
+def _request_client() -> tuple:
+    """
+    Get (remote address, User-Agent) for the current request.
+    
+    Cached on flask.g so the several audit events logged by one request
+    share a single header lookup.
+    """
+    client = g.get('audit_client')
+    if client is None:
+        client = g.audit_client = (request.remote_addr, request.headers.get('User-Agent'))
+    return client
+
+
 def log_action(
     action: str,
     action_category: str,
@@ -70,65 +312,82 @@ def log_action(
     actor_id: Optional[str] = None,
     details: Optional[Dict[str, Any]] = None,
     success: bool = True,
-    error_message: Optional[str] = None
+    error_message: Optional[str] = None,
+    ip_address: Optional[str] = None,
+    user_agent: Optional[str] = None,
+    synchronous: bool = False
 ) -> AuditLog:
     """
     Log an action to the audit trail.
     
+    The record is queued for a batched background write unless
+    synchronous is set or no audit queue is running for the app.
+    
     Args:
         action: The action performed (use AuditAction constants)
         action_category: Category of action (use AuditCategory constants)
         resource_type: Type of resource affected
-        resource_id: Identifier of the resource
+        resource_id: Identifier of the resource (defaults to submission_id)
         submission_id: Associated submission ID if applicable
         actor_type: Type of actor ('user', 'admin', 'system')
         actor_id: Identifier of the actor (IP, username, etc.)
         details: Additional structured details
         success: Whether the action succeeded
         error_message: Error message if action failed
+        ip_address: Client IP (defaults to the current request's)
+        user_agent: Client User-Agent (defaults to the current request's)
+        synchronous: Commit the record before returning
     
     Returns:
         The created AuditLog record
     """
     try:
         # Get request context if available
-        ip_address = None
-        user_agent = None
+        if has_request_context():
+            request_ip, request_user_agent = _request_client()
+            if ip_address is None:
+                ip_address = request_ip
+            if user_agent is None:
+                user_agent = request_user_agent
+            
+            # Infer actor from request if not provided
+            if actor_type == 'user' and not actor_id:
+                actor_id = ip_address
         
-        try:
-            if request:
-                ip_address = request.remote_addr
-                user_agent = request.headers.get('User-Agent')
-                
-                # Infer actor from request if not provided
-                if actor_type == 'user' and not actor_id:
-                    actor_id = ip_address
-        except RuntimeError:
-            # Outside request context
-            pass
+        # Resource defaults to the submission; only stringify non-str IDs
+        if not resource_id:
+            resource_id = submission_id
+        if resource_id is not None and not isinstance(resource_id, str):
+            resource_id = str(resource_id)
         
-        # Create audit log
+        # Create audit log, timestamped now rather than at batch write time
         audit_log = AuditLog(
+            timestamp=datetime.utcnow(),
             action=action,
             action_category=action_category,
             resource_type=resource_type,
-            resource_id=str(resource_id) if resource_id else None,
+            resource_id=resource_id,
             submission_id=submission_id,
             actor_type=actor_type,
             actor_id=actor_id,
-            details_json=json.dumps(details, sort_keys=True) if details else None,
+            details_json=_serialize_details(details) if details else None,
             success=success,
             error_message=error_message,
             ip_address=ip_address,
-            user_agent=user_agent
+            user_agent=user_agent,
+            hash_algo=DEFAULT_HASH_ALGO
         )
         
         # Compute integrity hash
         audit_log.integrity_hash = audit_log.compute_integrity_hash()
         
         # Save to database
-        db.session.add(audit_log)
-        db.session.commit()
+        audit_queue = current_app.extensions.get('audit_log_queue')
+        if audit_queue is not None and not synchronous:
+            audit_queue.put(audit_log)
+        else:
+            db.session.add(audit_log)
+            db.session.commit()
         
         return audit_log
     
@@ -139,18 +398,124 @@ def log_action(
         return None
 
 
-def log_submission_created(submission_id: int, ip_address: str, user_agent: str) -> AuditLog:
-    """Log submission creation."""
-    return log_action(
-        action=AuditAction.SUBMISSION_CREATED,
-        action_category=AuditCategory.CREATE,
-        resource_type='submission',
-        resource_id=str(submission_id),
-        submission_id=submission_id,
-        actor_type='user',
-        actor_id=ip_address,
-        details={'user_agent': user_agent}
-    )
+def upgrade_audit_schema() -> bool:
+    """
+    Add audit_logs columns introduced after the table was first created.
+    
+    db.create_all() never alters existing tables, so audit_logs tables
+    created before hash_algo existed get it here, backfilled as SHA-256.
+    
+    Returns:
+        Whether the table was altered
+    """
+    engine = db.engines['audit']
+    columns = {column['name'] for column in inspect(engine).get_columns(AuditLog.__tablename__)}
+    if 'hash_algo' in columns:
+        return False
+    
+    with engine.begin() as connection:
+        connection.execute(text(
+            f"ALTER TABLE {AuditLog.__tablename__} "
+            f"ADD COLUMN hash_algo VARCHAR(16) NOT NULL DEFAULT '{HASH_ALGO_SHA256}'"
+        ))
+    return True
+
+
+def _copy_legacy_table(source, target, table, check_column: str) -> int:
+    """
+    Copy rows of table from the source engine to the target, keeping ids.
+    
+    Rows whose id is already in the target with the same check_column
+    value are skipped. The copy runs in one target transaction, so a
+    conflict leaves the target unchanged.
+    
+    Raises:
+        RuntimeError: If a source id is used by a different target row
+    
+    Returns:
+        Number of rows copied
+    """
+    source_columns = {column['name'] for column in inspect(source).get_columns(table.name)}
+    columns = [column for column in table.columns if column.name in source_columns]
+    
+    # Rows from before hash_algo existed are SHA-256 (see models)
+    backfill = {}
+    if table is AuditLog.__table__ and 'hash_algo' not in source_columns:
+        backfill['hash_algo'] = HASH_ALGO_SHA256
+    
+    copied = 0
+    with source.connect() as source_connection, target.begin() as target_connection:
+        existing = dict(target_connection.execute(
+            select(table.c.id, table.c[check_column])
+        ).all())
+        
+        result = source_connection.execution_options(yield_per=VERIFY_BATCH_SIZE).execute(
+            select(*columns).order_by(table.c.id)
+        )
+        for partition in result.mappings().partitions():
+            rows = []
+            for row in partition:
+                if row['id'] in existing:
+                    if existing[row['id']] != row[check_column]:
+                        raise RuntimeError(
+                            f'{table.name} id {row["id"]} exists in both databases '
+                            f'with different content; copy the legacy rows by hand'
+                        )
+                    continue
+                rows.append({**row, **backfill})
+            if rows:
+                target_connection.execute(insert(table), rows)
+                copied += len(rows)
+        
+        if copied and target.dialect.name == 'postgresql':
+            # Explicit ids do not advance the serial sequence
+            target_connection.execute(text(
+                f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+                f"(SELECT max(id) FROM {table.name}))"
+            ))
+    
+    return copied
+
+
+def import_legacy_audit_log() -> int:
+    """
+    Copy audit records left in the main database into the 'audit' bind.
+    
+    Before the audit bind existed, audit_logs (and audit_log_segments)
+    lived in the main database. Records are copied with their ids and
+    integrity hashes unchanged, and rows already copied are skipped, so
+    this is safe to re-run. The legacy tables are left in place.
+    
+    Returns:
+        Number of audit records copied
+    """
+    source = db.engines[None]
+    target = db.engines['audit']
+    if source.url == target.url and source.url.database not in (None, '', ':memory:'):
+        # Audit bind is the main database: nothing to move
+        return 0
+    
+    source_tables = set(inspect(source).get_table_names())
+    if AuditLog.__tablename__ not in source_tables:
+        return 0
+    
+    copied = _copy_legacy_table(source, target, AuditLog.__table__, 'integrity_hash')
+    if AuditLogSegment.__tablename__ in source_tables:
+        _copy_legacy_table(source, target, AuditLogSegment.__table__, 'merkle_root')
+    return copied
+
+
+# Helpers whose arguments pass straight through to log_action are
+# specialized with functools.partial. Callers supply submission_id,
+# actor_id and, optionally, details/ip_address/user_agent.
+log_submission_created = functools.partial(
+    log_action,
+    action=AuditAction.SUBMISSION_CREATED,
+    action_category=AuditCategory.CREATE,
+    resource_type='submission',
+    actor_type='user'
+)
+log_submission_created.__doc__ = """Log submission creation."""
 
 
 def log_validation_result(submission_id: int, passed: bool, errors: list = None) -> AuditLog:
@@ -159,7 +524,6 @@ def log_validation_result(submission_id: int, passed: bool, errors: list = None)
         action=AuditAction.VALIDATION_PASSED if passed else AuditAction.VALIDATION_FAILED,
         action_category=AuditCategory.SYSTEM,
         resource_type='submission',
-        resource_id=str(submission_id),
         submission_id=submission_id,
         actor_type='system',
         details={'error_count': len(errors) if errors else 0, 'errors': errors} if errors else None,
@@ -186,7 +550,6 @@ def log_submission_locked(submission_id: int, reason: str = 'generation_complete
         action=AuditAction.SUBMISSION_LOCKED,
         action_category=AuditCategory.UPDATE,
         resource_type='submission',
-        resource_id=str(submission_id),
         submission_id=submission_id,
         actor_type='system',
         details={'lock_reason': reason}
@@ -209,7 +572,7 @@ def log_email_sent(submission_id: int, recipient: str, success: bool, error: str
 
 
 def log_admin_login(username: str, success: bool, ip_address: str, error: str = None) -> AuditLog:
-    """Log admin login attempt."""
+    """Log admin login attempt. Failed attempts are written synchronously."""
     return log_action(
         action=AuditAction.ADMIN_LOGIN if success else AuditAction.ADMIN_LOGIN_FAILED,
         action_category=AuditCategory.AUTH,
@@ -218,7 +581,8 @@ def log_admin_login(username: str, success: bool, ip_address: str, error: str =
         actor_type='admin',
         actor_id=username,
         success=success,
-        error_message=error
+        error_message=error,
+        synchronous=not success
     )
 
 
@@ -234,17 +598,14 @@ def log_admin_logout(username: str) -> AuditLog:
     )
 
 
-def log_admin_submission_viewed(submission_id: int, admin_username: str) -> AuditLog:
-    """Log admin viewing a submission."""
-    return log_action(
-        action=AuditAction.ADMIN_SUBMISSION_VIEWED,
-        action_category=AuditCategory.READ,
-        resource_type='submission',
-        resource_id=str(submission_id),
-        submission_id=submission_id,
-        actor_type='admin',
-        actor_id=admin_username
-    )
+log_admin_submission_viewed = functools.partial(
+    log_action,
+    action=AuditAction.ADMIN_SUBMISSION_VIEWED,
+    action_category=AuditCategory.READ,
+    resource_type='submission',
+    actor_type='admin'
+)
+log_admin_submission_viewed.__doc__ = """Log admin viewing a submission."""
 
 
 def log_admin_submission_downloaded(submission_id: int, admin_username: str, document_type: str) -> AuditLog:
@@ -253,7 +614,6 @@ def log_admin_submission_downloaded(submission_id: int, admin_username: str, doc
         action=AuditAction.ADMIN_SUBMISSION_DOWNLOADED,
         action_category=AuditCategory.READ,
         resource_type=document_type,
-        resource_id=str(submission_id),
         submission_id=submission_id,
         actor_type='admin',
         actor_id=admin_username,
@@ -276,39 +636,246 @@ def log_retention_policy_executed(deleted_count: int, errors: list = None) -> Au
     )
 
 
-def verify_audit_integrity() -> tuple:
+# Columns needed to recompute a record's integrity hash, in
+# compute_audit_hash argument order
+_HASHED_COLUMNS = (
+    AuditLog.timestamp, AuditLog.actor_type, AuditLog.actor_id, AuditLog.action,
+    AuditLog.resource_type, AuditLog.resource_id, AuditLog.details_json,
+    AuditLog.hash_algo,
+)
+
+# Rows fetched per round trip when streaming the audit table
+VERIFY_BATCH_SIZE = 1000
+
+
+def _verify_rows(rows: List[tuple]) -> tuple:
+    """
+    Verify a batch of (id, integrity_hash, *hashed columns) rows.
+    
+    Module-level so it can run in a worker process.
+    
+    Returns:
+        Tuple of (valid_count, invalid_ids)
+    """
+    invalid_ids = [row[0] for row in rows if row[1] != compute_audit_hash(*row[2:])]
+    return len(rows) - len(invalid_ids), invalid_ids
+
+
+def verify_audit_integrity(max_workers: Optional[int] = None, incremental: bool = False) -> tuple:
     """
     Verify integrity of all audit log records.
     
+    Rows are streamed in batches of VERIFY_BATCH_SIZE and only the hashed
+    columns are selected, so memory use does not grow with the table.
+    When the table spans more than one batch, batches are hashed across a
+    process pool while the next ones are read.
+    
+    With incremental set, defers to verify_audit_segments.
+    
+    Args:
+        max_workers: Worker processes to use (defaults to the
+            AUDIT_VERIFY_WORKERS config value; None there means the CPU
+            count). 1 verifies in-process, which is usually fastest
+            unless hashing outweighs reading and pickling rows.
+        incremental: Trust sealed segments whose Merkle root matches and
+            only re-hash record content for the unsealed tail
+    
+    Returns:
+        Tuple of (valid_count, invalid_count, invalid_ids)
+    """
+    if incremental:
+        return verify_audit_segments()
+    
+    flush_audit_queue()
+    
+    if max_workers is None:
+        max_workers = current_app.config.get('AUDIT_VERIFY_WORKERS', 1) or os.cpu_count() or 1
+    
+    stmt = (
+        select(AuditLog.id, AuditLog.integrity_hash, *_HASHED_COLUMNS)
+        .order_by(AuditLog.id)
+        .execution_options(yield_per=VERIFY_BATCH_SIZE)
+    )
+    batches = (
+        [tuple(row) for row in partition]
+        for partition in db.session.execute(stmt).partitions()
+    )
+    
+    valid_count = 0
+    invalid_ids = []
+    
+    def collect(result):
+        nonlocal valid_count
+        valid_count += result[0]
+        invalid_ids.extend(result[1])
+    
+    first_batch = next(batches, [])
+    if max_workers <= 1 or len(first_batch) < VERIFY_BATCH_SIZE:
+        # Single batch (or parallelism disabled): not worth a process pool
+        collect(_verify_rows(first_batch))
+        for batch in batches:
+            collect(_verify_rows(batch))
+    else:
+        # Spawned workers avoid forking the audit writer thread and DB handles
+        mp_context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as executor:
+            pending = deque([executor.submit(_verify_rows, first_batch)])
+            for batch in batches:
+                pending.append(executor.submit(_verify_rows, batch))
+                # Bound in-flight batches so memory stays flat
+                if len(pending) >= max_workers * 2:
+                    collect(pending.popleft().result())
+            while pending:
+                collect(pending.popleft().result())
+    
+    return valid_count, len(invalid_ids), invalid_ids
+
+
+# Audit records per sealed segment
+SEGMENT_SIZE = 1000
+
+
+def _last_sealed_id() -> int:
+    """Get the last AuditLog id covered by a sealed segment (0 if none)."""
+    return db.session.query(func.max(AuditLogSegment.last_id)).scalar() or 0
+
+
+def seal_audit_segments() -> int:
+    """
+    Seal every complete run of SEGMENT_SIZE unsealed audit records.
+    
+    Called by the audit writer after each batch. Concurrent sealers are
+    resolved by the unique first_id constraint.
+    
+    Returns:
+        Number of segments sealed
+    """
+    sealed = 0
+    try:
+        while True:
+            rows = db.session.execute(
+                select(AuditLog.id, AuditLog.integrity_hash)
+                .where(AuditLog.id > _last_sealed_id())
+                .order_by(AuditLog.id)
+                .limit(SEGMENT_SIZE)
+            ).all()
+            if len(rows) < SEGMENT_SIZE:
+                return sealed
+            
+            db.session.add(AuditLogSegment(
+                first_id=rows[0].id,
+                last_id=rows[-1].id,
+                row_count=len(rows),
+                merkle_root=compute_merkle_root(row.integrity_hash for row in rows)
+            ))
+            db.session.commit()
+            sealed += 1
+    except IntegrityError:
+        # Another writer sealed the same segment first
+        db.session.rollback()
+        return sealed
+
+
+def verify_audit_segments() -> tuple:
+    """
+    Verify the audit trail segment by segment.
+    
+    Each sealed segment's Merkle root is recomputed from the stored
+    integrity hashes, and only segments whose root no longer matches,
+    plus the unsealed tail, have their record content re-hashed. This
+    skips content hashing for untouched history; a sealed record edited
+    without updating its integrity hash is only caught by a full
+    verify_audit_integrity().
+    
+    If every record in a mismatched segment still hashes correctly on its
+    own (rewritten with a recomputed hash, or a neighbour deleted), the
+    whole segment is reported invalid.
+    
     Returns:
         Tuple of (valid_count, invalid_count, invalid_ids)
     """
-    logs = AuditLog.query.all()
+    flush_audit_queue()
+    seal_audit_segments()
+    
     valid_count = 0
-    invalid_count = 0
     invalid_ids = []
     
-    for log in logs:
-        if log.verify_integrity():
-            valid_count += 1
-        else:
-            invalid_count += 1
-            invalid_ids.append(log.id)
+    segments = db.session.execute(
+        select(AuditLogSegment.first_id, AuditLogSegment.last_id,
+               AuditLogSegment.row_count, AuditLogSegment.merkle_root)
+        .order_by(AuditLogSegment.first_id)
+    ).all()
     
-    return valid_count, invalid_count, invalid_ids
+    def hashed_rows(*criteria):
+        return [tuple(row) for row in db.session.execute(
+            select(AuditLog.id, AuditLog.integrity_hash, *_HASHED_COLUMNS)
+            .where(*criteria)
+            .order_by(AuditLog.id)
+        )]
+    
+    for first_id, last_id, row_count, merkle_root in segments:
+        in_segment = AuditLog.id.between(first_id, last_id)
+        hashes = db.session.execute(
+            select(AuditLog.integrity_hash).where(in_segment).order_by(AuditLog.id)
+        ).scalars().all()
+        
+        if len(hashes) == row_count and compute_merkle_root(hashes) == merkle_root:
+            valid_count += row_count
+            continue
+        
+        rows = hashed_rows(in_segment)
+        _, bad_ids = _verify_rows(rows)
+        invalid_ids.extend(bad_ids or [row[0] for row in rows])
+    
+    tail_start = segments[-1].last_id if segments else 0
+    tail_valid, tail_invalid = _verify_rows(hashed_rows(AuditLog.id > tail_start))
+    valid_count += tail_valid
+    invalid_ids.extend(tail_invalid)
+    
+    return valid_count, len(invalid_ids), invalid_ids
 
 
-def get_audit_trail_for_submission(submission_id: int) -> list:
+# Columns returned by get_audit_trail_for_submission (see AuditLog.to_dict)
+_TRAIL_COLUMNS = (
+    AuditLog.id, AuditLog.timestamp, AuditLog.actor_type, AuditLog.actor_id,
+    AuditLog.action, AuditLog.action_category, AuditLog.resource_type,
+    AuditLog.resource_id, AuditLog.submission_id, AuditLog.details_json,
+    AuditLog.success, AuditLog.error_message,
+)
+
+
+def get_audit_trail_for_submission(submission_id: int, limit: int = 500, offset: int = 0) -> list:
     """
-    Get complete audit trail for a submission.
+    Get the audit trail for a submission, oldest first.
+    
+    Records are ordered by timestamp, then id, so records that share a
+    timestamp (one queued batch) page stably. Only one page is returned:
+    with the default limit, a trail longer than 500 records is truncated,
+    so page with offset (or pass a larger limit) to read it all.
     
     Args:
         submission_id: The submission ID
+        limit: Maximum number of records to return
+        offset: Number of records to skip
     
     Returns:
         List of audit log dictionaries
     """
-    logs = AuditLog.query.filter_by(submission_id=submission_id) \
-                         .order_by(AuditLog.timestamp.asc()) \
-                         .all()
-    return [log.to_dict() for log in logs]
+    flush_audit_queue()
+    rows = db.session.execute(
+        select(*_TRAIL_COLUMNS)
+        .where(AuditLog.submission_id == submission_id)
+        .order_by(AuditLog.timestamp.asc(), AuditLog.id.asc())
+        .limit(limit)
+        .offset(offset)
+    ).mappings()
+    
+    # Same shape as AuditLog.to_dict(), built without hydrating ORM objects
+    trail = []
+    for row in rows:
+        entry = dict(row)
+        entry['timestamp'] = entry['timestamp'].isoformat()
+        details_json = entry.pop('details_json')
+        entry['details'] = orjson.loads(details_json) if details_json else None
+        trail.append(entry)
+    return trail
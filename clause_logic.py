@@ -37,15 +37,23 @@ Conflict Prevention:
 - Contradictory clauses are prevented by flag logic
 """
 
-from typing import List, Set, Dict, Any
-from dataclasses import dataclass
+from functools import lru_cache, reduce
+from operator import or_
+from typing import List, Set, Dict, Any, Iterable, Sequence, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 
 from app.context_builder import WillContext
 
 
 class ClauseId(str, Enum):
-    """Stable clause identifiers."""
+    """
+    Stable clause identifiers.
+    
+    Members are str subclasses so they serialize as their value in the
+    document plan and compare equal to plain strings. Hot paths use the
+    integer positions in _CLAUSE_RANK and the flag masks instead.
+    """
     TITLE_IDENTIFICATION = 'title_identification'
     REVOCATION = 'revocation'
     DEFINITIONS = 'definitions'
@@ -67,8 +75,11 @@ class ClauseId(str, Enum):
     ATTESTATION = 'attestation'
 
 
+# Backward compatibility constants (CLAUSE_TITLE_IDENTIFICATION, CLAUSE_REVOCATION, ...)
+globals().update({f'CLAUSE_{name}': member for name, member in ClauseId.__members__.items()})
+
 # Fixed clause order - this never changes
-CLAUSE_ORDER: List[ClauseId] = [
+CLAUSE_ORDER: Tuple[ClauseId, ...] = (
     ClauseId.TITLE_IDENTIFICATION,
     ClauseId.REVOCATION,
     ClauseId.DEFINITIONS,
@@ -88,167 +99,268 @@ CLAUSE_ORDER: List[ClauseId] = [
     ClauseId.EXCLUSION_NOTE,
     ClauseId.LIFE_SUSTAINING_STATEMENT,
     ClauseId.ATTESTATION,
-]
-
-# Backward compatibility constants
-CLAUSE_TITLE_IDENTIFICATION = ClauseId.TITLE_IDENTIFICATION
-CLAUSE_REVOCATION = ClauseId.REVOCATION
-CLAUSE_DEFINITIONS = ClauseId.DEFINITIONS
-CLAUSE_APPOINTMENT_EXECUTORS_TRUSTEES = ClauseId.APPOINTMENT_EXECUTORS_TRUSTEES
-CLAUSE_FUNERAL_WISHES = ClauseId.FUNERAL_WISHES
-CLAUSE_GUARDIANSHIP = ClauseId.GUARDIANSHIP
-CLAUSE_DISTRIBUTION_OVERVIEW = ClauseId.DISTRIBUTION_OVERVIEW
-CLAUSE_SPECIFIC_GIFTS = ClauseId.SPECIFIC_GIFTS
-CLAUSE_RESIDUE_DISTRIBUTION = ClauseId.RESIDUE_DISTRIBUTION
-CLAUSE_SURVIVORSHIP = ClauseId.SURVIVORSHIP
-CLAUSE_SUBSTITUTION = ClauseId.SUBSTITUTION
-CLAUSE_MINOR_TRUSTS = ClauseId.MINOR_TRUSTS
-CLAUSE_ADMINISTRATIVE_POWERS = ClauseId.ADMINISTRATIVE_POWERS
-CLAUSE_DIGITAL_ASSETS = ClauseId.DIGITAL_ASSETS
-CLAUSE_PETS = ClauseId.PETS
-CLAUSE_BUSINESS_INTERESTS = ClauseId.BUSINESS_INTERESTS
-CLAUSE_EXCLUSION_NOTE = ClauseId.EXCLUSION_NOTE
-CLAUSE_LIFE_SUSTAINING_STATEMENT = ClauseId.LIFE_SUSTAINING_STATEMENT
-CLAUSE_ATTESTATION = ClauseId.ATTESTATION
-
-
-@dataclass
+)
+
+# Position of each clause in CLAUSE_ORDER
+_CLAUSE_RANK: Dict[ClauseId, int] = {clause_id: i for i, clause_id in enumerate(CLAUSE_ORDER)}
+
+
+# Context flags in bit order - bit i of a context mask is FLAG_NAMES[i]
+FLAG_NAMES: Tuple[str, ...] = (
+    'has_partner',
+    'has_children',
+    'has_minor_children',
+    'has_guardianship',
+    'has_specific_gifts',
+    'has_residue_scheme',
+    'has_percentages',
+    'has_exclusions',
+    'has_digital_assets',
+    'has_pets',
+    'has_business_interests',
+    'has_funeral_wishes',
+    'has_life_sustaining_statement',
+    'has_minor_trusts',
+    'has_substitution',
+    'has_alternate_beneficiary',
+)
+
+FLAG_BITS: Dict[str, int] = {name: bit for bit, name in enumerate(FLAG_NAMES)}
+
+
+def flags_to_mask(flag_names: Iterable[str]) -> int:
+    """Pack flag names into a bitmask using FLAG_BITS."""
+    return reduce(or_, (1 << FLAG_BITS[name] for name in flag_names), 0)
+
+
+@dataclass(frozen=True, slots=True)
 class ClauseDependency:
     """Defines dependencies and conflicts for a clause."""
     clause_id: ClauseId
-    required_flags: List[str]  # All must be True
-    conflicting_clauses: List[ClauseId] = None
+    required_flags: Tuple[str, ...] = ()  # All must be True
+    conflicting_clauses: Tuple[ClauseId, ...] = ()
     notes: str = ''
+    required_mask: int = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'required_mask', flags_to_mask(self.required_flags))
 
 
 # Clause dependency definitions
 CLAUSE_DEPENDENCIES: Dict[ClauseId, ClauseDependency] = {
     ClauseId.TITLE_IDENTIFICATION: ClauseDependency(
         clause_id=ClauseId.TITLE_IDENTIFICATION,
-        required_flags=[],
+        required_flags=(),
         notes='Always included'
     ),
     ClauseId.REVOCATION: ClauseDependency(
         clause_id=ClauseId.REVOCATION,
-        required_flags=[],
+        required_flags=(),
         notes='Always included'
     ),
     ClauseId.DEFINITIONS: ClauseDependency(
         clause_id=ClauseId.DEFINITIONS,
-        required_flags=[],
+        required_flags=(),
         notes='Always included'
     ),
     ClauseId.APPOINTMENT_EXECUTORS_TRUSTEES: ClauseDependency(
         clause_id=ClauseId.APPOINTMENT_EXECUTORS_TRUSTEES,
-        required_flags=[],
+        required_flags=(),
         notes='Always included - every will needs executors'
     ),
     ClauseId.FUNERAL_WISHES: ClauseDependency(
         clause_id=ClauseId.FUNERAL_WISHES,
-        required_flags=['has_funeral_wishes'],
+        required_flags=('has_funeral_wishes',),
         notes='Only if funeral wishes toggle is enabled'
     ),
     ClauseId.GUARDIANSHIP: ClauseDependency(
         clause_id=ClauseId.GUARDIANSHIP,
-        required_flags=['has_guardianship'],
+        required_flags=('has_guardianship',),
         notes='Only if minor children exist and guardian is appointed'
     ),
     ClauseId.DISTRIBUTION_OVERVIEW: ClauseDependency(
         clause_id=ClauseId.DISTRIBUTION_OVERVIEW,
-        required_flags=[],
+        required_flags=(),
         notes='Included for complex distribution schemes'
     ),
     ClauseId.SPECIFIC_GIFTS: ClauseDependency(
         clause_id=ClauseId.SPECIFIC_GIFTS,
-        required_flags=['has_specific_gifts'],
+        required_flags=('has_specific_gifts',),
         notes='Only if specific gifts exist'
     ),
     ClauseId.RESIDUE_DISTRIBUTION: ClauseDependency(
         clause_id=ClauseId.RESIDUE_DISTRIBUTION,
-        required_flags=[],
+        required_flags=(),
         notes='Always included - every will has residue'
     ),
     ClauseId.SURVIVORSHIP: ClauseDependency(
         clause_id=ClauseId.SURVIVORSHIP,
-        required_flags=[],
+        required_flags=(),
         notes='Always included'
     ),
     ClauseId.SUBSTITUTION: ClauseDependency(
         clause_id=ClauseId.SUBSTITUTION,
-        required_flags=['has_substitution'],
+        required_flags=('has_substitution',),
         notes='Only if substitution rule is configured'
     ),
     ClauseId.MINOR_TRUSTS: ClauseDependency(
         clause_id=ClauseId.MINOR_TRUSTS,
-        required_flags=['has_minor_trusts'],
+        required_flags=('has_minor_trusts',),
         notes='Only if minor trusts are enabled and applicable'
     ),
     ClauseId.ADMINISTRATIVE_POWERS: ClauseDependency(
         clause_id=ClauseId.ADMINISTRATIVE_POWERS,
-        required_flags=[],
+        required_flags=(),
         notes='Always included'
     ),
     ClauseId.DIGITAL_ASSETS: ClauseDependency(
         clause_id=ClauseId.DIGITAL_ASSETS,
-        required_flags=['has_digital_assets'],
+        required_flags=('has_digital_assets',),
         notes='Only if digital assets toggle is enabled'
     ),
     ClauseId.PETS: ClauseDependency(
         clause_id=ClauseId.PETS,
-        required_flags=['has_pets'],
+        required_flags=('has_pets',),
         notes='Only if pets toggle is enabled'
     ),
     ClauseId.BUSINESS_INTERESTS: ClauseDependency(
         clause_id=ClauseId.BUSINESS_INTERESTS,
-        required_flags=['has_business_interests'],
+        required_flags=('has_business_interests',),
         notes='Only if business interests toggle is enabled'
     ),
     ClauseId.EXCLUSION_NOTE: ClauseDependency(
         clause_id=ClauseId.EXCLUSION_NOTE,
-        required_flags=['has_exclusions'],
+        required_flags=('has_exclusions',),
         notes='Only if exclusion toggle is enabled'
     ),
     ClauseId.LIFE_SUSTAINING_STATEMENT: ClauseDependency(
         clause_id=ClauseId.LIFE_SUSTAINING_STATEMENT,
-        required_flags=['has_life_sustaining_statement'],
+        required_flags=('has_life_sustaining_statement',),
         notes='Only if life sustaining toggle is enabled'
     ),
     ClauseId.ATTESTATION: ClauseDependency(
         clause_id=ClauseId.ATTESTATION,
-        required_flags=[],
+        required_flags=(),
         notes='Always included - must be last'
     ),
 }
 
 
+# Display titles
+_CLAUSE_TITLES: Dict[ClauseId, str] = {
+    ClauseId.TITLE_IDENTIFICATION: 'Title and Identification',
+    ClauseId.REVOCATION: 'Revocation of Previous Wills',
+    ClauseId.DEFINITIONS: 'Definitions and Interpretation',
+    ClauseId.APPOINTMENT_EXECUTORS_TRUSTEES: 'Appointment of Executors and Trustees',
+    ClauseId.FUNERAL_WISHES: 'Funeral Wishes',
+    ClauseId.GUARDIANSHIP: 'Appointment of Guardian',
+    ClauseId.DISTRIBUTION_OVERVIEW: 'Distribution Plan Overview',
+    ClauseId.SPECIFIC_GIFTS: 'Specific Gifts',
+    ClauseId.RESIDUE_DISTRIBUTION: 'Distribution of Residue',
+    ClauseId.SURVIVORSHIP: 'Survivorship Period',
+    ClauseId.SUBSTITUTION: 'Substitution of Beneficiaries',
+    ClauseId.MINOR_TRUSTS: 'Trusts for Minor Beneficiaries',
+    ClauseId.ADMINISTRATIVE_POWERS: 'Powers of Executors and Trustees',
+    ClauseId.DIGITAL_ASSETS: 'Digital Assets',
+    ClauseId.PETS: 'Provision for Pets',
+    ClauseId.BUSINESS_INTERESTS: 'Business Interests',
+    ClauseId.EXCLUSION_NOTE: 'Exclusion Note',
+    ClauseId.LIFE_SUSTAINING_STATEMENT: 'Life Sustaining Treatment Statement',
+    ClauseId.ATTESTATION: 'Attestation and Execution',
+}
+
+# Brief descriptions
+_CLAUSE_DESCRIPTIONS: Dict[ClauseId, str] = {
+    ClauseId.TITLE_IDENTIFICATION: 'Identifies the will maker and declares this document as their last will.',
+    ClauseId.REVOCATION: 'Revokes all previous wills and codicils.',
+    ClauseId.DEFINITIONS: 'Defines key terms used throughout the will.',
+    ClauseId.APPOINTMENT_EXECUTORS_TRUSTEES: 'Appoints executors and trustees to administer the estate.',
+    ClauseId.FUNERAL_WISHES: 'Expresses preferences for funeral arrangements.',
+    ClauseId.GUARDIANSHIP: 'Appoints a guardian for minor children.',
+    ClauseId.DISTRIBUTION_OVERVIEW: 'Provides an overview of the distribution plan.',
+    ClauseId.SPECIFIC_GIFTS: 'Details specific gifts of cash or property.',
+    ClauseId.RESIDUE_DISTRIBUTION: 'Directs how the residue of the estate should be distributed.',
+    ClauseId.SURVIVORSHIP: 'Specifies the period a beneficiary must survive the will maker.',
+    ClauseId.SUBSTITUTION: 'Provides for substitution if a beneficiary predeceases.',
+    ClauseId.MINOR_TRUSTS: 'Establishes trusts for beneficiaries who are minors.',
+    ClauseId.ADMINISTRATIVE_POWERS: 'Grants powers to executors and trustees.',
+    ClauseId.DIGITAL_ASSETS: 'Provides for management of digital assets.',
+    ClauseId.PETS: 'Makes provision for the care of pets.',
+    ClauseId.BUSINESS_INTERESTS: 'Directs the disposition of business interests.',
+    ClauseId.EXCLUSION_NOTE: 'Notes exclusions and reasons for exclusion.',
+    ClauseId.LIFE_SUSTAINING_STATEMENT: 'Expresses wishes regarding life sustaining treatment.',
+    ClauseId.ATTESTATION: 'Execution and witnessing provisions.',
+}
+
+# Required-flag mask for each clause - _REQ_MASKS[i] belongs to CLAUSE_ORDER[i]
+_REQ_MASKS: Tuple[int, ...] = tuple(
+    CLAUSE_DEPENDENCIES[clause_id].required_mask for clause_id in CLAUSE_ORDER
+)
+
+
+def _validate_clause_tables() -> None:
+    """
+    Check the static clause tables agree with each other.
+    
+    Runs once at import so the selection hot path never has to
+    re-verify ordering or coverage.
+    
+    Raises:
+        RuntimeError: If the tables are inconsistent
+    """
+    clause_ids = set(ClauseId)
+    if len(_CLAUSE_RANK) != len(CLAUSE_ORDER) or set(CLAUSE_ORDER) != clause_ids:
+        raise RuntimeError('CLAUSE_ORDER must list every ClauseId exactly once')
+    if CLAUSE_ORDER[0] != ClauseId.TITLE_IDENTIFICATION or CLAUSE_ORDER[-1] != ClauseId.ATTESTATION:
+        raise RuntimeError('CLAUSE_ORDER must start with the title and end with attestation')
+    for name, table in (
+        ('CLAUSE_DEPENDENCIES', CLAUSE_DEPENDENCIES),
+        ('_CLAUSE_TITLES', _CLAUSE_TITLES),
+        ('_CLAUSE_DESCRIPTIONS', _CLAUSE_DESCRIPTIONS),
+    ):
+        if set(table) != clause_ids:
+            raise RuntimeError(f'{name} must have an entry for every ClauseId')
+    for clause_id, dependency in CLAUSE_DEPENDENCIES.items():
+        if dependency.clause_id != clause_id:
+            raise RuntimeError(f'CLAUSE_DEPENDENCIES entry for {clause_id.value} has the wrong clause_id')
+
+
+_validate_clause_tables()
+
+
+def context_mask(context: WillContext) -> int:
+    """
+    Pack the context flags into a single integer bitmask.
+    
+    Args:
+        context: The will context
+    
+    Returns:
+        Integer with bit FLAG_BITS[name] set for each true flag
+    """
+    mask = 0
+    for bit, name in enumerate(FLAG_NAMES):
+        if getattr(context, name):
+            mask |= 1 << bit
+    return mask
+
+
 def get_context_flags(context: WillContext) -> Dict[str, bool]:
     """
     Extract all boolean flags from context for dependency checking.
     
+    Selection and the clause summary work from context_mask() and never
+    call this. The result is deliberately not cached per context:
+    WillContext is a mutable, unhashable dataclass whose flags can change
+    after it is built.
+    
     Args:
         context: The will context
     
     Returns:
         Dictionary of flag names to boolean values
     """
-    return {
-        'has_partner': context.has_partner,
-        'has_children': context.has_children,
-        'has_minor_children': context.has_minor_children,
-        'has_guardianship': context.has_guardianship,
-        'has_specific_gifts': context.has_specific_gifts,
-        'has_residue_scheme': context.has_residue_scheme,
-        'has_percentages': context.has_percentages,
-        'has_exclusions': context.has_exclusions,
-        'has_digital_assets': context.has_digital_assets,
-        'has_pets': context.has_pets,
-        'has_business_interests': context.has_business_interests,
-        'has_funeral_wishes': context.has_funeral_wishes,
-        'has_life_sustaining_statement': context.has_life_sustaining_statement,
-        'has_minor_trusts': context.has_minor_trusts,
-        'has_substitution': context.has_substitution,
-        'has_alternate_beneficiary': context.has_alternate_beneficiary,
-    }
+    return {name: getattr(context, name) for name in FLAG_NAMES}
 
 
 def check_clause_dependencies(clause_id: ClauseId, context: WillContext) -> bool:
@@ -266,20 +378,15 @@ def check_clause_dependencies(clause_id: ClauseId, context: WillContext) -> bool
     if not dependency:
         return False
     
-    # Always-include clauses have no required flags
-    if not dependency.required_flags:
-        return True
-    
-    # Check all required flags
-    flags = get_context_flags(context)
+    # Read only the required flags - always-include clauses have none
     for flag_name in dependency.required_flags:
-        if not flags.get(flag_name, False):
+        if not getattr(context, flag_name, False):
             return False
     
     return True
 
 
-def select_clauses(context: WillContext) -> List[ClauseId]:
+def select_clauses(context: WillContext) -> Tuple[ClauseId, ...]:
     """
     Select which clauses should appear in the will based on context flags.
     
@@ -290,18 +397,33 @@ def select_clauses(context: WillContext) -> List[ClauseId]:
         context: The will context with all derived flags
     
     Returns:
-        Ordered list of clause IDs to include
+        Ordered tuple of clause IDs to include (shared and immutable)
     """
-    selected = []
+    return _select_clauses_by_mask(context_mask(context))
+
+
+def select_clauses_batch(contexts: Iterable[WillContext]) -> List[Tuple[ClauseId, ...]]:
+    """
+    Select clauses for many wills at once (previews, bulk export).
+    
+    Wills sharing the same flag combination share one selection pass.
     
-    for clause_id in CLAUSE_ORDER:
-        if check_clause_dependencies(clause_id, context):
-            selected.append(clause_id)
+    Args:
+        contexts: The will contexts
     
-    return selected
+    Returns:
+        One ordered tuple of clause IDs per context, in input order
+    """
+    return [_select_clauses_by_mask(context_mask(context)) for context in contexts]
+
 
+@lru_cache(maxsize=4096)
+def _select_clauses_by_mask(ctx_mask: int) -> Tuple[ClauseId, ...]:
+    """Select clauses for a packed context mask (see context_mask)."""
+    return tuple(clause_id for clause_id, req_mask in zip(CLAUSE_ORDER, _REQ_MASKS) if ctx_mask & req_mask == req_mask)
 
-def get_clause_number(clause_id: ClauseId, selected_clauses: List[ClauseId]) -> int:
+
+def get_clause_number(clause_id: ClauseId, selected_clauses: Sequence[ClauseId]) -> int:
     """
     Get the clause number (1-indexed) within the selected clauses.
     
@@ -312,10 +434,29 @@ def get_clause_number(clause_id: ClauseId, selected_clauses: List[ClauseId]) ->
     Returns:
         The clause number, or 0 if not found
     """
-    try:
-        return selected_clauses.index(clause_id) + 1
-    except ValueError:
-        return 0
+    return _clause_numbers_for(tuple(selected_clauses)).get(clause_id, 0)
+
+
+def build_clause_numbers(selected_clauses: Sequence[ClauseId]) -> Dict[ClauseId, int]:
+    """
+    Build a lookup of clause numbers (1-indexed) for the selected clauses.
+    
+    Prefer this over repeated get_clause_number calls when numbering
+    every clause in a will.
+    
+    Args:
+        selected_clauses: The list of selected clause IDs
+    
+    Returns:
+        Dictionary of clause ID to clause number
+    """
+    return {clause_id: i + 1 for i, clause_id in enumerate(selected_clauses)}
+
+
+@lru_cache(maxsize=256)
+def _clause_numbers_for(selected_clauses: Tuple[ClauseId, ...]) -> Dict[ClauseId, int]:
+    """Cached build_clause_numbers for get_clause_number."""
+    return build_clause_numbers(selected_clauses)
 
 
 def get_clause_title(clause_id: ClauseId) -> str:
@@ -328,29 +469,10 @@ def get_clause_title(clause_id: ClauseId) -> str:
     Returns:
         Human-readable clause title
     """
-    titles = {
-        ClauseId.TITLE_IDENTIFICATION: 'Title and Identification',
-        ClauseId.REVOCATION: 'Revocation of Previous Wills',
-        ClauseId.DEFINITIONS: 'Definitions and Interpretation',
-        ClauseId.APPOINTMENT_EXECUTORS_TRUSTEES: 'Appointment of Executors and Trustees',
-        ClauseId.FUNERAL_WISHES: 'Funeral Wishes',
-        ClauseId.GUARDIANSHIP: 'Appointment of Guardian',
-        ClauseId.DISTRIBUTION_OVERVIEW: 'Distribution Plan Overview',
-        ClauseId.SPECIFIC_GIFTS: 'Specific Gifts',
-        ClauseId.RESIDUE_DISTRIBUTION: 'Distribution of Residue',
-        ClauseId.SURVIVORSHIP: 'Survivorship Period',
-        ClauseId.SUBSTITUTION: 'Substitution of Beneficiaries',
-        ClauseId.MINOR_TRUSTS: 'Trusts for Minor Beneficiaries',
-        ClauseId.ADMINISTRATIVE_POWERS: 'Powers of Executors and Trustees',
-        ClauseId.DIGITAL_ASSETS: 'Digital Assets',
-        ClauseId.PETS: 'Provision for Pets',
-        ClauseId.BUSINESS_INTERESTS: 'Business Interests',
-        ClauseId.EXCLUSION_NOTE: 'Exclusion Note',
-        ClauseId.LIFE_SUSTAINING_STATEMENT: 'Life Sustaining Treatment Statement',
-        ClauseId.ATTESTATION: 'Attestation and Execution',
-    }
-    
-    return titles.get(clause_id, clause_id.value.replace('_', ' ').title())
+    title = _CLAUSE_TITLES.get(clause_id)
+    if title is None:
+        title = clause_id.value.replace('_', ' ').title()
+    return title
 
 
 def get_clause_description(clause_id: ClauseId) -> str:
@@ -363,29 +485,7 @@ def get_clause_description(clause_id: ClauseId) -> str:
     Returns:
         Brief description of the clause
     """
-    descriptions = {
-        ClauseId.TITLE_IDENTIFICATION: 'Identifies the will maker and declares this document as their last will.',
-        ClauseId.REVOCATION: 'Revokes all previous wills and codicils.',
-        ClauseId.DEFINITIONS: 'Defines key terms used throughout the will.',
-        ClauseId.APPOINTMENT_EXECUTORS_TRUSTEES: 'Appoints executors and trustees to administer the estate.',
-        ClauseId.FUNERAL_WISHES: 'Expresses preferences for funeral arrangements.',
-        ClauseId.GUARDIANSHIP: 'Appoints a guardian for minor children.',
-        ClauseId.DISTRIBUTION_OVERVIEW: 'Provides an overview of the distribution plan.',
-        ClauseId.SPECIFIC_GIFTS: 'Details specific gifts of cash or property.',
-        ClauseId.RESIDUE_DISTRIBUTION: 'Directs how the residue of the estate should be distributed.',
-        ClauseId.SURVIVORSHIP: 'Specifies the period a beneficiary must survive the will maker.',
-        ClauseId.SUBSTITUTION: 'Provides for substitution if a beneficiary predeceases.',
-        ClauseId.MINOR_TRUSTS: 'Establishes trusts for beneficiaries who are minors.',
-        ClauseId.ADMINISTRATIVE_POWERS: 'Grants powers to executors and trustees.',
-        ClauseId.DIGITAL_ASSETS: 'Provides for management of digital assets.',
-        ClauseId.PETS: 'Makes provision for the care of pets.',
-        ClauseId.BUSINESS_INTERESTS: 'Directs the disposition of business interests.',
-        ClauseId.EXCLUSION_NOTE: 'Notes exclusions and reasons for exclusion.',
-        ClauseId.LIFE_SUSTAINING_STATEMENT: 'Expresses wishes regarding life sustaining treatment.',
-        ClauseId.ATTESTATION: 'Execution and witnessing provisions.',
-    }
-    
-    return descriptions.get(clause_id, '')
+    return _CLAUSE_DESCRIPTIONS.get(clause_id, '')
 
 
 def get_clause_dependencies_info(clause_id: ClauseId) -> Dict[str, Any]:
@@ -404,12 +504,12 @@ def get_clause_dependencies_info(clause_id: ClauseId) -> Dict[str, Any]:
     
     return {
         'clause_id': clause_id.value,
-        'required_flags': dependency.required_flags,
+        'required_flags': list(dependency.required_flags),
         'notes': dependency.notes,
     }
 
 
-def validate_clause_order(clauses: List[ClauseId]) -> bool:
+def validate_clause_order(clauses: Sequence[ClauseId]) -> bool:
     """
     Validate that clause order follows the defined order.
     
@@ -420,20 +520,18 @@ def validate_clause_order(clauses: List[ClauseId]) -> bool:
         True if order is valid
     """
     # Check that clauses appear in the same relative order as CLAUSE_ORDER
+    # Unknown clauses rank -1 and so always fail the check
     last_index = -1
     for clause in clauses:
-        try:
-            current_index = CLAUSE_ORDER.index(clause)
-            if current_index <= last_index:
-                return False
-            last_index = current_index
-        except ValueError:
-            return False  # Unknown clause
+        current_index = _CLAUSE_RANK.get(clause, -1)
+        if current_index <= last_index:
+            return False
+        last_index = current_index
     
     return True
 
 
-def check_for_conflicts(selected_clauses: List[ClauseId]) -> List[str]:
+def check_for_conflicts(selected_clauses: Sequence[ClauseId]) -> List[str]:
     """
     Check for conflicting clauses in the selection.
     
@@ -445,12 +543,13 @@ def check_for_conflicts(selected_clauses: List[ClauseId]) -> List[str]:
     """
     conflicts = []
     
-    # Check for duplicates
-    seen = set()
-    for clause in selected_clauses:
-        if clause in seen:
-            conflicts.append(f'Duplicate clause: {clause.value}')
-        seen.add(clause)
+    # Check for duplicates - only walk the list when the set size says there are any
+    if len(set(selected_clauses)) != len(selected_clauses):
+        seen = set()
+        for clause in selected_clauses:
+            if clause in seen:
+                conflicts.append(f'Duplicate clause: {clause.value}')
+            seen.add(clause)
     
     # Check attestation is last
     if selected_clauses and selected_clauses[-1] != ClauseId.ATTESTATION:
@@ -467,27 +566,42 @@ def get_clauses_summary(context: WillContext) -> Dict[str, Any]:
     """
     Get a summary of clause selection for the current context.
     
+    The summary depends only on the context flags, so its parts are cached
+    per flag mask as tuples; each call gets a freshly built dictionary.
+    
     Args:
         context: The will context
     
     Returns:
         Dictionary with clause selection summary
     """
-    selected = select_clauses(context)
-    flags = get_context_flags(context)
+    clause_values, flag_values, conflicts, details = _summary_parts_by_mask(context_mask(context))
     
     return {
-        'total_clauses': len(selected),
-        'selected_clauses': [c.value for c in selected],
-        'flags': flags,
-        'conflicts': check_for_conflicts(selected),
+        'total_clauses': len(clause_values),
+        'selected_clauses': list(clause_values),
+        'flags': dict(zip(FLAG_NAMES, flag_values)),
+        'conflicts': list(conflicts),
         'clauses_detail': [
             {
-                'id': c.value,
+                'id': clause_value,
                 'number': i + 1,
-                'title': get_clause_title(c),
-                'description': get_clause_description(c),
+                'title': title,
+                'description': description,
             }
-            for i, c in enumerate(selected)
+            for i, (clause_value, title, description) in enumerate(details)
         ]
     }
+
+
+@lru_cache(maxsize=4096)
+def _summary_parts_by_mask(ctx_mask: int) -> Tuple[Tuple[str, ...], Tuple[bool, ...], Tuple[str, ...], Tuple[Tuple[str, str, str], ...]]:
+    """Build the immutable clause summary parts for a packed context mask."""
+    selected = _select_clauses_by_mask(ctx_mask)
+    
+    return (
+        tuple(c.value for c in selected),
+        tuple(bool(ctx_mask >> bit & 1) for bit in range(len(FLAG_NAMES))),
+        tuple(check_for_conflicts(selected)),
+        tuple((c.value, _CLAUSE_TITLES[c], _CLAUSE_DESCRIPTIONS[c]) for c in selected),
+    )
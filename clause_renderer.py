@@ -2,12 +2,14 @@
 Clause Renderer Module
 
 Renders clause blocks into a unified document plan.
-Uses Jinja2 macros from modular_will_template.j2 to produce content blocks.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Any, Optional, Sequence, Tuple
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from jinja2 import Environment, PackageLoader, select_autoescape
+from functools import lru_cache
+from types import MappingProxyType
 
 from app.context_builder import WillContext
 from app.clause_logic import (
@@ -22,16 +24,37 @@ from app.clause_logic import (
 )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ContentBlock:
-    """A block of content within a clause."""
+    """
+    A block of content within a clause.
+    
+    Blocks for fixed wording are built once at import and shared by every
+    document plan, so blocks are frozen and mapping content (definitions,
+    signature blocks) is a read-only MappingProxyType.
+    """
     type: str  # 'paragraph', 'bullet_list', 'numbered_list', 'table', 'signature_block', 'page_break'
     content: Any
     style: str = 'normal'
     indent_level: int = 0
+    
+    def __reduce__(self):
+        # mappingproxy cannot be pickled (render_document_plans workers),
+        # so ship a plain dict and re-wrap it on load
+        content = self.content
+        if type(content) is MappingProxyType:
+            content = dict(content)
+        return (_restore_content_block, (self.type, content, self.style, self.indent_level))
 
 
-@dataclass
+def _restore_content_block(block_type: str, content: Any, style: str, indent_level: int) -> ContentBlock:
+    """Rebuild a pickled ContentBlock with its mapping content read-only again."""
+    if type(content) is dict:
+        content = MappingProxyType(content)
+    return ContentBlock(block_type, content, style, indent_level)
+
+
+@dataclass(slots=True)
 class DocumentPlanItem:
     """A clause in the document plan."""
     id: str
@@ -41,13 +64,16 @@ class DocumentPlanItem:
     clause_number: int = 0
 
 
-# Initialize Jinja environment
-jinja_env = Environment(
-    loader=PackageLoader('app', 'templates'),
-    autoescape=select_autoescape(['html', 'xml']),
-    trim_blocks=True,
-    lstrip_blocks=True
-)
+# Renderer for each clause type, filled in by @_clause_renderer
+_CLAUSE_RENDERERS: Dict[str, Callable[[WillContext], List[ContentBlock]]] = {}
+
+
+def _clause_renderer(clause_id: str):
+    """Register the decorated function as the renderer for clause_id."""
+    def register(func: Callable[[WillContext], List[ContentBlock]]):
+        _CLAUSE_RENDERERS[clause_id] = func
+        return func
+    return register
 
 
 def render_document_plan(context: WillContext) -> List[DocumentPlanItem]:
@@ -74,6 +100,30 @@ def render_document_plan(context: WillContext) -> List[DocumentPlanItem]:
     return document_plan
 
 
+def render_document_plans(contexts: Sequence[WillContext], max_workers: int = 1) -> List[List[DocumentPlanItem]]:
+    """
+    Render document plans for a batch of wills (bulk export, previews).
+    
+    Rendering is pure-Python CPU work, so parallelism is across processes,
+    one will per task; threads would only contend for the GIL. With a
+    single worker, or a single context, plans are rendered in-process.
+    
+    Args:
+        contexts: The will contexts
+        max_workers: Worker processes to use
+    
+    Returns:
+        One document plan per context, in input order
+    """
+    if max_workers <= 1 or len(contexts) <= 1:
+        return [render_document_plan(context) for context in contexts]
+    
+    mp_context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as executor:
+        chunksize = max(1, len(contexts) // (max_workers * 4))
+        return list(executor.map(render_document_plan, contexts, chunksize=chunksize))
+
+
 def _render_clause(clause_id: str, context: WillContext, clause_number: int) -> Optional[DocumentPlanItem]:
     """
     Render a single clause into a document plan item.
@@ -89,29 +139,7 @@ def _render_clause(clause_id: str, context: WillContext, clause_number: int) ->
     title = get_clause_title(clause_id)
     
     # Route to specific renderer based on clause type
-    renderers = {
-        CLAUSE_TITLE_IDENTIFICATION: _render_title_identification,
-        CLAUSE_REVOCATION: _render_revocation,
-        CLAUSE_DEFINITIONS: _render_definitions,
-        CLAUSE_APPOINTMENT_EXECUTORS_TRUSTEES: _render_appointment_executors,
-        CLAUSE_FUNERAL_WISHES: _render_funeral_wishes,
-        CLAUSE_GUARDIANSHIP: _render_guardianship,
-        CLAUSE_DISTRIBUTION_OVERVIEW: _render_distribution_overview,
-        CLAUSE_SPECIFIC_GIFTS: _render_specific_gifts,
-        CLAUSE_RESIDUE_DISTRIBUTION: _render_residue_distribution,
-        CLAUSE_SURVIVORSHIP: _render_survivorship,
-        CLAUSE_SUBSTITUTION: _render_substitution,
-        CLAUSE_MINOR_TRUSTS: _render_minor_trusts,
-        CLAUSE_ADMINISTRATIVE_POWERS: _render_administrative_powers,
-        CLAUSE_DIGITAL_ASSETS: _render_digital_assets,
-        CLAUSE_PETS: _render_pets,
-        CLAUSE_BUSINESS_INTERESTS: _render_business_interests,
-        CLAUSE_EXCLUSION_NOTE: _render_exclusion_note,
-        CLAUSE_LIFE_SUSTAINING_STATEMENT: _render_life_sustaining,
-        CLAUSE_ATTESTATION: _render_attestation,
-    }
-    
-    renderer = renderers.get(clause_id)
+    renderer = _CLAUSE_RENDERERS.get(clause_id)
     if not renderer:
         return None
     
@@ -126,6 +154,7 @@ def _render_clause(clause_id: str, context: WillContext, clause_number: int) ->
     )
 
 
+@_clause_renderer(CLAUSE_TITLE_IDENTIFICATION)
 def _render_title_identification(context: WillContext) -> List[ContentBlock]:
     """Render title and identification clause."""
     blocks = []
@@ -153,50 +182,68 @@ def _render_title_identification(context: WillContext) -> List[ContentBlock]:
     return blocks
 
 
+_REVOCATION_BLOCKS = (
+    ContentBlock(
+        type='paragraph',
+        content='I revoke all wills and codicils previously made by me.',
+        style='normal'
+    ),
+)
+
+
+@_clause_renderer(CLAUSE_REVOCATION)
 def _render_revocation(context: WillContext) -> List[ContentBlock]:
     """Render revocation clause."""
-    blocks = []
-    
-    blocks.append(ContentBlock(
+    return list(_REVOCATION_BLOCKS)
+
+
+def _definition_block(term: str, definition: str) -> ContentBlock:
+    """Build a definition bullet item."""
+    return ContentBlock(
+        type='bullet_item',
+        content=MappingProxyType({'term': term, 'definition': definition}),
+        style='definition',
+        indent_level=1
+    )
+
+
+# Everything except the survivorship definition, which depends on the context
+_DEFINITIONS_BLOCKS = (
+    ContentBlock(
         type='paragraph',
-        content='I revoke all wills and codicils previously made by me.',
+        content='In this Will, unless the context otherwise requires:',
         style='normal'
-    ))
-    
-    return blocks
+    ),
+    _definition_block('"Beneficiary"', 'means a person or entity entitled to receive a gift under this Will.'),
+    _definition_block('"Child"', 'includes a biological child, adopted child, and stepchild.'),
+    _definition_block('"Estate"', 'means all property and assets which I own at my death.'),
+    _definition_block('"Executor"', 'means the person or persons appointed to administer my Estate.'),
+    _definition_block('"Minor"', 'means a person under the age of 18 years.'),
+    _definition_block('"Residue"', 'means what remains of my Estate after payment of debts, funeral and testamentary expenses, and all specific gifts.'),
+)
 
 
+@_clause_renderer(CLAUSE_DEFINITIONS)
 def _render_definitions(context: WillContext) -> List[ContentBlock]:
     """Render definitions clause."""
-    blocks = []
+    blocks = list(_DEFINITIONS_BLOCKS)
     
-    blocks.append(ContentBlock(
-        type='paragraph',
-        content='In this Will, unless the context otherwise requires:',
-        style='normal'
+    blocks.append(_definition_block(
+        '"Survivorship Period"',
+        f'means the period of {context.survivorship_days} days from my death.'
     ))
     
-    definitions = [
-        ('"Beneficiary"', 'means a person or entity entitled to receive a gift under this Will.'),
-        ('"Child"', 'includes a biological child, adopted child, and stepchild.'),
-        ('"Estate"', 'means all property and assets which I own at my death.'),
-        ('"Executor"', 'means the person or persons appointed to administer my Estate.'),
-        ('"Minor"', 'means a person under the age of 18 years.'),
-        ('"Residue"', 'means what remains of my Estate after payment of debts, funeral and testamentary expenses, and all specific gifts.'),
-        ('"Survivorship Period"', f'means the period of {context.survivorship_days} days from my death.'),
-    ]
-    
-    for term, definition in definitions:
-        blocks.append(ContentBlock(
-            type='bullet_item',
-            content={'term': term, 'definition': definition},
-            style='definition',
-            indent_level=1
-        ))
-    
     return blocks
 
 
+def _oxford_join(names: List[str]) -> str:
+    """Join names as 'A', 'A and B' or 'A, B, and C'."""
+    if len(names) <= 2:
+        return ' and '.join(names)
+    return ''.join((', '.join(names[:-1]), ', and ', names[-1]))
+
+
+@_clause_renderer(CLAUSE_APPOINTMENT_EXECUTORS_TRUSTEES)
 def _render_appointment_executors(context: WillContext) -> List[ContentBlock]:
     """Render appointment of executors and trustees clause."""
     blocks = []
@@ -210,12 +257,7 @@ def _render_appointment_executors(context: WillContext) -> List[ContentBlock]:
                 f'to be the Executor and Trustee of my Estate.'
             )
         else:
-            executor_names = [e.full_name for e in context.executors]
-            if len(executor_names) == 2:
-                names_text = f'{executor_names[0]} and {executor_names[1]}'
-            else:
-                names_text = ', '.join(executor_names[:-1]) + f', and {executor_names[-1]}'
-            
+            names_text = _oxford_join([e.full_name for e in context.executors])
             text = f'I appoint {names_text} to be the Executors and Trustees of my Estate.'
         
         blocks.append(ContentBlock(
@@ -228,18 +270,14 @@ def _render_appointment_executors(context: WillContext) -> List[ContentBlock]:
     if context.backup_executors:
         if len(context.backup_executors) == 1:
             backup = context.backup_executors[0]
+            backup_name = backup.full_name
             text = (
-                f'If {backup.full_name} is unable or unwilling to act, '
-                f'I appoint {backup.full_name}, of {backup.address.to_single_line()}, '
+                f'If {backup_name} is unable or unwilling to act, '
+                f'I appoint {backup_name}, of {backup.address.to_single_line()}, '
                 f'to be the substitute Executor and Trustee.'
             )
         else:
-            backup_names = [e.full_name for e in context.backup_executors]
-            if len(backup_names) == 2:
-                names_text = f'{backup_names[0]} and {backup_names[1]}'
-            else:
-                names_text = ', '.join(backup_names[:-1]) + f', and {backup_names[-1]}'
-            
+            names_text = _oxford_join([e.full_name for e in context.backup_executors])
             text = (
                 f'If any of my appointed Executors is unable or unwilling to act, '
                 f'I appoint {names_text} to be the substitute Executors and Trustees.'
@@ -254,40 +292,44 @@ def _render_appointment_executors(context: WillContext) -> List[ContentBlock]:
     return blocks
 
 
+_FUNERAL_PREFERENCE_TEXT = {
+    'burial': 'burial',
+    'cremation': 'cremation',
+    'no_preference': 'no preference as to burial or cremation'
+}
+
+
+@_clause_renderer(CLAUSE_FUNERAL_WISHES)
 def _render_funeral_wishes(context: WillContext) -> List[ContentBlock]:
     """Render funeral wishes clause."""
     blocks = []
     
-    preference_text = {
-        'burial': 'burial',
-        'cremation': 'cremation',
-        'no_preference': 'no preference as to burial or cremation'
-    }
+    preference = _FUNERAL_PREFERENCE_TEXT.get(context.funeral_preference, 'no preference')
     
-    preference = preference_text.get(context.funeral_preference, 'no preference')
-    
-    text = f'I express the wish that my body be disposed of by {preference}.'
+    parts = ['I express the wish that my body be disposed of by ', preference, '.']
     
     if context.funeral_notes:
-        text += f' {context.funeral_notes}'
+        parts.extend((' ', context.funeral_notes))
     
     blocks.append(ContentBlock(
         type='paragraph',
-        content=text,
+        content=''.join(parts),
         style='normal'
     ))
     
     return blocks
 
 
+@_clause_renderer(CLAUSE_GUARDIANSHIP)
 def _render_guardianship(context: WillContext) -> List[ContentBlock]:
     """Render guardianship clause."""
     blocks = []
     
     if context.guardian:
+        guardian_name = context.guardian.full_name
         text = (
             f'If at my death any of my children are minors, '
-            f'I appoint {context.guardian.full_name}, of {context.guardian.address.to_single_line()}, '
+            f'I appoint {guardian_name}, of {context.guardian.address.to_single_line()}, '
             f'to be the guardian of such minor children.'
         )
         
@@ -297,11 +339,12 @@ def _render_guardianship(context: WillContext) -> List[ContentBlock]:
             style='normal'
         ))
         
-        if context.backup_guardian:
+        backup_guardian = context.backup_guardian
+        if backup_guardian:
             backup_text = (
-                f'If {context.guardian.full_name} is unable or unwilling to act as guardian, '
-                f'I appoint {context.backup_guardian.full_name}, of '
-                f'{context.backup_guardian.address.to_single_line()}, to be the substitute guardian.'
+                f'If {guardian_name} is unable or unwilling to act as guardian, '
+                f'I appoint {backup_guardian.full_name}, of '
+                f'{backup_guardian.address.to_single_line()}, to be the substitute guardian.'
             )
             
             blocks.append(ContentBlock(
@@ -313,26 +356,28 @@ def _render_guardianship(context: WillContext) -> List[ContentBlock]:
     return blocks
 
 
+_SCHEME_DESCRIPTIONS = {
+    'partner_then_children_equal': 
+        'My Estate shall be distributed first to my partner, and if my partner does not survive me, '
+        'equally among my children.',
+    'children_equal': 
+        'My Estate shall be distributed equally among my children.',
+    'percentages_named': 
+        'My Estate shall be distributed among the named beneficiaries in the percentages specified.',
+    'specific_gifts_then_residue': 
+        'I make specific gifts as detailed below, and the residue of my Estate shall be distributed '
+        'as specified.',
+    'custom_structured': 
+        'My Estate shall be distributed according to the following structured plan.',
+}
+
+
+@_clause_renderer(CLAUSE_DISTRIBUTION_OVERVIEW)
 def _render_distribution_overview(context: WillContext) -> List[ContentBlock]:
     """Render distribution overview clause."""
     blocks = []
     
-    scheme_descriptions = {
-        'partner_then_children_equal': 
-            'My Estate shall be distributed first to my partner, and if my partner does not survive me, '
-            'equally among my children.',
-        'children_equal': 
-            'My Estate shall be distributed equally among my children.',
-        'percentages_named': 
-            'My Estate shall be distributed among the named beneficiaries in the percentages specified.',
-        'specific_gifts_then_residue': 
-            'I make specific gifts as detailed below, and the residue of my Estate shall be distributed '
-            'as specified.',
-        'custom_structured': 
-            'My Estate shall be distributed according to the following structured plan.',
-    }
-    
-    description = scheme_descriptions.get(
+    description = _SCHEME_DESCRIPTIONS.get(
         context.distribution_scheme, 
         'My Estate shall be distributed as specified in this Will.'
     )
@@ -346,6 +391,7 @@ def _render_distribution_overview(context: WillContext) -> List[ContentBlock]:
     return blocks
 
 
+@_clause_renderer(CLAUSE_SPECIFIC_GIFTS)
 def _render_specific_gifts(context: WillContext) -> List[ContentBlock]:
     """Render specific gifts clause."""
     blocks = []
@@ -357,6 +403,8 @@ def _render_specific_gifts(context: WillContext) -> List[ContentBlock]:
             style='normal'
         ))
         
+        # Plain f-strings: their format specs are compiled with the function,
+        # and pre-bound str.format helpers measured slower for these lines
         for i, gift in enumerate(context.specific_gifts, 1):
             if gift.gift_type == 'cash':
                 gift_text = (
@@ -378,6 +426,7 @@ def _render_specific_gifts(context: WillContext) -> List[ContentBlock]:
     return blocks
 
 
+@_clause_renderer(CLAUSE_RESIDUE_DISTRIBUTION)
 def _render_residue_distribution(context: WillContext) -> List[ContentBlock]:
     """Render residue distribution clause."""
     blocks = []
@@ -401,8 +450,9 @@ def _render_residue_distribution(context: WillContext) -> List[ContentBlock]:
                 style='normal'
             ))
             
+            equal_share = 100 / len(context.residue_beneficiaries)
             for i, beneficiary in enumerate(context.residue_beneficiaries, 1):
-                share = beneficiary.share_percent or (100 / len(context.residue_beneficiaries))
+                share = beneficiary.share_percent or equal_share
                 item_text = (
                     f'{i}. {share}% to {beneficiary.beneficiary_name}'
                 )
@@ -427,21 +477,29 @@ def _render_residue_distribution(context: WillContext) -> List[ContentBlock]:
     return blocks
 
 
+_SURVIVORSHIP_PERIOD_TEXT = {
+    0: 'immediately upon my death',
+    7: '7 days',
+    14: '14 days',
+    30: '30 days',
+    60: '60 days'
+}
+
+
+@_clause_renderer(CLAUSE_SURVIVORSHIP)
 def _render_survivorship(context: WillContext) -> List[ContentBlock]:
     """Render survivorship clause."""
+    return list(_survivorship_blocks(context.survivorship_days))
+
+
+@lru_cache(maxsize=32)
+def _survivorship_blocks(survivorship_days: int) -> Tuple[ContentBlock, ...]:
+    """Build the survivorship clause blocks, cached per survivorship period."""
     blocks = []
     
-    days_text = {
-        0: 'immediately upon my death',
-        7: '7 days',
-        14: '14 days',
-        30: '30 days',
-        60: '60 days'
-    }
+    period = _SURVIVORSHIP_PERIOD_TEXT.get(survivorship_days, f'{survivorship_days} days')
     
-    period = days_text.get(context.survivorship_days, f'{context.survivorship_days} days')
-    
-    if context.survivorship_days == 0:
+    if survivorship_days == 0:
         text = (
             'A beneficiary under this Will must survive me to take a gift. '
             'No survivorship period applies.'
@@ -460,29 +518,35 @@ def _render_survivorship(context: WillContext) -> List[ContentBlock]:
         style='normal'
     ))
     
-    return blocks
+    return tuple(blocks)
+
 
+# Fixed wording per substitution rule ('to_alternate_beneficiary' names the alternate)
+_SUBSTITUTION_RULE_TEXT = {
+    'to_their_children': 
+        'If a beneficiary predeceases me, their share shall pass to their children '
+        'who survive me, in equal shares.',
+    'redistribute_among_remaining': 
+        'If a beneficiary predeceases me, their share shall be redistributed '
+        'among the remaining beneficiaries in proportion to their respective shares.',
+}
 
+
+@_clause_renderer(CLAUSE_SUBSTITUTION)
 def _render_substitution(context: WillContext) -> List[ContentBlock]:
     """Render substitution clause."""
     blocks = []
     
-    rule_texts = {
-        'to_their_children': 
-            'If a beneficiary predeceases me, their share shall pass to their children '
-            'who survive me, in equal shares.',
-        'redistribute_among_remaining': 
-            'If a beneficiary predeceases me, their share shall be redistributed '
-            'among the remaining beneficiaries in proportion to their respective shares.',
-        'to_alternate_beneficiary': 
+    if context.substitution_rule == 'to_alternate_beneficiary':
+        text = (
             f'If a beneficiary predeceases me, their share shall pass to '
-            f'{context.alternate_beneficiary_name}.',
-    }
-    
-    text = rule_texts.get(
-        context.substitution_rule,
-        'If a beneficiary predeceases me, their share shall lapse.'
-    )
+            f'{context.alternate_beneficiary_name}.'
+        )
+    else:
+        text = _SUBSTITUTION_RULE_TEXT.get(
+            context.substitution_rule,
+            'If a beneficiary predeceases me, their share shall lapse.'
+        )
     
     blocks.append(ContentBlock(
         type='paragraph',
@@ -493,6 +557,18 @@ def _render_substitution(context: WillContext) -> List[ContentBlock]:
     return blocks
 
 
+_MINOR_TRUST_POWERS_BLOCK = ContentBlock(
+    type='paragraph',
+    content=(
+        'The trustees may apply the income and capital of the trust '
+        'for the maintenance, education, advancement, or benefit of '
+        'the beneficiary in their absolute discretion.'
+    ),
+    style='normal'
+)
+
+
+@_clause_renderer(CLAUSE_MINOR_TRUSTS)
 def _render_minor_trusts(context: WillContext) -> List[ContentBlock]:
     """Render minor trusts clause."""
     blocks = []
@@ -528,114 +604,121 @@ def _render_minor_trusts(context: WillContext) -> List[ContentBlock]:
     ))
     
     # Trust powers
-    blocks.append(ContentBlock(
-        type='paragraph',
-        content=(
-            'The trustees may apply the income and capital of the trust '
-            'for the maintenance, education, advancement, or benefit of '
-            'the beneficiary in their absolute discretion.'
-        ),
-        style='normal'
-    ))
+    blocks.append(_MINOR_TRUST_POWERS_BLOCK)
     
     return blocks
 
 
-def _render_administrative_powers(context: WillContext) -> List[ContentBlock]:
-    """Render administrative powers clause."""
-    blocks = []
-    
-    blocks.append(ContentBlock(
+_ADMINISTRATIVE_POWERS = (
+    'To sell, convert, call in, and dispose of any part of my Estate as they think fit.',
+    'To pay or compromise any debt or claim against my Estate.',
+    'To employ professional advisers and agents as they consider necessary.',
+    'To invest trust funds in any investments authorized by law for trust investments.',
+    'To apply income for the maintenance of beneficiaries during the administration of my Estate.',
+    'To delegate powers and duties as permitted by law.',
+)
+
+_ADMINISTRATIVE_POWERS_BLOCKS = (
+    ContentBlock(
         type='paragraph',
         content='My Executors and Trustees shall have the following powers:',
         style='normal'
-    ))
-    
-    powers = [
-        'To sell, convert, call in, and dispose of any part of my Estate as they think fit.',
-        'To pay or compromise any debt or claim against my Estate.',
-        'To employ professional advisers and agents as they consider necessary.',
-        'To invest trust funds in any investments authorized by law for trust investments.',
-        'To apply income for the maintenance of beneficiaries during the administration of my Estate.',
-        'To delegate powers and duties as permitted by law.',
-    ]
-    
-    for power in powers:
-        blocks.append(ContentBlock(
-            type='bullet_item',
-            content=power,
-            style='power_item',
-            indent_level=1
-        ))
-    
-    return blocks
+    ),
+) + tuple(
+    ContentBlock(
+        type='bullet_item',
+        content=power,
+        style='power_item',
+        indent_level=1
+    )
+    for power in _ADMINISTRATIVE_POWERS
+)
+
+
+@_clause_renderer(CLAUSE_ADMINISTRATIVE_POWERS)
+def _render_administrative_powers(context: WillContext) -> List[ContentBlock]:
+    """Render administrative powers clause."""
+    return list(_ADMINISTRATIVE_POWERS_BLOCKS)
+
+
+_DIGITAL_ASSET_CATEGORY_NAMES = {
+    'email': 'email accounts',
+    'social_media': 'social media accounts',
+    'cloud_storage': 'cloud storage accounts',
+    'crypto': 'cryptocurrency holdings'
+}
 
 
+@_clause_renderer(CLAUSE_DIGITAL_ASSETS)
 def _render_digital_assets(context: WillContext) -> List[ContentBlock]:
     """Render digital assets clause."""
     blocks = []
     
     if context.digital_assets_authority:
-        text = (
+        parts = [
             'I authorize my Executors to access, manage, and dispose of my digital assets. '
             'This includes access to the following categories: '
-        )
+        ]
         
         categories = []
-        category_names = {
-            'email': 'email accounts',
-            'social_media': 'social media accounts',
-            'cloud_storage': 'cloud storage accounts',
-            'crypto': 'cryptocurrency holdings'
-        }
-        
         for cat in context.digital_assets_categories:
-            categories.append(category_names.get(cat, cat))
+            categories.append(_DIGITAL_ASSET_CATEGORY_NAMES.get(cat, cat))
         
         if categories:
-            text += ', '.join(categories) + '.'
+            parts.extend((', '.join(categories), '.'))
         
         if context.digital_assets_instructions_location:
-            text += (
-                f' Detailed instructions for accessing these assets are located at: '
-                f'{context.digital_assets_instructions_location}.'
-            )
+            parts.extend((
+                ' Detailed instructions for accessing these assets are located at: ',
+                context.digital_assets_instructions_location,
+                '.',
+            ))
         
         blocks.append(ContentBlock(
             type='paragraph',
-            content=text,
+            content=''.join(parts),
             style='normal'
         ))
     
     return blocks
 
 
+@_clause_renderer(CLAUSE_PETS)
 def _render_pets(context: WillContext) -> List[ContentBlock]:
     """Render pets clause."""
     blocks = []
     
-    text = (
+    parts = [
         f'I have {context.pets_count} pet(s): {context.pets_summary}. '
         f'I give my pets to {context.pets_carer_name}, of '
         f'{context.pets_carer_address.to_single_line()}, '
         f'for care and custody.'
-    )
+    ]
     
     if context.pets_cash_gift:
-        text += (
+        parts.append(
             f' I also give to {context.pets_carer_name} the sum of '
             f'${context.pets_cash_gift:,.2f} for the care and maintenance of my pets.'
         )
     
     blocks.append(ContentBlock(
         type='paragraph',
-        content=text,
+        content=''.join(parts),
         style='normal'
     ))
     
     return blocks
 
 
+_BUSINESS_INTEREST_TYPE_NAMES = {
+    'sole_trader': 'sole trader business',
+    'company_shareholding': 'company shareholding',
+    'partnership': 'partnership interest',
+    'trust_interest': 'trust interest'
+}
+
+
+@_clause_renderer(CLAUSE_BUSINESS_INTERESTS)
 def _render_business_interests(context: WillContext) -> List[ContentBlock]:
     """Render business interests clause."""
     blocks = []
@@ -648,14 +731,7 @@ def _render_business_interests(context: WillContext) -> List[ContentBlock]:
         ))
         
         for i, interest in enumerate(context.business_interests, 1):
-            interest_type_names = {
-                'sole_trader': 'sole trader business',
-                'company_shareholding': 'company shareholding',
-                'partnership': 'partnership interest',
-                'trust_interest': 'trust interest'
-            }
-            
-            type_name = interest_type_names.get(interest.interest_type, 'business interest')
+            type_name = _BUSINESS_INTEREST_TYPE_NAMES.get(interest.interest_type, 'business interest')
             
             item_text = (
                 f'{i}. My {type_name} in {interest.entity_name} '
@@ -672,169 +748,181 @@ def _render_business_interests(context: WillContext) -> List[ContentBlock]:
     return blocks
 
 
+_EXCLUSION_CATEGORY_NAMES = {
+    'former_partner': 'former partner',
+    'child': 'child',
+    'stepchild': 'stepchild',
+    'dependant_other': 'dependant'
+}
+
+# Fixed wording per exclusion reason ('other_structured' uses the exclusion's own note)
+_EXCLUSION_REASON_TEXT = {
+    'already_provided_for': 'they have already been provided for during my lifetime',
+    'estrangement': 'of estrangement',
+    'financial_independence': 'they are financially independent',
+}
+
+
+@_clause_renderer(CLAUSE_EXCLUSION_NOTE)
 def _render_exclusion_note(context: WillContext) -> List[ContentBlock]:
     """Render exclusion note clause."""
     blocks = []
     
     if context.exclusions:
         for exclusion in context.exclusions:
-            category_names = {
-                'former_partner': 'former partner',
-                'child': 'child',
-                'stepchild': 'stepchild',
-                'dependant_other': 'dependant'
-            }
-            
-            category = category_names.get(exclusion.category, exclusion.category)
+            category = _EXCLUSION_CATEGORY_NAMES.get(exclusion.category, exclusion.category)
             
-            text = (
-                f'I have made no provision in this Will for my {category}, '
-                f'{exclusion.person_name}.'
-            )
+            parts = [
+                'I have made no provision in this Will for my ', category, ', ',
+                exclusion.person_name, '.',
+            ]
             
             if exclusion.reasons:
-                reason_texts = {
-                    'already_provided_for': 'they have already been provided for during my lifetime',
-                    'estrangement': 'of estrangement',
-                    'financial_independence': 'they are financially independent',
-                    'other_structured': exclusion.other_note if exclusion.other_note else 'other reasons'
-                }
-                
-                reasons_list = [reason_texts.get(r, r) for r in exclusion.reasons]
-                text += ' This is because ' + ', '.join(reasons_list) + '.'
+                other_text = exclusion.other_note if exclusion.other_note else 'other reasons'
+                reasons_list = [
+                    other_text if r == 'other_structured' else _EXCLUSION_REASON_TEXT.get(r, r)
+                    for r in exclusion.reasons
+                ]
+                parts.extend((' This is because ', ', '.join(reasons_list), '.'))
             
             blocks.append(ContentBlock(
                 type='paragraph',
-                content=text,
+                content=''.join(parts),
                 style='normal'
             ))
     
     return blocks
 
 
+_LIFE_SUSTAINING_TEMPLATE_TEXT = {
+    'comfort_and_dignity_prioritised': (
+        'If I have a terminal illness or injury, or am in a persistent vegetative state, '
+        'I direct that my comfort and dignity be prioritised. '
+        'I do not wish to receive life-sustaining treatment if the burdens outweigh the benefits.'
+    ),
+    'palliative_only_in_terminal_or_permanent_unconsciousness': (
+        'If I have a terminal condition or am permanently unconscious, '
+        'I direct that only palliative care be provided to maintain my comfort. '
+        'I do not wish to receive treatment that would merely prolong the dying process.'
+    ),
+    'prolong_life_if_reasonable': (
+        'I wish for all reasonable measures to be taken to prolong my life, '
+        'provided that such measures do not cause undue suffering.'
+    )
+}
+
+
+_LIFE_SUSTAINING_VALUE_TEXT = {
+    'comfort': 'comfort',
+    'dignity': 'dignity',
+    'palliative_care': 'palliative care',
+    'avoid_burdensome_treatment': 'avoidance of burdensome treatment'
+}
+
+
+@_clause_renderer(CLAUSE_LIFE_SUSTAINING_STATEMENT)
 def _render_life_sustaining(context: WillContext) -> List[ContentBlock]:
     """Render life sustaining treatment statement."""
-    blocks = []
-    
-    template_texts = {
-        'comfort_and_dignity_prioritised': (
-            'If I have a terminal illness or injury, or am in a persistent vegetative state, '
-            'I direct that my comfort and dignity be prioritised. '
-            'I do not wish to receive life-sustaining treatment if the burdens outweigh the benefits.'
-        ),
-        'palliative_only_in_terminal_or_permanent_unconsciousness': (
-            'If I have a terminal condition or am permanently unconscious, '
-            'I direct that only palliative care be provided to maintain my comfort. '
-            'I do not wish to receive treatment that would merely prolong the dying process.'
-        ),
-        'prolong_life_if_reasonable': (
-            'I wish for all reasonable measures to be taken to prolong my life, '
-            'provided that such measures do not cause undue suffering.'
-        )
-    }
-    
-    text = template_texts.get(
+    return list(_life_sustaining_blocks(
         context.life_sustaining_template,
+        tuple(context.life_sustaining_values)
+    ))
+
+
+@lru_cache(maxsize=128)
+def _life_sustaining_blocks(template: str, life_values: Tuple[str, ...]) -> Tuple[ContentBlock, ...]:
+    """Build the life sustaining statement blocks, cached per template and values."""
+    parts = [_LIFE_SUSTAINING_TEMPLATE_TEXT.get(
+        template,
         'I have expressed my wishes regarding life sustaining treatment.'
-    )
+    )]
     
-    if context.life_sustaining_values:
-        value_texts = {
-            'comfort': 'comfort',
-            'dignity': 'dignity',
-            'palliative_care': 'palliative care',
-            'avoid_burdensome_treatment': 'avoidance of burdensome treatment'
-        }
-        
-        values = [value_texts.get(v, v) for v in context.life_sustaining_values]
-        text += f' My values include: {", ".join(values)}.'
+    if life_values:
+        values = [_LIFE_SUSTAINING_VALUE_TEXT.get(v, v) for v in life_values]
+        parts.extend((' My values include: ', ', '.join(values), '.'))
     
-    blocks.append(ContentBlock(
+    return (ContentBlock(
         type='paragraph',
-        content=text,
+        content=''.join(parts),
         style='normal'
-    ))
-    
-    return blocks
+    ),)
 
 
-def _render_attestation(context: WillContext) -> List[ContentBlock]:
-    """Render attestation and execution clause."""
-    blocks = []
-    
-    # Execution statement
-    blocks.append(ContentBlock(
-        type='paragraph',
-        content='SIGNED by the Testator as their Last Will and Testament:',
-        style='normal'
-    ))
-    
-    # Signature block for will maker
-    blocks.append(ContentBlock(
-        type='signature_block',
-        content={
-            'label': 'Signature of Will Maker',
-            'name': context.will_maker.full_name,
-            'date_label': 'Date',
-            'lines': 3
-        },
-        style='signature'
-    ))
-    
-    # Witness statement
-    blocks.append(ContentBlock(
+_EXECUTION_STATEMENT_BLOCK = ContentBlock(
+    type='paragraph',
+    content='SIGNED by the Testator as their Last Will and Testament:',
+    style='normal'
+)
+
+# Witness statement followed by both witness signature blocks
+_WITNESS_BLOCKS = (
+    ContentBlock(
         type='paragraph',
         content=(
             'SIGNED by the above-named Testator in our presence '
             'and attested by us in the presence of the Testator and each other.'
         ),
         style='normal'
-    ))
-    
-    # Witness 1 signature block
-    blocks.append(ContentBlock(
+    ),
+) + tuple(
+    ContentBlock(
         type='signature_block',
-        content={
-            'label': 'Witness 1',
+        content=MappingProxyType({
+            'label': label,
             'name_label': 'Name (print)',
             'address_label': 'Address',
             'occupation_label': 'Occupation',
             'date_label': 'Date',
             'lines': 4
-        },
+        }),
         style='signature'
-    ))
+    )
+    for label in ('Witness 1', 'Witness 2')
+)
+
+
+@_clause_renderer(CLAUSE_ATTESTATION)
+def _render_attestation(context: WillContext) -> List[ContentBlock]:
+    """Render attestation and execution clause."""
+    blocks = [_EXECUTION_STATEMENT_BLOCK]
     
-    # Witness 2 signature block
+    # Signature block for will maker
     blocks.append(ContentBlock(
         type='signature_block',
-        content={
-            'label': 'Witness 2',
-            'name_label': 'Name (print)',
-            'address_label': 'Address',
-            'occupation_label': 'Occupation',
+        content=MappingProxyType({
+            'label': 'Signature of Will Maker',
+            'name': context.will_maker.full_name,
             'date_label': 'Date',
-            'lines': 4
-        },
+            'lines': 3
+        }),
         style='signature'
     ))
     
+    # Witness statement and signature blocks
+    blocks.extend(_WITNESS_BLOCKS)
+    
     return blocks
 
 
-def document_plan_to_dict(document_plan: List[DocumentPlanItem]) -> List[Dict[str, Any]]:
+def iter_document_plan_dicts(document_plan: Iterable[DocumentPlanItem]) -> Iterator[Dict[str, Any]]:
     """
-    Convert document plan to dictionary for serialization.
+    Yield the serialized form of each document plan item in turn.
+    
+    Lets streaming writers serialize a plan without holding the whole
+    dictionary tree in memory alongside the dataclass tree.
     
     Args:
-        document_plan: List of DocumentPlanItem
+        document_plan: Iterable of DocumentPlanItem
     
-    Returns:
-        List of dictionaries
+    Yields:
+        One dictionary per item
     """
-    result = []
+    # Literal dicts with plain (slot) attribute reads measure faster here than
+    # attrgetter + dict(zip(...)), so the dicts stay explicit. Read-only
+    # mapping content is copied into a plain dict, so callers get their own
+    # JSON-serializable copy and never the shared block content.
     for item in document_plan:
-        result.append({
+        yield {
             'id': item.id,
             'title': item.title,
             'clause_number': item.clause_number,
@@ -842,11 +930,26 @@ def document_plan_to_dict(document_plan: List[DocumentPlanItem]) -> List[Dict[st
             'content_blocks': [
                 {
                     'type': block.type,
-                    'content': block.content,
+                    'content': (
+                        dict(block.content) if type(block.content) is MappingProxyType
+                        else block.content
+                    ),
                     'style': block.style,
                     'indent_level': block.indent_level
                 }
                 for block in item.content_blocks
             ]
-        })
-    return result
+        }
+
+
+def document_plan_to_dict(document_plan: List[DocumentPlanItem]) -> List[Dict[str, Any]]:
+    """
+    Convert document plan to dictionary for serialization.
+    
+    Args:
+        document_plan: List of DocumentPlanItem
+    
+    Returns:
+        List of dictionaries
+    """
+    return list(iter_document_plan_dicts(document_plan))
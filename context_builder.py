@@ -6,15 +6,12 @@ All derived flags are computed in one place only.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+from itertools import count
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
 
-from app.utils import is_minor_at_date
 
-
-@dataclass
-class Address:
-    """Structured address."""
+class Address(NamedTuple):
+    """Structured address (immutable value object)."""
     street: str = ''
     suburb: str = ''
     state: str = ''
@@ -23,12 +20,13 @@ class Address:
     @classmethod
     def from_dict(cls, data: Dict[str, str]) -> 'Address':
         if not data:
-            return cls()
+            return _EMPTY_ADDRESS
+        get = data.get
         return cls(
-            street=data.get('street', ''),
-            suburb=data.get('suburb', ''),
-            state=data.get('state', ''),
-            postcode=data.get('postcode', '')
+            street=get('street', ''),
+            suburb=get('suburb', ''),
+            state=get('state', ''),
+            postcode=get('postcode', '')
         )
     
     def to_single_line(self) -> str:
@@ -43,29 +41,35 @@ class Address:
         return lines
 
 
-@dataclass
+
+# Shared empty address; Address is immutable so one instance serves every
+# default and every missing address in the payload
+_EMPTY_ADDRESS = Address()
+
+@dataclass(slots=True)
 class Person:
     """Base person entity."""
     full_name: str = ''
-    address: Address = field(default_factory=Address)
+    address: Address = _EMPTY_ADDRESS
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Person':
         if not data:
             return cls()
+        get = data.get
         return cls(
-            full_name=data.get('full_name', ''),
-            address=Address.from_dict(data.get('address', {}))
+            full_name=get('full_name', ''),
+            address=Address.from_dict(get('address', {}))
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class WillMaker:
     """Will maker entity."""
     full_name: str = ''
     dob: Optional[str] = None
     occupation: str = ''
-    address: Address = field(default_factory=Address)
+    address: Address = _EMPTY_ADDRESS
     email: str = ''
     phone: str = ''
     relationship_status: str = ''
@@ -74,23 +78,24 @@ class WillMaker:
     def from_dict(cls, data: Dict[str, Any]) -> 'WillMaker':
         if not data:
             return cls()
+        get = data.get
         return cls(
-            full_name=data.get('full_name', ''),
-            dob=data.get('dob'),
-            occupation=data.get('occupation', ''),
-            address=Address.from_dict(data.get('address', {})),
-            email=data.get('email', ''),
-            phone=data.get('phone', ''),
-            relationship_status=data.get('relationship_status', '')
+            full_name=get('full_name', ''),
+            dob=get('dob'),
+            occupation=get('occupation', ''),
+            address=Address.from_dict(get('address', {})),
+            email=get('email', ''),
+            phone=get('phone', ''),
+            relationship_status=get('relationship_status', '')
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Partner:
     """Partner entity."""
     full_name: str = ''
     dob: Optional[str] = None
-    address: Address = field(default_factory=Address)
+    address: Address = _EMPTY_ADDRESS
     email: str = ''
     phone: str = ''
     
@@ -98,16 +103,17 @@ class Partner:
     def from_dict(cls, data: Dict[str, Any]) -> 'Partner':
         if not data:
             return cls()
+        get = data.get
         return cls(
-            full_name=data.get('full_name', ''),
-            dob=data.get('dob'),
-            address=Address.from_dict(data.get('address', {})),
-            email=data.get('email', ''),
-            phone=data.get('phone', '')
+            full_name=get('full_name', ''),
+            dob=get('dob'),
+            address=Address.from_dict(get('address', {})),
+            email=get('email', ''),
+            phone=get('phone', '')
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Child:
     """Child entity."""
     full_name: str = ''
@@ -120,17 +126,17 @@ class Child:
     def from_dict(cls, data: Dict[str, Any]) -> 'Child':
         if not data:
             return cls()
+        get = data.get
         return cls(
-            full_name=data.get('full_name', ''),
-            dob=data.get('dob'),
-            relationship_type=data.get('relationship_type', ''),
-            is_expected_to_be_minor_at_death=data.get('is_expected_to_be_minor_at_death', False),
-            special_needs=data.get('special_needs', False)
+            full_name=get('full_name', ''),
+            dob=get('dob'),
+            relationship_type=get('relationship_type', ''),
+            is_expected_to_be_minor_at_death=get('is_expected_to_be_minor_at_death', False),
+            special_needs=get('special_needs', False)
         )
 
 
-@dataclass
-class Dependant:
+class Dependant(NamedTuple):
     """Other dependant entity."""
     full_name: str = ''
     relationship_category: str = ''
@@ -139,18 +145,19 @@ class Dependant:
     def from_dict(cls, data: Dict[str, Any]) -> 'Dependant':
         if not data:
             return cls()
+        get = data.get
         return cls(
-            full_name=data.get('full_name', ''),
-            relationship_category=data.get('relationship_category', '')
+            full_name=get('full_name', ''),
+            relationship_category=get('relationship_category', '')
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Executor:
     """Executor entity."""
     full_name: str = ''
     relationship: str = ''
-    address: Address = field(default_factory=Address)
+    address: Address = _EMPTY_ADDRESS
     phone: str = ''
     email: str = ''
     
@@ -158,43 +165,59 @@ class Executor:
     def from_dict(cls, data: Dict[str, Any]) -> 'Executor':
         if not data:
             return cls()
+        get = data.get
+        return cls(
+            full_name=get('full_name', ''),
+            relationship=get('relationship', ''),
+            address=Address.from_dict(get('address', {})),
+            phone=get('phone', ''),
+            email=get('email', '')
+        )
+    
+    @classmethod
+    def from_partner(cls, partner: Partner, with_contact: bool = True) -> 'Executor':
+        """Appoint the partner, sharing their (immutable) address."""
+        if not with_contact:
+            return cls(full_name=partner.full_name, relationship='partner',
+                       address=partner.address)
         return cls(
-            full_name=data.get('full_name', ''),
-            relationship=data.get('relationship', ''),
-            address=Address.from_dict(data.get('address', {})),
-            phone=data.get('phone', ''),
-            email=data.get('email', '')
+            full_name=partner.full_name,
+            relationship='partner',
+            address=partner.address,
+            phone=partner.phone,
+            email=partner.email
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Guardian:
     """Guardian entity."""
     full_name: str = ''
     relationship: str = ''
-    address: Address = field(default_factory=Address)
+    address: Address = _EMPTY_ADDRESS
     phone: str = ''
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Guardian':
         if not data:
             return cls()
+        get = data.get
         return cls(
-            full_name=data.get('full_name', ''),
-            relationship=data.get('relationship', ''),
-            address=Address.from_dict(data.get('address', {})),
-            phone=data.get('phone', '')
+            full_name=get('full_name', ''),
+            relationship=get('relationship', ''),
+            address=Address.from_dict(get('address', {})),
+            phone=get('phone', '')
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Beneficiary:
     """Beneficiary entity."""
     id: str = ''
     type: str = 'individual'
     full_name: str = ''
     relationship: str = ''
-    address: Address = field(default_factory=Address)
+    address: Address = _EMPTY_ADDRESS
     abn: str = ''
     gift_role: str = ''
     residue_share_percent: Optional[float] = None
@@ -206,23 +229,23 @@ class Beneficiary:
     def from_dict(cls, data: Dict[str, Any], index: int) -> 'Beneficiary':
         if not data:
             return cls()
+        get = data.get
         return cls(
-            id=data.get('id', f'beneficiary_{index}'),
-            type=data.get('type', 'individual'),
-            full_name=data.get('full_name', ''),
-            relationship=data.get('relationship', ''),
-            address=Address.from_dict(data.get('address', {})),
-            abn=data.get('abn', ''),
-            gift_role=data.get('gift_role', ''),
-            residue_share_percent=data.get('residue_share_percent'),
-            percentage=data.get('percentage'),
-            cash_amount=data.get('cash_amount'),
-            item_description=data.get('item_description', '')
+            id=get('id', f'beneficiary_{index}'),
+            type=get('type', 'individual'),
+            full_name=get('full_name', ''),
+            relationship=get('relationship', ''),
+            address=Address.from_dict(get('address', {})),
+            abn=get('abn', ''),
+            gift_role=get('gift_role', ''),
+            residue_share_percent=get('residue_share_percent'),
+            percentage=get('percentage'),
+            cash_amount=get('cash_amount'),
+            item_description=get('item_description', '')
         )
 
 
-@dataclass
-class SpecificGift:
+class SpecificGift(NamedTuple):
     """Specific gift entity."""
     beneficiary_id: str = ''
     beneficiary_name: str = ''
@@ -231,15 +254,14 @@ class SpecificGift:
     item_description: str = ''
 
 
-@dataclass
-class ResidueBeneficiary:
+class ResidueBeneficiary(NamedTuple):
     """Residue beneficiary entity."""
     beneficiary_id: str = ''
     beneficiary_name: str = ''
     share_percent: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BusinessInterest:
     """Business interest entity."""
     interest_type: str = ''
@@ -249,34 +271,35 @@ class BusinessInterest:
     recipient_mode: str = ''
     recipient_id: Optional[str] = None
     recipient_name: str = ''
-    recipient_address: Address = field(default_factory=Address)
+    recipient_address: Address = _EMPTY_ADDRESS
     
     @classmethod
-    def from_dict(cls, data: Dict[str, Any], beneficiaries: List[Beneficiary]) -> 'BusinessInterest':
+    def from_dict(cls, data: Dict[str, Any],
+                  beneficiaries_by_id: Dict[str, Beneficiary]) -> 'BusinessInterest':
         if not data:
             return cls()
+        get = data.get
         
-        recipient_mode = data.get('recipient_mode', '')
-        recipient_id = data.get('recipient_id')
+        recipient_mode = get('recipient_mode', '')
+        recipient_id = get('recipient_id')
         recipient_name = ''
-        recipient_address = Address()
+        recipient_address = _EMPTY_ADDRESS
         
         if recipient_mode == 'select_beneficiary' and recipient_id:
-            for b in beneficiaries:
-                if b.id == recipient_id:
-                    recipient_name = b.full_name
-                    recipient_address = b.address
-                    break
+            b = beneficiaries_by_id.get(recipient_id)
+            if b is not None:
+                recipient_name = b.full_name
+                recipient_address = b.address
         elif recipient_mode == 'new_person':
-            recipient = data.get('recipient', {})
+            recipient = get('recipient', {})
             recipient_name = recipient.get('full_name', '')
             recipient_address = Address.from_dict(recipient.get('address', {}))
         
         return cls(
-            interest_type=data.get('interest_type', ''),
-            entity_name=data.get('entity_name', ''),
-            acn=data.get('acn', ''),
-            abn=data.get('abn', ''),
+            interest_type=get('interest_type', ''),
+            entity_name=get('entity_name', ''),
+            acn=get('acn', ''),
+            abn=get('abn', ''),
             recipient_mode=recipient_mode,
             recipient_id=recipient_id,
             recipient_name=recipient_name,
@@ -284,47 +307,48 @@ class BusinessInterest:
         )
 
 
-@dataclass
-class Exclusion:
+class Exclusion(NamedTuple):
     """Exclusion entity."""
     person_name: str = ''
     category: str = ''
-    reasons: List[str] = field(default_factory=list)
+    reasons: Tuple[str, ...] = ()
     other_note: str = ''
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Exclusion':
         if not data:
             return cls()
+        get = data.get
         return cls(
-            person_name=data.get('person_name', ''),
-            category=data.get('category', ''),
-            reasons=data.get('reasons', []),
-            other_note=data.get('other_note', '')
+            person_name=get('person_name', ''),
+            category=get('category', ''),
+            reasons=tuple(get('reasons', ())),
+            other_note=get('other_note', '')
         )
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class WillContext:
     """
     Complete context object for will generation.
     Contains all normalized entities and derived flags.
     """
-    # Core entities
+    # Core entities (entity collections are tuples; they are only read
+    # once build_context has filled them in)
     will_maker: WillMaker = field(default_factory=WillMaker)
     partner: Optional[Partner] = None
     separation: Dict[str, Any] = field(default_factory=dict)
-    children: List[Child] = field(default_factory=list)
-    other_dependants: List[Dependant] = field(default_factory=list)
-    executors: List[Executor] = field(default_factory=list)
-    backup_executors: List[Executor] = field(default_factory=list)
+    children: Tuple[Child, ...] = ()
+    other_dependants: Tuple[Dependant, ...] = ()
+    executors: Tuple[Executor, ...] = ()
+    backup_executors: Tuple[Executor, ...] = ()
     guardian: Optional[Guardian] = None
     backup_guardian: Optional[Guardian] = None
-    beneficiaries: List[Beneficiary] = field(default_factory=list)
-    specific_gifts: List[SpecificGift] = field(default_factory=list)
-    residue_beneficiaries: List[ResidueBeneficiary] = field(default_factory=list)
-    business_interests: List[BusinessInterest] = field(default_factory=list)
-    exclusions: List[Exclusion] = field(default_factory=list)
+    beneficiaries: Tuple[Beneficiary, ...] = ()
+    specific_gifts: Tuple[SpecificGift, ...] = ()
+    residue_beneficiaries: Tuple[ResidueBeneficiary, ...] = ()
+    business_interests: Tuple[BusinessInterest, ...] = ()
+    exclusions: Tuple[Exclusion, ...] = ()
     
     # Distribution settings
     distribution_scheme: str = ''
@@ -346,7 +370,7 @@ class WillContext:
     
     digital_assets_enabled: bool = False
     digital_assets_authority: bool = False
-    digital_assets_categories: List[str] = field(default_factory=list)
+    digital_assets_categories: Tuple[str, ...] = ()
     digital_assets_instructions_location: str = ''
     
     pets_enabled: bool = False
@@ -354,7 +378,7 @@ class WillContext:
     pets_summary: str = ''
     pets_carer_mode: str = ''
     pets_carer_name: str = ''
-    pets_carer_address: Address = field(default_factory=Address)
+    pets_carer_address: Address = _EMPTY_ADDRESS
     pets_cash_gift: Optional[float] = None
     
     business_enabled: bool = False
@@ -363,7 +387,7 @@ class WillContext:
     
     life_sustaining_enabled: bool = False
     life_sustaining_template: str = ''
-    life_sustaining_values: List[str] = field(default_factory=list)
+    life_sustaining_values: Tuple[str, ...] = ()
     
     # Assets overview
     assets: Dict[str, Any] = field(default_factory=dict)
@@ -428,6 +452,24 @@ class WillContext:
         }
 
 
+# Bound constructors for the per-item list builds in build_context
+_child_from_dict = Child.from_dict
+_dependant_from_dict = Dependant.from_dict
+_executor_from_dict = Executor.from_dict
+_beneficiary_from_dict = Beneficiary.from_dict
+_business_interest_from_dict = BusinessInterest.from_dict
+_exclusion_from_dict = Exclusion.from_dict
+
+# Relationship statuses that bring in a partner
+_PARTNER_STATUSES = frozenset({'married', 'de_facto'})
+
+# Executor modes whose executors are listed individually in the payload
+_EXECUTOR_LIST_MODES = frozenset({'one', 'two_joint', 'two_joint_and_several'})
+
+# Gift roles that bring a beneficiary within the minor trusts clause
+_MINOR_TRUST_ROLES = frozenset({'residue', 'percentage_only'})
+
+
 def build_context(payload: Dict[str, Any]) -> WillContext:
     """
     Build the complete will context from a validated payload.
@@ -441,70 +483,66 @@ def build_context(payload: Dict[str, Any]) -> WillContext:
     Returns:
         WillContext with all entities and derived flags
     """
-    context = WillContext()
+    get = payload.get
     
-    # Build will maker
-    context.will_maker = WillMaker.from_dict(payload.get('will_maker', {}))
+    # Build will maker (passed in so the default WillMaker is never built)
+    context = WillContext(will_maker=WillMaker.from_dict(get('will_maker', {})))
     
     # Build partner if applicable
     relationship_status = context.will_maker.relationship_status
-    context.has_partner = relationship_status in ['married', 'de_facto']
+    context.has_partner = relationship_status in _PARTNER_STATUSES
     
     if context.has_partner:
-        context.partner = Partner.from_dict(payload.get('partner', {}))
+        context.partner = Partner.from_dict(get('partner', {}))
     
     # Separation details
     if relationship_status == 'separated':
-        context.separation = payload.get('separation', {})
+        context.separation = get('separation', {})
     
     # Build children
-    if payload.get('has_children'):
-        children_data = payload.get('children', [])
-        context.children = [Child.from_dict(c) for c in children_data]
+    has_minor_children = False
+    if get('has_children'):
+        children_data = get('children', [])
+        context.children = tuple(map(_child_from_dict, children_data))
         context.has_children = len(context.children) > 0
-        context.has_minor_children = any(
-            c.is_expected_to_be_minor_at_death for c in context.children
-        )
+        for c in context.children:
+            if c.is_expected_to_be_minor_at_death:
+                has_minor_children = True
+                break
+        context.has_minor_children = has_minor_children
     
     # Build other dependants
-    dependants_data = payload.get('dependants', {})
+    dependants_data = get('dependants', {})
     if dependants_data.get('has_other_dependants'):
         other_deps = dependants_data.get('other_dependants', [])
-        context.other_dependants = [Dependant.from_dict(d) for d in other_deps]
+        context.other_dependants = tuple(map(_dependant_from_dict, other_deps))
     
     # Build executors
-    executors_data = payload.get('executors', {})
+    executors_data = get('executors', {})
     executor_mode = executors_data.get('mode', '')
     
     if executor_mode == 'partner_only' and context.partner:
-        context.executors = [Executor(
-            full_name=context.partner.full_name,
-            relationship='partner',
-            address=context.partner.address,
-            phone=context.partner.phone,
-            email=context.partner.email
-        )]
-    elif executor_mode in ['one', 'two_joint', 'two_joint_and_several']:
+        context.executors = (Executor.from_partner(context.partner),)
+    elif executor_mode in _EXECUTOR_LIST_MODES:
         primary = executors_data.get('primary', [])
-        context.executors = [Executor.from_dict(e) for e in primary]
+        context.executors = tuple(map(_executor_from_dict, primary))
     
     # Build backup executors
     backup_data = executors_data.get('backup', {})
     backup_mode = backup_data.get('mode', '')
     
     if backup_mode == 'partner' and context.partner:
-        context.backup_executors = [Executor(
-            full_name=context.partner.full_name,
-            relationship='partner',
-            address=context.partner.address
-        )]
-    elif backup_mode in ['one', 'two_joint', 'two_joint_and_several']:
+        # The backup appointment carries no contact details
+        context.backup_executors = (
+            Executor.from_partner(context.partner, with_contact=False),
+        )
+    elif backup_mode in _EXECUTOR_LIST_MODES:
         backup_list = backup_data.get('list', [])
-        context.backup_executors = [Executor.from_dict(e) for e in backup_list]
+        context.backup_executors = tuple(map(_executor_from_dict, backup_list))
     
     # Build guardians
-    guardianship_data = payload.get('guardianship', {})
-    if context.has_minor_children and guardianship_data.get('appoint_guardian'):
+    guardianship_data = get('guardianship', {})
+    if has_minor_children and guardianship_data.get('appoint_guardian'):
         context.guardian = Guardian.from_dict(guardianship_data.get('guardian', {}))
         context.has_guardianship = True
         
@@ -513,65 +551,68 @@ def build_context(payload: Dict[str, Any]) -> WillContext:
             context.backup_guardian = Guardian.from_dict(backup_guardian_data)
     
     # Build beneficiaries and extract specific gifts/residue
-    beneficiaries_data = payload.get('beneficiaries', [])
-    context.beneficiaries = [
-        Beneficiary.from_dict(b, i) for i, b in enumerate(beneficiaries_data)
-    ]
+    beneficiaries_data = get('beneficiaries', [])
+    context.beneficiaries = tuple(
+        map(_beneficiary_from_dict, beneficiaries_data, count())
+    )
     context.beneficiary_count = len(context.beneficiaries)
     
-    # Extract specific gifts and residue beneficiaries
+    # Index by id for the alternate beneficiary, pet carer and business
+    # recipient lookups; the first beneficiary with a given id wins
+    beneficiaries_by_id: Dict[str, Beneficiary] = {}
+    has_minor_trust_role = False
+    percentage_sum = 0.0
+    
+    # Extract specific gifts and residue beneficiaries. The value types are
+    # NamedTuples, built positionally (see their field order above)
+    specific_gifts: List[SpecificGift] = []
+    residue_beneficiaries: List[ResidueBeneficiary] = []
+    add_gift = specific_gifts.append
+    add_residue = residue_beneficiaries.append
     for b in context.beneficiaries:
-        if b.gift_role == 'specific_cash':
-            context.specific_gifts.append(SpecificGift(
-                beneficiary_id=b.id,
-                beneficiary_name=b.full_name,
-                gift_type='cash',
-                cash_amount=b.cash_amount
-            ))
-            context.has_specific_gifts = True
-        elif b.gift_role == 'specific_item':
-            context.specific_gifts.append(SpecificGift(
-                beneficiary_id=b.id,
-                beneficiary_name=b.full_name,
-                gift_type='item',
-                item_description=b.item_description
-            ))
-            context.has_specific_gifts = True
-        elif b.gift_role == 'residue':
-            context.residue_beneficiaries.append(ResidueBeneficiary(
-                beneficiary_id=b.id,
-                beneficiary_name=b.full_name,
-                share_percent=b.residue_share_percent
-            ))
+        role = b.gift_role
+        if role == 'specific_cash':
+            add_gift(SpecificGift(b.id, b.full_name, 'cash', b.cash_amount))
+        elif role == 'specific_item':
+            add_gift(SpecificGift(b.id, b.full_name, 'item', None, b.item_description))
+        elif role == 'residue':
+            add_residue(ResidueBeneficiary(b.id, b.full_name, b.residue_share_percent))
+        
+        if role in _MINOR_TRUST_ROLES:
+            has_minor_trust_role = True
         
         if b.percentage is not None:
-            context.percentage_sum += b.percentage
+            percentage_sum += b.percentage
+        
+        beneficiaries_by_id.setdefault(b.id, b)
     
-    context.has_residue_scheme = len(context.residue_beneficiaries) > 0
+    context.specific_gifts = tuple(specific_gifts)
+    context.residue_beneficiaries = tuple(residue_beneficiaries)
+    context.percentage_sum = percentage_sum
+    context.has_specific_gifts = len(specific_gifts) > 0
+    context.has_residue_scheme = len(residue_beneficiaries) > 0
     context.has_percentages = context.percentage_sum > 0
     
     # Distribution settings
-    distribution_data = payload.get('distribution', {})
+    distribution_data = get('distribution', {})
     context.distribution_scheme = distribution_data.get('scheme', '')
     
-    survivorship_data = payload.get('survivorship', {})
+    survivorship_data = get('survivorship', {})
     context.survivorship_days = survivorship_data.get('days', 30)
     
-    substitution_data = payload.get('substitution', {})
+    substitution_data = get('substitution', {})
     context.substitution_rule = substitution_data.get('rule', '')
     context.has_substitution = bool(context.substitution_rule)
     
     if context.substitution_rule == 'to_alternate_beneficiary':
         context.alternate_beneficiary_id = substitution_data.get('alternate_beneficiary_id')
         context.has_alternate_beneficiary = True
-        # Find alternate beneficiary name
-        for b in context.beneficiaries:
-            if b.id == context.alternate_beneficiary_id:
-                context.alternate_beneficiary_name = b.full_name
-                break
+        alternate = beneficiaries_by_id.get(context.alternate_beneficiary_id)
+        if alternate is not None:
+            context.alternate_beneficiary_name = alternate.full_name
     
     # Minor trusts
-    minor_trusts_data = payload.get('minor_trusts', {})
+    minor_trusts_data = get('minor_trusts', {})
     if minor_trusts_data.get('enabled'):
         context.minor_trusts_enabled = True
         context.minor_trusts_vesting_age = minor_trusts_data.get('vesting_age', 18)
@@ -582,16 +623,13 @@ def build_context(payload: Dict[str, Any]) -> WillContext:
             context.minor_trusts_trustee = Executor.from_dict(trustee_data)
         
         # Determine if minor trusts clause should appear
-        context.has_minor_trusts = (
-            context.has_minor_children or 
-            any(b.gift_role in ['residue', 'percentage_only'] for b in context.beneficiaries)
-        )
+        context.has_minor_trusts = has_minor_children or has_minor_trust_role
     
     # Optional toggles
-    toggles_data = payload.get('toggles', {})
+    toggle = get('toggles', {}).get
     
     # Funeral wishes
-    funeral_data = toggles_data.get('funeral', {})
+    funeral_data = toggle('funeral', {})
     if funeral_data.get('enabled'):
         context.funeral_enabled = True
         context.has_funeral_wishes = True
@@ -599,16 +637,16 @@ def build_context(payload: Dict[str, Any]) -> WillContext:
         context.funeral_notes = funeral_data.get('notes', '')
     
     # Digital assets
-    digital_assets_data = toggles_data.get('digital_assets', {})
+    digital_assets_data = toggle('digital_assets', {})
     if digital_assets_data.get('enabled'):
         context.digital_assets_enabled = True
         context.has_digital_assets = True
         context.digital_assets_authority = digital_assets_data.get('authority', False)
-        context.digital_assets_categories = digital_assets_data.get('categories', [])
+        context.digital_assets_categories = tuple(digital_assets_data.get('categories', ()))
         context.digital_assets_instructions_location = digital_assets_data.get('instructions_location', '')
     
     # Pets
-    pets_data = toggles_data.get('pets', {})
+    pets_data = toggle('pets', {})
     if pets_data.get('enabled'):
         context.pets_enabled = True
         context.has_pets = True
@@ -618,49 +656,47 @@ def build_context(payload: Dict[str, Any]) -> WillContext:
         context.pets_cash_gift = pets_data.get('cash_gift')
         
         if context.pets_carer_mode == 'select_beneficiary':
-            care_beneficiary_id = pets_data.get('care_beneficiary_id')
-            for b in context.beneficiaries:
-                if b.id == care_beneficiary_id:
-                    context.pets_carer_name = b.full_name
-                    context.pets_carer_address = b.address
-                    break
+            carer = beneficiaries_by_id.get(pets_data.get('care_beneficiary_id'))
+            if carer is not None:
+                context.pets_carer_name = carer.full_name
+                context.pets_carer_address = carer.address
         elif context.pets_carer_mode == 'new_person':
             carer_data = pets_data.get('carer', {})
             context.pets_carer_name = carer_data.get('full_name', '')
             context.pets_carer_address = Address.from_dict(carer_data.get('address', {}))
     
     # Business interests
-    business_data = toggles_data.get('business', {})
+    business_data = toggle('business', {})
     if business_data.get('enabled'):
         context.business_enabled = True
         context.has_business_interests = True
         interests_data = business_data.get('interests', [])
-        context.business_interests = [
-            BusinessInterest.from_dict(i, context.beneficiaries) 
+        context.business_interests = tuple([
+            _business_interest_from_dict(i, beneficiaries_by_id)
             for i in interests_data
-        ]
+        ])
     
     # Exclusions
-    exclusion_data = toggles_data.get('exclusion', {})
+    exclusion_data = toggle('exclusion', {})
     if exclusion_data.get('enabled'):
         context.exclusion_enabled = True
         context.has_exclusions = True
         exclusions_list = exclusion_data.get('exclusions', [])
-        context.exclusions = [Exclusion.from_dict(e) for e in exclusions_list]
+        context.exclusions = tuple(map(_exclusion_from_dict, exclusions_list))
     
     # Life sustaining treatment
-    life_sustaining_data = toggles_data.get('life_sustaining', {})
+    life_sustaining_data = toggle('life_sustaining', {})
     if life_sustaining_data.get('enabled'):
         context.life_sustaining_enabled = True
         context.has_life_sustaining_statement = True
         context.life_sustaining_template = life_sustaining_data.get('template', '')
-        context.life_sustaining_values = life_sustaining_data.get('values', [])
+        context.life_sustaining_values = tuple(life_sustaining_data.get('values', ()))
     
     # Assets overview
-    context.assets = payload.get('assets', {})
+    context.assets = get('assets', {})
     
     # Declarations
-    declarations_data = payload.get('declarations', {})
+    declarations_data = get('declarations', {})
     context.intended_signing_date = declarations_data.get('intended_signing_date')
     
     # Final derived counts
@@ -4,15 +4,23 @@ Email Service Module
 Provides SMTP email delivery for will documents and execution checklists.
 """
 
+import atexit
+import base64
 import os
+import re
 import smtplib
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from email.mime.application import MIMEApplication
-from typing import Optional, List
+from email.mime.nonmultipart import MIMENonMultipart
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, Iterable, Optional, List
 from datetime import datetime
 
-from flask import current_app, render_template_string
+from flask import current_app
+from markupsafe import escape
 
 from app.audit_logger import log_email_sent
 
@@ -118,9 +126,87 @@ This email was sent from the Will Generator system.
 This is not legal advice. Consult a solicitor for complex situations.
 """
 
+_PLACEHOLDER_RE = re.compile(r'\{\{ (\w+) \}\}')
+
+
+def _compile_email_template(source: str) -> Callable[[Dict[str, Any]], str]:
+    """
+    Split a template into static text and {{ name }} placeholders once.
+    
+    The email templates only substitute plain variables, so rendering is a
+    join of the static pieces with the escaped values. Output matches an
+    autoescaping Jinja render of the same source (as Flask applied to
+    string templates), including Jinja dropping a single trailing newline.
+    """
+    parts = _PLACEHOLDER_RE.split(source)
+    static, names = parts[0::2], parts[1::2]
+    if static[-1].endswith('\n'):
+        static[-1] = static[-1][:-1]
+    head, tails = static[0], tuple(zip(names, static[1:]))
+    
+    def render(values: Dict[str, Any]) -> str:
+        out = [head]
+        for name, text in tails:
+            out.append(escape(values[name]))
+            out.append(text)
+        return ''.join(out)
+    
+    return render
+
+
+_render_will_html = _compile_email_template(WILL_EMAIL_TEMPLATE)
+_render_will_text = _compile_email_template(TEXT_EMAIL_TEMPLATE)
+
+
+@lru_cache(maxsize=16)
+def _pdf_base64(pdf_bytes: bytes) -> str:
+    """
+    Base64 body for a PDF attachment.
+    
+    Keyed on the PDF content itself so a resend of the same document skips
+    re-encoding, while different bytes can never share an entry.
+    """
+    return base64.encodebytes(pdf_bytes).decode('ascii')
+
+
+def _pdf_attachment(pdf_bytes: bytes, filename: str) -> MIMENonMultipart:
+    """
+    Build a PDF attachment part.
+    
+    Produces the same part as MIMEApplication(pdf_bytes, _subtype='pdf'),
+    but sets the cached base64 body directly instead of round-tripping the
+    raw bytes through the message payload first.
+    """
+    part = MIMENonMultipart('application', 'pdf')
+    part.set_payload(_pdf_base64(pdf_bytes))
+    part['Content-Transfer-Encoding'] = 'base64'
+    part.add_header('Content-Disposition', 'attachment', filename=filename)
+    return part
+
+
+# Attempts per message when the server drops the connection mid-send
+_SEND_ATTEMPTS = 3
+
+# Messages send_batch builds ahead of the one being sent
+_BATCH_READ_AHEAD = 1
+
+# Keys every send_batch job must provide (send_will_email's arguments)
+_BATCH_JOB_KEYS = (
+    'recipient_email', 'will_maker_name', 'pdf_bytes', 'checklist_pdf_bytes',
+    'document_hash_short', 'submission_id',
+)
+
 
 class EmailService:
-    """Service for sending emails with will documents."""
+    """
+    Service for sending emails with will documents.
+    
+    Keeps one authenticated SMTP connection open between sends so that
+    the TCP connect, STARTTLS handshake and login are paid once rather
+    than per email. The connection is checked with NOOP before each
+    send, reopened if the server has dropped it, and recycled after
+    max_sends_per_connection messages to stay within provider limits.
+    """
     
     def __init__(self):
         self.smtp_host = os.environ.get('SMTP_HOST', '')
@@ -130,18 +216,81 @@ class EmailService:
         self.smtp_tls = os.environ.get('SMTP_TLS', 'true').lower() == 'true'
         self.from_address = os.environ.get('EMAIL_FROM', 'noreply@willgenerator.local')
         self.enabled = all([self.smtp_host, self.smtp_user, self.smtp_password])
+        self.max_sends_per_connection = int(
+            os.environ.get('SMTP_MAX_SENDS_PER_CONNECTION', '100')
+        )
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._sends_on_connection = 0
+        self._lock = threading.Lock()
     
     def is_configured(self) -> bool:
         """Check if email service is properly configured."""
         return self.enabled
     
+    def close(self) -> None:
+        """Close the pooled SMTP connection, if one is open."""
+        server, self._smtp = self._smtp, None
+        if server is None:
+            return
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+    
+    def _connect(self) -> smtplib.SMTP:
+        """Open, secure and authenticate a new SMTP connection."""
+        server = smtplib.SMTP(self.smtp_host, self.smtp_port)
+        try:
+            if self.smtp_tls:
+                server.starttls()
+            server.login(self.smtp_user, self.smtp_password)
+        except Exception:
+            server.close()
+            raise
+        self._smtp = server
+        self._sends_on_connection = 0
+        return server
+    
+    def _get_connection(self) -> smtplib.SMTP:
+        """Return the pooled connection if it is still usable, else a new one."""
+        server = self._smtp
+        if server is not None and self._sends_on_connection < self.max_sends_per_connection:
+            try:
+                if server.noop()[0] == 250:
+                    return server
+            except (smtplib.SMTPException, OSError):
+                pass
+        self.close()
+        return self._connect()
+    
+    def _send_message(self, msg: MIMEMultipart) -> None:
+        """Send a message over the pooled connection, reconnecting if dropped.
+        
+        The message is flattened once so a retry resends the same bytes
+        instead of re-encoding both PDF attachments.
+        """
+        data = msg.as_bytes()
+        to_addrs = [msg['To']]
+        with self._lock:
+            server = self._get_connection()
+            for attempt in range(1, _SEND_ATTEMPTS + 1):
+                try:
+                    server.sendmail(self.from_address, to_addrs, data)
+                    break
+                except smtplib.SMTPServerDisconnected:
+                    self.close()
+                    if attempt == _SEND_ATTEMPTS:
+                        raise
+                    server = self._connect()
+            self._sends_on_connection += 1
+    
     def send_will_email(
         self,
         recipient_email: str,
         will_maker_name: str,
         pdf_bytes: bytes,
         checklist_pdf_bytes: bytes,
-        document_hash: str,
+        document_hash_short: str,
         submission_id: int
     ) -> tuple:
         """
@@ -152,7 +301,8 @@ class EmailService:
             will_maker_name: Name of will maker for personalization
             pdf_bytes: Will PDF content
             checklist_pdf_bytes: Execution checklist PDF content
-            document_hash: Document hash for verification
+            document_hash_short: Leading 16 hex chars of the document hash
+                (a full digest is also accepted and truncated)
             submission_id: Submission ID for audit logging
         
         Returns:
@@ -161,51 +311,112 @@ class EmailService:
         if not self.is_configured():
             return False, 'Email service not configured'
         
+        return self._deliver(
+            partial(self._build_message, recipient_email, will_maker_name,
+                    pdf_bytes, checklist_pdf_bytes, document_hash_short),
+            recipient_email,
+            submission_id
+        )
+    
+    def send_batch(self, jobs: Iterable[Dict[str, Any]]) -> List[tuple]:
+        """
+        Send several will emails over the pooled connection.
+        
+        Each job holds send_will_email's keyword arguments. The next
+        message is built (templates rendered, PDFs base64-encoded) on a
+        worker thread while the current one is on the wire, so at most
+        _BATCH_READ_AHEAD + 1 built messages are held at once. Sends go
+        out one at a time, in job order, on the single SMTP connection.
+        A job that cannot be built or sent fails on its own.
+        
+        Args:
+            jobs: Iterable of send_will_email keyword-argument dicts
+        
+        Returns:
+            List of (success, error_message) tuples in job order
+        """
+        if not self.is_configured():
+            return [(False, 'Email service not configured')] * len(list(jobs))
+        
+        results = []
+        pending = deque()
+        
+        def deliver_oldest():
+            job, future = pending.popleft()
+            results.append(self._deliver(
+                future.result, job.get('recipient_email'), job.get('submission_id')
+            ))
+        
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            for job in jobs:
+                pending.append((job, pool.submit(self._build_job_message, job)))
+                if len(pending) > _BATCH_READ_AHEAD:
+                    deliver_oldest()
+            while pending:
+                deliver_oldest()
+        
+        return results
+    
+    def _build_job_message(self, job: Dict[str, Any]) -> MIMEMultipart:
+        """Build the message for one send_batch job."""
+        missing = [key for key in _BATCH_JOB_KEYS if key not in job]
+        if missing:
+            raise ValueError(f'Batch job is missing {", ".join(missing)}')
+        return self._build_message(
+            job['recipient_email'],
+            job['will_maker_name'],
+            job['pdf_bytes'],
+            job['checklist_pdf_bytes'],
+            job['document_hash_short']
+        )
+    
+    def _build_message(
+        self,
+        recipient_email: str,
+        will_maker_name: str,
+        pdf_bytes: bytes,
+        checklist_pdf_bytes: bytes,
+        document_hash_short: str
+    ) -> MIMEMultipart:
+        """Build the will email with both PDF attachments."""
+        msg = MIMEMultipart('alternative')
+        msg['Subject'] = 'Your Last Will and Testament'
+        msg['From'] = self.from_address
+        msg['To'] = recipient_email
+        
+        # Render templates
+        template_vars = {
+            'will_maker_name': will_maker_name,
+            'generated_at': datetime.utcnow().strftime('%d %B %Y at %H:%M UTC'),
+            # Callers that still pass the full digest only show 16 chars
+            'document_hash': document_hash_short[:16]
+        }
+        
+        html_content = _render_will_html(template_vars)
+        text_content = _render_will_text(template_vars)
+        
+        # Attach content
+        msg.attach(MIMEText(text_content, 'plain'))
+        msg.attach(MIMEText(html_content, 'html'))
+        
+        # Attach will PDF
+        msg.attach(_pdf_attachment(pdf_bytes, 'Last_Will_and_Testament.pdf'))
+        
+        # Attach checklist PDF
+        msg.attach(_pdf_attachment(checklist_pdf_bytes, 'Execution_Checklist.pdf'))
+        
+        return msg
+    
+    def _deliver(
+        self,
+        build: Callable[[], MIMEMultipart],
+        recipient_email: str,
+        submission_id: int
+    ) -> tuple:
+        """Build (or collect) a message, send it and audit-log the outcome."""
         try:
-            # Build email
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = 'Your Last Will and Testament'
-            msg['From'] = self.from_address
-            msg['To'] = recipient_email
-            
-            # Render templates
-            template_vars = {
-                'will_maker_name': will_maker_name,
-                'generated_at': datetime.utcnow().strftime('%d %B %Y at %H:%M UTC'),
-                'document_hash': document_hash[:16]
-            }
-            
-            html_content = render_template_string(WILL_EMAIL_TEMPLATE, **template_vars)
-            text_content = render_template_string(TEXT_EMAIL_TEMPLATE, **template_vars)
-            
-            # Attach content
-            msg.attach(MIMEText(text_content, 'plain'))
-            msg.attach(MIMEText(html_content, 'html'))
-            
-            # Attach will PDF
-            will_attachment = MIMEApplication(pdf_bytes, _subtype='pdf')
-            will_attachment.add_header(
-                'Content-Disposition',
-                'attachment',
-                filename='Last_Will_and_Testament.pdf'
-            )
-            msg.attach(will_attachment)
-            
-            # Attach checklist PDF
-            checklist_attachment = MIMEApplication(checklist_pdf_bytes, _subtype='pdf')
-            checklist_attachment.add_header(
-                'Content-Disposition',
-                'attachment',
-                filename='Execution_Checklist.pdf'
-            )
-            msg.attach(checklist_attachment)
-            
-            # Send email
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                if self.smtp_tls:
-                    server.starttls()
-                server.login(self.smtp_user, self.smtp_password)
-                server.send_message(msg)
+            msg = build()
+            self._send_message(msg)
             
             # Log success
             log_email_sent(submission_id, recipient_email, True)
@@ -224,6 +435,7 @@ class EmailService:
 
 # Global instance
 email_service = EmailService()
+atexit.register(email_service.close)
 
 
 def send_will_email(
@@ -231,7 +443,7 @@ def send_will_email(
     will_maker_name: str,
     pdf_bytes: bytes,
     checklist_pdf_bytes: bytes,
-    document_hash: str,
+    document_hash_short: str,
     submission_id: int
 ) -> tuple:
     """
@@ -242,7 +454,8 @@ def send_will_email(
         will_maker_name: Name of will maker
         pdf_bytes: Will PDF content
         checklist_pdf_bytes: Execution checklist PDF content
-        document_hash: Document hash
+        document_hash_short: Leading 16 hex chars of the document hash
+            (a full digest is also accepted and truncated)
         submission_id: Submission ID
     
     Returns:
@@ -253,6 +466,6 @@ def send_will_email(
         will_maker_name,
         pdf_bytes,
         checklist_pdf_bytes,
-        document_hash,
+        document_hash_short,
         submission_id
     )
@@ -7,18 +7,17 @@ This helps ensure proper execution of the will.
 
 import io
 import hashlib
+from copy import copy
 from datetime import datetime
-from typing import Tuple
+from functools import lru_cache
+from typing import BinaryIO, Dict, Tuple
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.lib.units import mm
-from reportlab.lib.enums import TA_LEFT, TA_CENTER
-from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
-    ListFlowable, ListItem
-)
+from reportlab.lib.enums import TA_CENTER
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
 
 from app.context_builder import WillContext
 from app.utils import format_brisbane_datetime
@@ -31,9 +30,83 @@ MARGIN_RIGHT = 25 * mm
 MARGIN_TOP = 20 * mm
 MARGIN_BOTTOM = 25 * mm
 
+# Static checklist sections. Their Paragraphs are parsed once at import
+# (_build_static_story); platypus stores layout state on each flowable (wrap
+# width, line breaks) and on its parsed fragments (_fkind), so every build
+# lays out its own copies of both (_layout_copy).
+_BEFORE_SIGNING_ITEMS = (
+    '☐ Read your will completely and carefully',
+    '☐ Ensure all names are spelled correctly',
+    '☐ Verify all addresses are current and complete',
+    '☐ Confirm the distribution matches your intentions',
+    '☐ Print the will on plain white A4 paper (do not use pre-printed forms)',
+    '☐ Do NOT sign or date the will yet',
+    '☐ Arrange for two independent adult witnesses',
+)
 
-def create_checklist_styles():
-    """Create styles for the checklist document."""
+_WITNESS_ITEMS = (
+    '☐ Both witnesses must be 18 years or older',
+    '☐ Both witnesses must be present at the same time',
+    '☐ Witnesses must be mentally competent',
+    '☐ Witnesses must watch you sign the will',
+    '☐ You must watch both witnesses sign',
+    '☐ Each witness must watch the other witness sign',
+)
+
+_CANNOT_WITNESS_ITEMS = (
+    '☒ Anyone named as a beneficiary in the will',
+    '☒ The spouse or partner of any beneficiary',
+    '☒ Anyone under 18 years of age',
+    '☒ Anyone who is visually impaired (cannot see you sign)',
+    '☒ Anyone who does not understand the nature of the document',
+)
+
+_SIGNING_PROCEDURE_ITEMS = (
+    '☐ Print your full name clearly in the will maker section',
+    '☐ Sign your name in the presence of both witnesses',
+    '☐ Both witnesses must sign in your presence',
+    '☐ Each witness must sign in the presence of the other witness',
+    '☐ All signatures must be on the same document',
+    '☐ Do NOT sign any pages that are blank or incomplete',
+    '☐ Date the will on the date of signing (not before)',
+)
+
+_AFTER_SIGNING_ITEMS = (
+    '☐ Store the original will in a safe, secure location',
+    '☐ Do NOT attach anything to the will (staples, paper clips, etc.)',
+    '☐ Do NOT write on the will after signing',
+    '☐ Tell your executor where the will is stored',
+    '☐ Consider giving a copy to your executor',
+    '☐ Review your will every 2-3 years or after major life changes',
+)
+
+_NOT_COVERED_ITEMS = (
+    '<b>Superannuation:</b> Contact your super fund to make a binding death nomination',
+    '<b>Jointly held property:</b> Usually passes to the surviving joint owner',
+    '<b>Assets in trust:</b> Governed by the trust deed, not your will',
+    '<b>Life insurance:</b> Paid to nominated beneficiaries',
+    '<b>Company shares:</b> May be subject to shareholder agreements',
+)
+
+_LEGAL_ADVICE_ITEMS = (
+    'You have significant assets or complex financial arrangements',
+    'You own a business or have company interests',
+    'You have beneficiaries with special needs',
+    'You want to exclude a family member who may contest',
+    'You have assets in multiple jurisdictions',
+    'You are in a blended family situation',
+    'You are unsure about any aspect of your will',
+)
+
+
+@lru_cache(maxsize=None)
+def create_checklist_styles() -> Dict[str, ParagraphStyle]:
+    """
+    Create styles for the checklist document.
+    
+    Built once and shared by every checklist; reportlab only reads the
+    styles, so callers must not modify the returned dict or its styles.
+    """
     styles = getSampleStyleSheet()
     
     return {
@@ -101,202 +174,217 @@ def create_checklist_styles():
     }
 
 
-def generate_execution_checklist(context: WillContext, will_hash: str,
-                                  generation_timestamp: datetime = None) -> Tuple[bytes, str]:
+def _build_static_story() -> Tuple[tuple, tuple]:
     """
-    Generate an execution checklist PDF.
+    Build the checklist flowables that do not depend on the will.
     
-    Args:
-        context: The will context
-        will_hash: Hash of the associated will document
-        generation_timestamp: Stored timestamp for determinism
-    
-    Returns:
-        Tuple of (PDF bytes, SHA256 hash)
+    Returns the part before the document reference details and the part
+    after them, up to (not including) the generated-at footer line.
     """
-    if generation_timestamp is None:
-        generation_timestamp = datetime.utcnow()
-    
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(
-        buffer,
-        pagesize=A4,
-        leftMargin=MARGIN_LEFT,
-        rightMargin=MARGIN_RIGHT,
-        topMargin=MARGIN_TOP,
-        bottomMargin=MARGIN_BOTTOM,
-    )
-    
     styles = create_checklist_styles()
-    story = []
     
-    # Title
-    story.append(Paragraph('WILL EXECUTION CHECKLIST', styles['title']))
-    story.append(Paragraph(
-        'Instructions for Properly Signing and Witnessing Your Will',
-        styles['subtitle']
-    ))
-    story.append(Spacer(1, 20))
+    head = [
+        # Title
+        Paragraph('WILL EXECUTION CHECKLIST', styles['title']),
+        Paragraph(
+            'Instructions for Properly Signing and Witnessing Your Will',
+            styles['subtitle']
+        ),
+        Spacer(1, 20),
+        
+        # Document reference
+        Paragraph('Document Reference', styles['heading']),
+    ]
     
-    # Document reference
-    story.append(Paragraph('Document Reference', styles['heading']))
-    story.append(Paragraph(
-        f'<b>Will Maker:</b> {context.will_maker.full_name}',
-        styles['normal']
-    ))
-    story.append(Paragraph(
-        f'<b>Document Hash:</b> {will_hash[:16]}...',
-        styles['normal']
-    ))
-    story.append(Paragraph(
-        f'<b>Generated:</b> {format_brisbane_datetime(generation_timestamp)}',
-        styles['normal']
-    ))
-    story.append(Spacer(1, 20))
+    body = [Spacer(1, 20)]
     
     # Important warning
-    story.append(Paragraph('⚠️ IMPORTANT', styles['heading']))
-    story.append(Paragraph(
+    body.append(Paragraph('⚠️ IMPORTANT', styles['heading']))
+    body.append(Paragraph(
         'Your will is NOT legally valid until it is properly signed and witnessed. '
         'Failure to follow these instructions may result in your will being invalid '
         'or contested.',
         styles['important']
     ))
-    story.append(Spacer(1, 20))
+    body.append(Spacer(1, 20))
     
     # Before signing
-    story.append(Paragraph('Before You Sign', styles['heading']))
-    before_items = [
-        '☐ Read your will completely and carefully',
-        '☐ Ensure all names are spelled correctly',
-        '☐ Verify all addresses are current and complete',
-        '☐ Confirm the distribution matches your intentions',
-        '☐ Print the will on plain white A4 paper (do not use pre-printed forms)',
-        '☐ Do NOT sign or date the will yet',
-        '☐ Arrange for two independent adult witnesses',
-    ]
-    for item in before_items:
-        story.append(Paragraph(item, styles['checklist_item']))
-    story.append(Spacer(1, 15))
+    body.append(Paragraph('Before You Sign', styles['heading']))
+    for item in _BEFORE_SIGNING_ITEMS:
+        body.append(Paragraph(item, styles['checklist_item']))
+    body.append(Spacer(1, 15))
     
     # Witness requirements
-    story.append(Paragraph('Witness Requirements (Queensland)', styles['heading']))
-    story.append(Paragraph(
+    body.append(Paragraph('Witness Requirements (Queensland)', styles['heading']))
+    body.append(Paragraph(
         'Your witnesses MUST meet ALL of the following requirements:',
         styles['normal']
     ))
-    witness_items = [
-        '☐ Both witnesses must be 18 years or older',
-        '☐ Both witnesses must be present at the same time',
-        '☐ Witnesses must be mentally competent',
-        '☐ Witnesses must watch you sign the will',
-        '☐ You must watch both witnesses sign',
-        '☐ Each witness must watch the other witness sign',
-    ]
-    for item in witness_items:
-        story.append(Paragraph(item, styles['checklist_item']))
-    story.append(Spacer(1, 15))
+    for item in _WITNESS_ITEMS:
+        body.append(Paragraph(item, styles['checklist_item']))
+    body.append(Spacer(1, 15))
     
     # Who cannot witness
-    story.append(Paragraph('Who CANNOT Witness Your Will', styles['heading']))
-    story.append(Paragraph(
+    body.append(Paragraph('Who CANNOT Witness Your Will', styles['heading']))
+    body.append(Paragraph(
         'The following people should NOT witness your will:',
         styles['normal']
     ))
-    cannot_items = [
-        '☒ Anyone named as a beneficiary in the will',
-        '☒ The spouse or partner of any beneficiary',
-        '☒ Anyone under 18 years of age',
-        '☒ Anyone who is visually impaired (cannot see you sign)',
-        '☒ Anyone who does not understand the nature of the document',
-    ]
-    for item in cannot_items:
-        story.append(Paragraph(item, styles['checklist_item']))
-    story.append(Spacer(1, 15))
+    for item in _CANNOT_WITNESS_ITEMS:
+        body.append(Paragraph(item, styles['checklist_item']))
+    body.append(Spacer(1, 15))
     
     # Signing procedure
-    story.append(Paragraph('Signing Procedure', styles['heading']))
-    procedure_items = [
-        '☐ Print your full name clearly in the will maker section',
-        '☐ Sign your name in the presence of both witnesses',
-        '☐ Both witnesses must sign in your presence',
-        '☐ Each witness must sign in the presence of the other witness',
-        '☐ All signatures must be on the same document',
-        '☐ Do NOT sign any pages that are blank or incomplete',
-        '☐ Date the will on the date of signing (not before)',
-    ]
-    for item in procedure_items:
-        story.append(Paragraph(item, styles['checklist_item']))
-    story.append(Spacer(1, 15))
+    body.append(Paragraph('Signing Procedure', styles['heading']))
+    for item in _SIGNING_PROCEDURE_ITEMS:
+        body.append(Paragraph(item, styles['checklist_item']))
+    body.append(Spacer(1, 15))
     
     # After signing
-    story.append(Paragraph('After Signing', styles['heading']))
-    after_items = [
-        '☐ Store the original will in a safe, secure location',
-        '☐ Do NOT attach anything to the will (staples, paper clips, etc.)',
-        '☐ Do NOT write on the will after signing',
-        '☐ Tell your executor where the will is stored',
-        '☐ Consider giving a copy to your executor',
-        '☐ Review your will every 2-3 years or after major life changes',
-    ]
-    for item in after_items:
-        story.append(Paragraph(item, styles['checklist_item']))
-    story.append(Spacer(1, 15))
+    body.append(Paragraph('After Signing', styles['heading']))
+    for item in _AFTER_SIGNING_ITEMS:
+        body.append(Paragraph(item, styles['checklist_item']))
+    body.append(Spacer(1, 15))
     
     # What the will does not cover
-    story.append(Paragraph('What Your Will Does NOT Cover', styles['heading']))
-    story.append(Paragraph(
+    body.append(Paragraph('What Your Will Does NOT Cover', styles['heading']))
+    body.append(Paragraph(
         'The following assets may NOT pass under your will:',
         styles['normal']
     ))
-    not_covered = [
-        '<b>Superannuation:</b> Contact your super fund to make a binding death nomination',
-        '<b>Jointly held property:</b> Usually passes to the surviving joint owner',
-        '<b>Assets in trust:</b> Governed by the trust deed, not your will',
-        '<b>Life insurance:</b> Paid to nominated beneficiaries',
-        '<b>Company shares:</b> May be subject to shareholder agreements',
-    ]
-    for item in not_covered:
-        story.append(Paragraph(f'• {item}', styles['normal']))
-    story.append(Spacer(1, 20))
+    for item in _NOT_COVERED_ITEMS:
+        body.append(Paragraph(f'• {item}', styles['normal']))
+    body.append(Spacer(1, 20))
     
     # When to seek legal advice
-    story.append(Paragraph('When to Seek Legal Advice', styles['heading']))
-    story.append(Paragraph(
+    body.append(Paragraph('When to Seek Legal Advice', styles['heading']))
+    body.append(Paragraph(
         'Consider consulting a solicitor if any of the following apply:',
         styles['normal']
     ))
-    advice_items = [
-        'You have significant assets or complex financial arrangements',
-        'You own a business or have company interests',
-        'You have beneficiaries with special needs',
-        'You want to exclude a family member who may contest',
-        'You have assets in multiple jurisdictions',
-        'You are in a blended family situation',
-        'You are unsure about any aspect of your will',
-    ]
-    for item in advice_items:
-        story.append(Paragraph(f'• {item}', styles['normal']))
-    story.append(Spacer(1, 20))
+    for item in _LEGAL_ADVICE_ITEMS:
+        body.append(Paragraph(f'• {item}', styles['normal']))
+    body.append(Spacer(1, 20))
     
     # Footer
-    story.append(Spacer(1, 30))
-    story.append(Paragraph(
+    body.append(Spacer(1, 30))
+    body.append(Paragraph(
         'This checklist is for guidance only and does not constitute legal advice.',
         styles['footer']
     ))
+    
+    return tuple(head), tuple(body)
+
+
+# Parsed once at import; each build lays out copies of these
+_STATIC_HEAD, _STATIC_BODY = _build_static_story()
+
+
+def _layout_copy(flowable):
+    """Copy a prebuilt flowable, and a Paragraph's fragments, for one build."""
+    flowable = copy(flowable)
+    frags = getattr(flowable, 'frags', None)
+    if frags is not None:
+        flowable.frags = [frag.clone() for frag in frags]
+    return flowable
+
+
+class _HashingWriter:
+    """Writable that SHA256-hashes everything it passes through to a sink."""
+    
+    def __init__(self, sink: BinaryIO):
+        self._sink = sink
+        self._sha256 = hashlib.sha256()
+    
+    def write(self, data: bytes) -> int:
+        self._sha256.update(data)
+        return self._sink.write(data)
+    
+    def hexdigest(self) -> str:
+        return self._sha256.hexdigest()
+
+
+def generate_execution_checklist(context: WillContext, will_hash_short: str,
+                                  generation_timestamp: datetime = None) -> Tuple[bytes, str]:
+    """
+    Generate an execution checklist PDF.
+    
+    Args:
+        context: The will context
+        will_hash_short: Leading 16 hex chars of the will document hash
+            (a full digest is also accepted and truncated)
+        generation_timestamp: Stored timestamp for determinism
+    
+    Returns:
+        Tuple of (PDF bytes, SHA256 hash)
+    """
+    buffer = io.BytesIO()
+    pdf_hash = generate_execution_checklist_stream(
+        context, will_hash_short, buffer, generation_timestamp
+    )
+    pdf_bytes = buffer.getvalue()
+    buffer.close()
+    
+    return pdf_bytes, pdf_hash
+
+
+def generate_execution_checklist_stream(context: WillContext, will_hash_short: str,
+                                         writer: BinaryIO,
+                                         generation_timestamp: datetime = None) -> str:
+    """
+    Generate an execution checklist PDF straight into a writable.
+    
+    Lets callers write the checklist to a file or response stream without
+    keeping their own copy of the bytes; the hash is computed as the PDF
+    is written out.
+    
+    Args:
+        context: The will context
+        will_hash_short: Leading 16 hex chars of the will document hash
+            (a full digest is also accepted and truncated)
+        writer: Binary file-like object the PDF is written to
+        generation_timestamp: Stored timestamp for determinism
+    
+    Returns:
+        SHA256 hash of the PDF written
+    """
+    if generation_timestamp is None:
+        generation_timestamp = datetime.utcnow()
+    generated_at = format_brisbane_datetime(generation_timestamp)
+    
+    sink = _HashingWriter(writer)
+    doc = SimpleDocTemplate(
+        sink,
+        pagesize=A4,
+        leftMargin=MARGIN_LEFT,
+        rightMargin=MARGIN_RIGHT,
+        topMargin=MARGIN_TOP,
+        bottomMargin=MARGIN_BOTTOM,
+    )
+    
+    styles = create_checklist_styles()
+    
+    # Copies keep this build's layout state off the shared flowables
+    story = [_layout_copy(flowable) for flowable in _STATIC_HEAD]
+    story.append(Paragraph(
+        f'<b>Will Maker:</b> {context.will_maker.full_name}',
+        styles['normal']
+    ))
+    story.append(Paragraph(
+        f'<b>Document Hash:</b> {will_hash_short[:16]}...',
+        styles['normal']
+    ))
     story.append(Paragraph(
-        f'Generated: {format_brisbane_datetime(generation_timestamp)}',
+        f'<b>Generated:</b> {generated_at}',
+        styles['normal']
+    ))
+    story.extend([_layout_copy(flowable) for flowable in _STATIC_BODY])
+    story.append(Paragraph(
+        f'Generated: {generated_at}',
         styles['footer']
     ))
     
     # Build PDF
     doc.build(story)
     
-    pdf_bytes = buffer.getvalue()
-    buffer.close()
-    
-    # Compute hash
-    pdf_hash = hashlib.sha256(pdf_bytes).hexdigest()
-    
-    return pdf_bytes, pdf_hash
+    return sink.hexdigest()
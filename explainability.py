@@ -9,7 +9,7 @@ All summaries are generated deterministically from the will context.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
 from enum import Enum
 
 from app.context_builder import WillContext
@@ -41,7 +41,7 @@ class RiskWarning:
     suggestion: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class WhatWillDoesNotCover:
     """Items explicitly not covered by the will."""
     category: str
@@ -60,7 +60,7 @@ class WillSummary:
     sections: List[WillSummarySection] = field(default_factory=list)
     
     # What it does not cover
-    not_covered: List[WhatWillDoesNotCover] = field(default_factory=list)
+    not_covered: Sequence[WhatWillDoesNotCover] = ()
     
     # Risk warnings
     warnings: List[RiskWarning] = field(default_factory=list)
@@ -142,7 +142,7 @@ def generate_will_summary(context: WillContext) -> WillSummary:
     summary.sections.extend(_build_special_provisions_summary(context))
     
     # Build what the will does NOT cover
-    summary.not_covered = _build_not_covered_list(context)
+    summary.not_covered = _NOT_COVERED
     
     # Generate risk warnings
     summary.warnings = _generate_risk_warnings(context)
@@ -386,72 +386,70 @@ def _build_special_provisions_summary(context: WillContext) -> List[WillSummaryS
     return sections
 
 
-def _build_not_covered_list(context: WillContext) -> List[WhatWillDoesNotCover]:
-    """Build list of what the will does NOT cover."""
-    not_covered = []
-    
+# What the will does NOT cover; the same for every will, so shared
+_NOT_COVERED = (
     # Superannuation
-    not_covered.append(WhatWillDoesNotCover(
+    WhatWillDoesNotCover(
         category='Superannuation',
         description='Your superannuation benefits are not automatically covered by your will.',
         reason=(
             "Superannuation is held in trust by your super fund and is distributed "
             "according to the fund's rules and any binding death nomination you have made."
         )
-    ))
+    ),
     
     # Life insurance
-    not_covered.append(WhatWillDoesNotCover(
+    WhatWillDoesNotCover(
         category='Life Insurance',
         description='Life insurance proceeds are paid directly to nominated beneficiaries.',
         reason=(
             "Unless your estate is the nominated beneficiary, life insurance proceeds "
             "bypass your will and go directly to the named beneficiary."
         )
-    ))
+    ),
     
     # Jointly owned property
-    not_covered.append(WhatWillDoesNotCover(
+    WhatWillDoesNotCover(
         category='Jointly Owned Property',
         description='Property owned as joint tenants passes automatically to the surviving owner.',
         reason=(
             "Property held as 'joint tenants' (common for married couples) passes by "
             "'right of survivorship' and is not part of your estate."
         )
-    ))
+    ),
     
     # Assets in trusts
-    not_covered.append(WhatWillDoesNotCover(
+    WhatWillDoesNotCover(
         category='Trust Assets',
         description='Assets held in family trusts or other trusts are not covered.',
         reason=(
             "Assets held in trust are owned by the trust, not by you personally. "
             "The trust deed determines how these assets are managed after your death."
         )
-    ))
+    ),
     
     # Company assets
-    not_covered.append(WhatWillDoesNotCover(
+    WhatWillDoesNotCover(
         category='Company Assets',
         description='Assets owned by companies you control are not your personal assets.',
         reason=(
             "Companies are separate legal entities. The company's assets belong to the "
             "company, not to you personally, even if you own all the shares."
         )
-    ))
+    ),
     
     # Powers of attorney
-    not_covered.append(WhatWillDoesNotCover(
+    WhatWillDoesNotCover(
         category='Enduring Powers of Attorney',
         description='This will does not create enduring powers of attorney.',
         reason=(
             "Enduring powers of attorney (for financial and personal/health matters) "
             "are separate documents that must be prepared and signed while you have capacity."
         )
-    ))
+    ),
     
     # Advance health directive
-    not_covered.append(WhatWillDoesNotCover(
+    WhatWillDoesNotCover(
         category='Advance Health Directive',
         description='This will does not create an advance health directive.',
         reason=(
@@ -459,9 +457,8 @@ def _build_not_covered_list(context: WillContext) -> List[WhatWillDoesNotCover]:
             "instructions about your future health care. It is different from the "
             "life-sustaining statement in your will."
         )
-    ))
-    
-    return not_covered
+    ),
+)
 
 
 def _generate_risk_warnings(context: WillContext) -> List[RiskWarning]:
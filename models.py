@@ -11,9 +11,42 @@ import json
 import hashlib
 from datetime import datetime
 from enum import Enum as PyEnum
+
+import orjson
+from blake3 import blake3
 from app import db
 
 
+# Audit integrity hash algorithms. New records use BLAKE3. Records written
+# before hash_algo existed are SHA-256 (upgrade_audit_schema backfills the
+# column); that code hashed each record before its timestamp column default
+# was applied, so their content hash covers the literal 'None' instead.
+HASH_ALGO_SHA256 = 'sha256'
+HASH_ALGO_BLAKE3 = 'blake3'
+DEFAULT_HASH_ALGO = HASH_ALGO_BLAKE3
+
+INTEGRITY_HASHERS = {
+    HASH_ALGO_SHA256: lambda data: hashlib.sha256(data).hexdigest(),
+    HASH_ALGO_BLAKE3: lambda data: blake3(data).hexdigest(),
+}
+
+
+def compute_audit_hash(timestamp, actor_type, actor_id, action, resource_type,
+                       resource_id, details_json, hash_algo=None):
+    """
+    Compute the integrity hash for audit record content.
+    
+    Shared by AuditLog instances and column-level verification queries,
+    so rows can be checked without hydrating ORM objects.
+    """
+    hash_algo = hash_algo or DEFAULT_HASH_ALGO
+    if hash_algo == HASH_ALGO_SHA256:
+        timestamp = None
+    content = f"{timestamp}{actor_type}{actor_id}{action}{resource_type}{resource_id}{details_json}"
+    hasher = INTEGRITY_HASHERS[hash_algo]
+    return hasher(content.encode())
+
+
 class SubmissionStatus(PyEnum):
     """Submission lifecycle states."""
     PENDING = 'pending'
@@ -71,7 +104,12 @@ class Submission(db.Model):
     
     # Relationships
     parent = db.relationship('Submission', remote_side=[id], backref='versions')
-    audit_logs = db.relationship('AuditLog', backref='submission', lazy='dynamic')
+    # Audit logs live in the 'audit' bind, so the join is declared without
+    # a database-level foreign key
+    audit_logs = db.relationship(
+        'AuditLog', backref='submission', lazy='dynamic',
+        primaryjoin='Submission.id == foreign(AuditLog.submission_id)'
+    )
     
     def __repr__(self):
         return f'<Submission {self.id} v{self.version_number} - {self.status}>'
@@ -137,8 +175,15 @@ class AuditLog(db.Model):
     Immutable audit trail for all significant actions.
     
     This table is append-only. Records are never modified or deleted.
+    Stored in the 'audit' bind so audit writes do not contend with
+    submission writes for the same SQLite lock.
     """
     __tablename__ = 'audit_logs'
+    __bind_key__ = 'audit'
+    __table_args__ = (
+        # Per-submission trails are read in timestamp order
+        db.Index('ix_audit_submission_time', 'submission_id', 'timestamp'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     
@@ -154,7 +199,7 @@ class AuditLog(db.Model):
     action_category = db.Column(db.String(20), nullable=False)  # 'create', 'read', 'update', 'delete', 'generate', 'send'
     
     # What was affected
-    submission_id = db.Column(db.Integer, db.ForeignKey('submissions.id'), nullable=True)
+    submission_id = db.Column(db.Integer, nullable=True)  # submissions.id (other database)
     resource_type = db.Column(db.String(50), nullable=False)  # 'submission', 'pdf', 'admin_session', etc.
     resource_id = db.Column(db.String(100), nullable=True)
     
@@ -171,6 +216,8 @@ class AuditLog(db.Model):
     
     # Integrity hash (prevents tampering)
     integrity_hash = db.Column(db.String(64), nullable=False)
+    hash_algo = db.Column(db.String(16), nullable=False,
+                          default=DEFAULT_HASH_ALGO, server_default=HASH_ALGO_SHA256)
     
     def __repr__(self):
         return f'<AuditLog {self.id} - {self.action} by {self.actor_type}>'
@@ -187,21 +234,68 @@ class AuditLog(db.Model):
             'resource_type': self.resource_type,
             'resource_id': self.resource_id,
             'submission_id': self.submission_id,
-            'details': json.loads(self.details_json) if self.details_json else None,
+            'details': orjson.loads(self.details_json) if self.details_json else None,
             'success': self.success,
             'error_message': self.error_message
         }
     
     def compute_integrity_hash(self):
         """Compute hash of this record's content for tamper detection."""
-        content = f"{self.timestamp}{self.actor_type}{self.actor_id}{self.action}{self.resource_type}{self.resource_id}{self.details_json}"
-        return hashlib.sha256(content.encode()).hexdigest()
+        return compute_audit_hash(
+            self.timestamp, self.actor_type, self.actor_id, self.action,
+            self.resource_type, self.resource_id, self.details_json, self.hash_algo
+        )
     
     def verify_integrity(self):
         """Verify this record has not been tampered with."""
         return self.integrity_hash == self.compute_integrity_hash()
 
 
+class AuditLogSegment(db.Model):
+    """
+    Sealed, fixed-size run of audit log records.
+    
+    Stores the Merkle root of the records' integrity hashes, so rewriting
+    or deleting a sealed record is detectable even when its own integrity
+    hash was recomputed to match.
+    """
+    __tablename__ = 'audit_log_segments'
+    __bind_key__ = 'audit'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    
+    # Inclusive AuditLog id range covered by this segment
+    first_id = db.Column(db.Integer, unique=True, nullable=False)
+    last_id = db.Column(db.Integer, nullable=False)
+    row_count = db.Column(db.Integer, nullable=False)
+    
+    # Merkle root over the rows' integrity hashes, in id order
+    merkle_root = db.Column(db.String(64), nullable=False)
+    
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        return f'<AuditLogSegment {self.id} - rows {self.first_id}..{self.last_id}>'
+
+
+def compute_merkle_root(leaf_hashes):
+    """
+    Compute a BLAKE3 Merkle root over hex-encoded leaf hashes.
+    
+    An odd node at any level is paired with itself.
+    """
+    level = [bytes.fromhex(leaf) for leaf in leaf_hashes]
+    if not level:
+        return blake3(b'').hexdigest()
+    
+    while len(level) > 1:
+        if len(level) % 2:
+            level.append(level[-1])
+        level = [blake3(level[i] + level[i + 1]).digest() for i in range(0, len(level), 2)]
+    
+    return level[0].hex()
+
+
 class AdminSession(db.Model):
     """
     Tracks admin sessions for security auditing.
@@ -30,9 +30,9 @@ from app.context_builder import build_context
 from app.clause_renderer import render_document_plan, document_plan_to_dict
 from app.pdf_generator import generate_pdf_with_footer, verify_pdf_integrity
 from app.execution_checklist import generate_execution_checklist
-from app.email_service import EmailService, send_will_email
+from app.email_service import send_will_email
 from app.audit_logger import (
-    log_submission_created, log_pdf_generated, log_email_sent,
+    log_submission_created, log_pdf_generated,
     log_validation_result, log_admin_login, log_action
 )
 from app.security import (
@@ -292,6 +292,7 @@ def api_generate():
         # Generate execution checklist PDF
         checklist_bytes, checklist_hash = generate_execution_checklist(
             context,
+            pdf_hash[:16],
             generation_timestamp=submission.generation_timestamp
         )
         
@@ -457,6 +458,7 @@ def api_regenerate(submission_id: int):
         # Generate checklist
         checklist_bytes, checklist_hash = generate_execution_checklist(
             context,
+            pdf_hash[:16],
             generation_timestamp=new_submission.generation_timestamp
         )
         
@@ -523,6 +525,11 @@ def api_email(submission_id: int):
                 'ok': False,
                 'error': 'PDF not found for this submission'
             }), 404
+        if not submission.checklist_pdf_path or not os.path.exists(submission.checklist_pdf_path):
+            return jsonify({
+                'ok': False,
+                'error': 'Execution checklist not found for this submission'
+            }), 404
         
         # Get recipient email
         data = request.get_json() or {}
@@ -534,20 +541,23 @@ def api_email(submission_id: int):
                 'error': 'No email address provided or stored'
             }), 400
         
-        # Initialize email service
-        email_service = EmailService()
-        
         # Get will maker name from payload
         payload = submission.get_payload()
         will_maker_name = payload.get('will_maker', {}).get('full_name', 'Valued Client')
         
-        # Send email
+        with open(submission.pdf_path, 'rb') as f:
+            pdf_bytes = f.read()
+        with open(submission.checklist_pdf_path, 'rb') as f:
+            checklist_pdf_bytes = f.read()
+        
+        # Send email over the shared service's pooled connection (the
+        # service audit-logs the outcome)
         success, error = send_will_email(
-            email_service=email_service,
             recipient_email=recipient,
-            recipient_name=will_maker_name,
-            will_pdf_path=submission.pdf_path,
-            checklist_pdf_path=submission.checklist_pdf_path,
+            will_maker_name=will_maker_name,
+            pdf_bytes=pdf_bytes,
+            checklist_pdf_bytes=checklist_pdf_bytes,
+            document_hash_short=submission.pdf_sha256[:16],
             submission_id=submission.id
         )
         
@@ -558,16 +568,6 @@ def api_email(submission_id: int):
             submission.email_recipient = recipient
             db.session.commit()
             
-            # Log email sent
-            log_email_sent(
-                submission_id=submission.id,
-                actor_id=request.remote_addr or 'unknown',
-                recipient=recipient,
-                success=True,
-                ip_address=request.remote_addr,
-                user_agent=request.headers.get('User-Agent')
-            )
-            
             return jsonify({
                 'ok': True,
                 'message': f'Will emailed successfully to {recipient}',
@@ -575,17 +575,6 @@ def api_email(submission_id: int):
                 'sent_at': submission.email_sent_at.isoformat()
             }), 200
         else:
-            # Log email failure
-            log_email_sent(
-                submission_id=submission.id,
-                actor_id=request.remote_addr or 'unknown',
-                recipient=recipient,
-                success=False,
-                error_message=error,
-                ip_address=request.remote_addr,
-                user_agent=request.headers.get('User-Agent')
-            )
-            
             submission.email_error = error
             db.session.commit()
             
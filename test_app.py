@@ -0,0 +1,183 @@
+"""
+Application Factory Tests
+
+Tests for configuration in create_app:
+- Environment-derived settings
+- Blueprint registration
+- Audit bind URI derivation
+- Schema creation via AUTO_CREATE_DB and `flask init-db`
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from sqlalchemy import inspect
+
+from app import audit_database_uri_for, create_app, db
+from app.models import DataRetentionPolicy
+
+
+class TestEnvironmentConfig(unittest.TestCase):
+    """Test settings read from the environment."""
+    
+    def make_app(self):
+        return create_app({
+            'TESTING': True,
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:',
+            'AUDIT_LOG_ASYNC': False,
+        })
+    
+    def test_environment_read_on_each_create_app(self):
+        """Test that environment changes after the first app are picked up."""
+        with mock.patch.dict(os.environ, {'SECRET_KEY': 'first', 'SMTP_PORT': '25'}):
+            first = self.make_app()
+        with mock.patch.dict(os.environ, {'SECRET_KEY': 'second', 'SMTP_PORT': '2525'}):
+            second = self.make_app()
+        
+        self.assertEqual((first.config['SECRET_KEY'], first.config['SMTP_PORT']), ('first', 25))
+        self.assertEqual((second.config['SECRET_KEY'], second.config['SMTP_PORT']), ('second', 2525))
+
+
+class TestBlueprints(unittest.TestCase):
+    """Test which blueprints create_app registers."""
+    
+    def make_app(self, **config):
+        test_config = {
+            'TESTING': True,
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:',
+            'AUDIT_LOG_ASYNC': False,
+        }
+        test_config.update(config)
+        return create_app(test_config)
+    
+    def test_all_blueprints_registered_by_default(self):
+        """Test that the main, API and admin blueprints are registered."""
+        app = self.make_app()
+        
+        self.assertEqual(set(app.blueprints), {'main', 'api', 'admin'})
+    
+    def test_admin_blueprint_skipped_when_disabled(self):
+        """Test that ENABLE_ADMIN=False leaves out the admin routes."""
+        app = self.make_app(ENABLE_ADMIN=False)
+        
+        self.assertEqual(set(app.blueprints), {'main', 'api'})
+        self.assertFalse(any(rule.rule.startswith('/admin') for rule in app.url_map.iter_rules()))
+
+
+class TestAuditDatabaseUri(unittest.TestCase):
+    """Test the default URI for the 'audit' bind."""
+    
+    def test_sqlite_file_gets_sibling_audit_db(self):
+        """Test that a SQLite file database gets audit.db next to it."""
+        self.assertEqual(
+            audit_database_uri_for('sqlite:////var/data/will_generator.db'),
+            'sqlite:////var/data/audit.db'
+        )
+    
+    def test_relative_sqlite_file(self):
+        """Test that a relative SQLite path keeps its directory."""
+        self.assertEqual(
+            audit_database_uri_for('sqlite:///will_generator.db'),
+            'sqlite:///audit.db'
+        )
+    
+    def test_in_memory_sqlite_unchanged(self):
+        """Test that in-memory SQLite URIs are not mapped to a file."""
+        self.assertEqual(audit_database_uri_for('sqlite:///:memory:'), 'sqlite:///:memory:')
+        self.assertEqual(audit_database_uri_for('sqlite://'), 'sqlite://')
+    
+    def test_server_database_unchanged(self):
+        """Test that server databases share the main URI."""
+        uri = 'postgresql://user:pass@db/wills'
+        self.assertEqual(audit_database_uri_for(uri), uri)
+    
+    def test_in_memory_app_keeps_audit_bind_in_memory(self):
+        """Test that an in-memory test config does not put audit.db on disk."""
+        app = create_app({
+            'TESTING': True,
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:',
+            'AUDIT_LOG_ASYNC': False,
+        })
+        self.assertEqual(app.config['SQLALCHEMY_BINDS']['audit'], 'sqlite:///:memory:')
+
+
+class TestInitDb(unittest.TestCase):
+    """Test when database tables are created."""
+    
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.apps = []
+    
+    def tearDown(self):
+        for app in self.apps:
+            with app.app_context():
+                for engine in db.engines.values():
+                    engine.dispose()
+        self.tmpdir.cleanup()
+    
+    def make_app(self, **config):
+        """Create an app whose main and audit databases are files in tmpdir."""
+        test_config = {
+            'TESTING': True,
+            'SQLALCHEMY_DATABASE_URI': f'sqlite:///{self.tmpdir.name}/wills.db',
+            'AUDIT_LOG_ASYNC': False,
+        }
+        test_config.update(config)
+        app = create_app(test_config)
+        self.apps.append(app)
+        return app
+    
+    def table_names(self, app):
+        """Get table names per bind key."""
+        with app.app_context():
+            return {key: set(inspect(engine).get_table_names())
+                    for key, engine in db.engines.items()}
+    
+    def test_create_app_skips_create_all_by_default(self):
+        """Test that AUTO_CREATE_DB=False leaves the schema alone."""
+        app = self.make_app(AUTO_CREATE_DB=False)
+        
+        self.assertEqual(self.table_names(app), {None: set(), 'audit': set()})
+    
+    def test_auto_create_db_creates_tables(self):
+        """Test that AUTO_CREATE_DB=True creates tables in both binds."""
+        app = self.make_app(AUTO_CREATE_DB=True)
+        
+        tables = self.table_names(app)
+        self.assertIn('submissions', tables[None])
+        self.assertIn('audit_logs', tables['audit'])
+    
+    def test_init_db_command_creates_both_binds(self):
+        """Test that `flask init-db` creates main and audit tables and seeds."""
+        app = self.make_app()
+        
+        result = app.test_cli_runner().invoke(args=['init-db'])
+        
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn('Initialized the database.', result.output)
+        self.assertTrue(os.path.exists(os.path.join(self.tmpdir.name, 'audit.db')))
+        
+        tables = self.table_names(app)
+        self.assertTrue({'submissions', 'data_retention_policies'} <= tables[None])
+        self.assertEqual(tables['audit'], {'audit_logs', 'audit_log_segments'})
+        self.assertNotIn('audit_logs', tables[None])
+        
+        with app.app_context():
+            self.assertEqual(DataRetentionPolicy.query.count(), 1)
+    
+    def test_init_db_command_is_repeatable(self):
+        """Test that a second `flask init-db` does not seed twice."""
+        app = self.make_app()
+        runner = app.test_cli_runner()
+        
+        runner.invoke(args=['init-db'])
+        result = runner.invoke(args=['init-db'])
+        
+        self.assertEqual(result.exit_code, 0, result.output)
+        with app.app_context():
+            self.assertEqual(DataRetentionPolicy.query.count(), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,498 @@
+"""
+Audit Logger Tests
+
+Tests for the audit trail:
+- Upgrading audit tables created by earlier releases
+- Copying audit records out of the main database
+- Batched background writes through AuditLogQueue
+- Sealed segments and full, incremental and multi-process verification
+- Integrity verification of stored records
+- Paging a submission's audit trail
+"""
+
+import hashlib
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from sqlalchemy import text
+
+from app import create_app, db, init_db
+from app import audit_logger
+from app.audit_logger import (
+    get_audit_trail_for_submission, import_legacy_audit_log, log_action, seal_audit_segments, upgrade_audit_schema,
+    verify_audit_integrity
+)
+from app.models import AuditLog, AuditLogSegment, HASH_ALGO_SHA256, compute_merkle_root
+
+
+# audit_logs as created before the hash_algo column existed
+LEGACY_AUDIT_LOGS_DDL = """
+CREATE TABLE audit_logs (
+    id INTEGER NOT NULL,
+    timestamp DATETIME NOT NULL,
+    actor_type VARCHAR(20) NOT NULL,
+    actor_id VARCHAR(100),
+    action VARCHAR(50) NOT NULL,
+    action_category VARCHAR(20) NOT NULL,
+    submission_id INTEGER,
+    resource_type VARCHAR(50) NOT NULL,
+    resource_id VARCHAR(100),
+    details_json TEXT,
+    success BOOLEAN NOT NULL,
+    error_message TEXT,
+    ip_address VARCHAR(45),
+    user_agent VARCHAR(500),
+    integrity_hash VARCHAR(64) NOT NULL,
+    PRIMARY KEY (id)
+)
+"""
+
+
+def create_test_app(**config):
+    """Create an app backed by in-memory databases."""
+    test_config = {
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:',
+        'AUDIT_LOG_ASYNC': False,
+    }
+    test_config.update(config)
+    return create_app(test_config)
+
+
+def insert_legacy_audit_row(connection, row_id=1, details_json='{"x": 1}'):
+    """
+    Insert a row the way earlier releases stored it: SHA-256 hashed before
+    the timestamp column default was applied, so over a 'None' timestamp.
+    """
+    content = f"Nonesystem{None}submission_createdsubmission{row_id}{details_json}"
+    connection.execute(
+        text(
+            "INSERT INTO audit_logs (id, timestamp, actor_type, action, action_category, "
+            "resource_type, resource_id, details_json, success, integrity_hash) "
+            "VALUES (:id, '2024-01-02 03:04:05.000000', 'system', 'submission_created', "
+            "'create', 'submission', :resource_id, :details_json, 1, :integrity_hash)"
+        ),
+        {
+            'id': row_id,
+            'resource_id': str(row_id),
+            'details_json': details_json,
+            'integrity_hash': hashlib.sha256(content.encode()).hexdigest(),
+        }
+    )
+
+
+class TestLegacyAuditSchema(unittest.TestCase):
+    """Test upgrading audit_logs tables created before hash_algo existed."""
+    
+    def setUp(self):
+        self.app = create_test_app()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        with db.engines['audit'].begin() as connection:
+            connection.execute(text(LEGACY_AUDIT_LOGS_DDL))
+            insert_legacy_audit_row(connection)
+    
+    def tearDown(self):
+        db.session.remove()
+        self.ctx.pop()
+    
+    def test_init_db_adds_hash_algo(self):
+        """Test that init_db backfills hash_algo as SHA-256."""
+        init_db()
+        
+        self.assertEqual(db.session.get(AuditLog, 1).hash_algo, HASH_ALGO_SHA256)
+        self.assertFalse(upgrade_audit_schema())
+    
+    def test_stored_sha256_record_verifies(self):
+        """Test that a record written by an earlier release verifies."""
+        init_db()
+        
+        self.assertEqual(verify_audit_integrity(), (1, 0, []))
+    
+    def test_tampered_sha256_record_detected(self):
+        """Test that editing a SHA-256 record's content is detected."""
+        init_db()
+        with db.engines['audit'].begin() as connection:
+            connection.execute(text("UPDATE audit_logs SET details_json = '{\"x\": 2}'"))
+        
+        self.assertEqual(verify_audit_integrity(), (0, 1, [1]))
+    
+    def test_new_records_verify_alongside_legacy(self):
+        """Test that new BLAKE3 records verify next to legacy ones."""
+        init_db()
+        log_action('submission_created', 'create', 'submission', submission_id=2)
+        
+        self.assertEqual(verify_audit_integrity(), (2, 0, []))
+
+
+
+class TestLegacyAuditImport(unittest.TestCase):
+    """Test copying audit_logs left in the main database into the audit bind."""
+    
+    def setUp(self):
+        self.app = create_test_app()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        with db.engines[None].begin() as connection:
+            connection.execute(text(LEGACY_AUDIT_LOGS_DDL))
+            insert_legacy_audit_row(connection, row_id=1)
+            insert_legacy_audit_row(connection, row_id=2, details_json=None)
+    
+    def tearDown(self):
+        db.session.remove()
+        self.ctx.pop()
+    
+    def test_init_db_copies_legacy_records(self):
+        """Test that init_db copies records with their ids and hashes."""
+        self.assertEqual(init_db(), 2)
+        
+        self.assertEqual(db.session.query(AuditLog).count(), 2)
+        self.assertEqual(db.session.get(AuditLog, 2).hash_algo, HASH_ALGO_SHA256)
+        self.assertEqual(verify_audit_integrity(), (2, 0, []))
+    
+    def test_copy_is_idempotent(self):
+        """Test that re-running the copy skips records already copied."""
+        init_db()
+        
+        self.assertEqual(import_legacy_audit_log(), 0)
+        self.assertEqual(db.session.query(AuditLog).count(), 2)
+    
+    def test_new_records_continue_after_copied_ids(self):
+        """Test that records logged after the copy get fresh ids."""
+        init_db()
+        audit_log = log_action('submission_created', 'create', 'submission', submission_id=3)
+        
+        self.assertEqual(audit_log.id, 3)
+    
+    def test_conflicting_ids_abort_copy(self):
+        """Test that an id reused by a different record aborts the copy."""
+        db.create_all()
+        log_action('submission_created', 'create', 'submission', submission_id=9)
+        
+        with self.assertRaises(RuntimeError):
+            import_legacy_audit_log()
+        self.assertEqual(db.session.query(AuditLog).count(), 1)
+
+
+class TestAuditLogQueue(unittest.TestCase):
+    """Test batched audit writes through the background queue."""
+    
+    def setUp(self):
+        # File databases: the writer thread uses its own connections
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.app = None
+    
+    def tearDown(self):
+        if self.app is not None:
+            self.audit_queue.close()
+            with self.app.app_context():
+                for engine in db.engines.values():
+                    engine.dispose()
+        self.tmpdir.cleanup()
+    
+    def make_app(self, **config):
+        """Create an app with an async audit queue and initialized tables."""
+        self.app = create_test_app(
+            SQLALCHEMY_DATABASE_URI=f'sqlite:///{self.tmpdir.name}/wills.db',
+            AUDIT_LOG_ASYNC=True,
+            **config
+        )
+        self.audit_queue = self.app.extensions['audit_log_queue']
+        with self.app.app_context():
+            init_db()
+        return self.app
+    
+    def log(self, count=1, **kwargs):
+        """Log count records through log_action."""
+        with self.app.app_context():
+            for i in range(count):
+                log_action('submission_created', 'create', 'submission', submission_id=i, **kwargs)
+    
+    def stored_count(self):
+        """Count audit records written to the database."""
+        with self.app.app_context():
+            return db.session.query(AuditLog).count()
+    
+    def wait_for_count(self, expected, timeout=5.0):
+        """Poll until expected records are stored, without flushing."""
+        deadline = time.monotonic() + timeout
+        while self.stored_count() < expected and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return self.stored_count()
+    
+    def test_writer_starts_with_first_record(self):
+        """Test that creating the app does not start a writer thread."""
+        self.make_app()
+        self.assertFalse(self.audit_queue.running)
+        
+        self.log()
+        self.assertTrue(self.audit_queue.running)
+    
+    def test_full_batch_written_without_flush(self):
+        """Test that a full batch is written before the flush interval."""
+        self.make_app(AUDIT_LOG_BATCH_SIZE=3, AUDIT_LOG_FLUSH_INTERVAL=60)
+        
+        self.log(3)
+        self.assertEqual(self.wait_for_count(3), 3)
+    
+    def test_partial_batch_written_after_interval(self):
+        """Test that a partial batch is written once the interval passes."""
+        self.make_app(AUDIT_LOG_BATCH_SIZE=100, AUDIT_LOG_FLUSH_INTERVAL=0.05)
+        
+        self.log()
+        self.assertEqual(self.wait_for_count(1), 1)
+    
+    def test_records_wait_for_batch(self):
+        """Test that records are not written one at a time."""
+        self.make_app(AUDIT_LOG_BATCH_SIZE=100, AUDIT_LOG_FLUSH_INTERVAL=60)
+        
+        self.log(2)
+        self.assertEqual(self.stored_count(), 0)
+        
+        self.audit_queue.flush()
+        self.assertEqual(self.stored_count(), 2)
+    
+    def test_flush_waits_for_in_flight_batch(self):
+        """Test that flush waits for a batch already taken off the queue."""
+        self.make_app(AUDIT_LOG_BATCH_SIZE=1, AUDIT_LOG_FLUSH_INTERVAL=60)
+        write = self.audit_queue._write
+        
+        def slow_write(batch):
+            time.sleep(0.2)
+            write(batch)
+        
+        with mock.patch.object(self.audit_queue, '_write', slow_write):
+            self.log()
+            # Let the writer take the record before flushing
+            deadline = time.monotonic() + 5
+            while self.audit_queue._queue.qsize() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.audit_queue.flush()
+        
+        self.assertEqual(self.stored_count(), 1)
+    
+    def test_synchronous_record_bypasses_queue(self):
+        """Test that synchronous records are committed before returning."""
+        self.make_app(AUDIT_LOG_FLUSH_INTERVAL=60)
+        
+        self.log(synchronous=True)
+        self.assertEqual(self.stored_count(), 1)
+        self.assertFalse(self.audit_queue.running)
+    
+    def test_sync_mode_has_no_queue(self):
+        """Test that AUDIT_LOG_ASYNC=False writes each record directly."""
+        app = create_test_app()
+        self.assertNotIn('audit_log_queue', app.extensions)
+        
+        with app.app_context():
+            init_db()
+            log_action('submission_created', 'create', 'submission', submission_id=1)
+            self.assertEqual(db.session.query(AuditLog).count(), 1)
+    
+    def test_close_writes_pending_records_and_stops_writer(self):
+        """Test that close drains the queue and stops the writer."""
+        self.make_app(AUDIT_LOG_FLUSH_INTERVAL=60)
+        self.log(2)
+        
+        self.audit_queue.close()
+        self.assertEqual(self.stored_count(), 2)
+        self.assertFalse(self.audit_queue.running)
+        
+        # Records logged after close are written synchronously
+        self.log()
+        self.assertEqual(self.stored_count(), 3)
+    
+    def test_close_registered_at_exit_once(self):
+        """Test that one exit hook is registered and removed by close."""
+        self.make_app(AUDIT_LOG_FLUSH_INTERVAL=60)
+        
+        with mock.patch.object(audit_logger, 'atexit') as atexit:
+            self.log(2)
+            self.audit_queue.flush()
+            self.log()
+            atexit.register.assert_called_once_with(self.audit_queue.close)
+            
+            self.audit_queue.close()
+            atexit.unregister.assert_called_once_with(self.audit_queue.close)
+    
+    @unittest.skipUnless(hasattr(os, 'fork'), 'requires fork')
+    def test_forked_child_gets_its_own_writer(self):
+        """Test that a child forked after the writer started can log."""
+        self.make_app(AUDIT_LOG_BATCH_SIZE=1, AUDIT_LOG_FLUSH_INTERVAL=60)
+        self.log()
+        self.audit_queue.flush()
+        
+        pid = os.fork()
+        if pid == 0:
+            status = 1
+            try:
+                with self.app.app_context():
+                    for engine in db.engines.values():
+                        engine.dispose(close=False)
+                self.log()
+                # Written by the child's own writer, not a synchronous flush
+                if self.audit_queue.running and self.wait_for_count(2) == 2:
+                    status = 0
+            finally:
+                os._exit(status)
+        
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(os.waitstatus_to_exitcode(status), 0)
+        self.assertEqual(self.stored_count(), 2)
+
+
+@mock.patch.object(audit_logger, 'SEGMENT_SIZE', 4)
+class TestAuditSegments(unittest.TestCase):
+    """Test Merkle segment sealing and audit verification modes."""
+    
+    def setUp(self):
+        self.app = create_test_app()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        init_db()
+    
+    def tearDown(self):
+        db.session.remove()
+        self.ctx.pop()
+    
+    def log(self, count):
+        """Log count records synchronously."""
+        for i in range(count):
+            log_action('submission_created', 'create', 'submission', submission_id=i,
+                       details={'n': i})
+    
+    def execute(self, statement):
+        """Run raw SQL against the audit database, as a tamperer would."""
+        with db.engines['audit'].begin() as connection:
+            connection.execute(text(statement))
+    
+    def segments(self):
+        """Get (first_id, last_id, row_count) for each sealed segment."""
+        return [
+            (segment.first_id, segment.last_id, segment.row_count)
+            for segment in AuditLogSegment.query.order_by(AuditLogSegment.first_id)
+        ]
+    
+    def test_seals_complete_segments_only(self):
+        """Test that only full runs of SEGMENT_SIZE records are sealed."""
+        self.log(10)
+        
+        self.assertEqual(seal_audit_segments(), 2)
+        self.assertEqual(self.segments(), [(1, 4, 4), (5, 8, 4)])
+        self.assertEqual(seal_audit_segments(), 0)
+        
+        self.log(2)
+        self.assertEqual(seal_audit_segments(), 1)
+        self.assertEqual(self.segments()[-1], (9, 12, 4))
+    
+    def test_segment_root_covers_integrity_hashes(self):
+        """Test that the stored root is the Merkle root of the rows' hashes."""
+        self.log(4)
+        seal_audit_segments()
+        
+        hashes = [log.integrity_hash for log in AuditLog.query.order_by(AuditLog.id)]
+        self.assertEqual(AuditLogSegment.query.one().merkle_root, compute_merkle_root(hashes))
+    
+    def test_untampered_trail_verifies_in_every_mode(self):
+        """Test that full and incremental verification agree on a clean trail."""
+        self.log(10)
+        
+        self.assertEqual(verify_audit_integrity(), (10, 0, []))
+        self.assertEqual(verify_audit_integrity(incremental=True), (10, 0, []))
+    
+    def test_tampered_tail_record_detected_incrementally(self):
+        """Test that content edits in the unsealed tail are caught."""
+        self.log(10)
+        seal_audit_segments()
+        self.execute("UPDATE audit_logs SET details_json = '{}' WHERE id = 10")
+        
+        self.assertEqual(verify_audit_integrity(incremental=True), (9, 1, [10]))
+    
+    def test_content_edit_in_sealed_segment_needs_full_verify(self):
+        """Test that incremental mode trusts sealed content (documented limit)."""
+        self.log(10)
+        seal_audit_segments()
+        self.execute("UPDATE audit_logs SET details_json = '{}' WHERE id = 2")
+        
+        self.assertEqual(verify_audit_integrity(incremental=True), (10, 0, []))
+        self.assertEqual(verify_audit_integrity(), (9, 1, [2]))
+    
+    def test_rehashed_record_in_sealed_segment_detected(self):
+        """Test that a rewrite with a recomputed hash breaks the segment root."""
+        self.log(10)
+        seal_audit_segments()
+        
+        audit_log = db.session.get(AuditLog, 2)
+        audit_log.details_json = '{}'
+        audit_log.integrity_hash = audit_log.compute_integrity_hash()
+        db.session.commit()
+        
+        # Each row still matches its own hash, so the whole segment is reported
+        self.assertEqual(verify_audit_integrity(), (10, 0, []))
+        self.assertEqual(verify_audit_integrity(incremental=True), (6, 4, [1, 2, 3, 4]))
+    
+    def test_deleted_record_in_sealed_segment_detected(self):
+        """Test that deleting a sealed record breaks the segment root."""
+        self.log(10)
+        seal_audit_segments()
+        self.execute('DELETE FROM audit_logs WHERE id = 6')
+        
+        self.assertEqual(verify_audit_integrity(incremental=True), (6, 3, [5, 7, 8]))
+    
+    @mock.patch.object(audit_logger, 'VERIFY_BATCH_SIZE', 5)
+    def test_process_pool_verification(self):
+        """Test that multi-batch tables are verified across worker processes."""
+        self.log(20)
+        self.execute("UPDATE audit_logs SET details_json = '{}' WHERE id IN (3, 17)")
+        
+        with mock.patch.object(
+            audit_logger, 'ProcessPoolExecutor', wraps=audit_logger.ProcessPoolExecutor
+        ) as pool:
+            result = verify_audit_integrity(max_workers=2)
+        
+        pool.assert_called_once()
+        self.assertEqual(result, (18, 2, [3, 17]))
+
+
+class TestAuditTrail(unittest.TestCase):
+    """Test reading a submission's audit trail page by page."""
+    
+    def setUp(self):
+        self.app = create_test_app()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        init_db()
+    
+    def tearDown(self):
+        db.session.remove()
+        self.ctx.pop()
+    
+    def test_pages_records_sharing_a_timestamp_by_id(self):
+        """Test that records written in one batch page without gaps or repeats."""
+        for i in range(7):
+            log_action('submission_created', 'create', 'submission', submission_id=1,
+                       details={'n': i})
+        log_action('submission_created', 'create', 'submission', submission_id=2)
+        with db.engines['audit'].begin() as connection:
+            connection.execute(text("UPDATE audit_logs SET timestamp = '2024-01-02 03:04:05.000000'"))
+        
+        pages = [get_audit_trail_for_submission(1, limit=3, offset=offset) for offset in (0, 3, 6)]
+        
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+        self.assertEqual([entry['id'] for page in pages for entry in page], list(range(1, 8)))
+        self.assertEqual([entry['details'] for entry in pages[0]], [{'n': 0}, {'n': 1}, {'n': 2}])
+    
+    def test_limit_truncates_trail(self):
+        """Test that only one page of the trail is returned."""
+        for _ in range(3):
+            log_action('submission_created', 'create', 'submission', submission_id=1)
+        
+        self.assertEqual(len(get_audit_trail_for_submission(1)), 3)
+        self.assertEqual(len(get_audit_trail_for_submission(1, limit=2)), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
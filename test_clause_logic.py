@@ -2,10 +2,13 @@
 Unit tests for clause logic module.
 """
 
+import json
+
 import pytest
 from app.clause_logic import (
-    select_clauses, get_clause_title, get_clause_number,
-    get_clause_description, validate_clause_order,
+    select_clauses, select_clauses_batch, get_clause_title, get_clause_number, build_clause_numbers,
+    get_clause_description, get_clauses_summary, validate_clause_order,
+    check_clause_dependencies, FLAG_NAMES, CLAUSE_ORDER,
     CLAUSE_TITLE_IDENTIFICATION, CLAUSE_REVOCATION, CLAUSE_DEFINITIONS,
     CLAUSE_APPOINTMENT_EXECUTORS_TRUSTEES, CLAUSE_FUNERAL_WISHES,
     CLAUSE_GUARDIANSHIP, CLAUSE_DISTRIBUTION_OVERVIEW, CLAUSE_SPECIFIC_GIFTS,
@@ -185,6 +188,26 @@ class TestClauseSelection:
         
         assert clauses1 == clauses2
 
+    def test_mask_selection_matches_dependency_check(self):
+        """Test that mask-based selection agrees with check_clause_dependencies."""
+        for flag_name in FLAG_NAMES:
+            context = WillContext()
+            setattr(context, flag_name, True)
+            
+            expected = tuple(c for c in CLAUSE_ORDER if check_clause_dependencies(c, context))
+            
+            assert select_clauses(context) == expected
+
+    def test_batch_selection_matches_single(self):
+        """Test that batch selection matches per-context selection in order."""
+        contexts = []
+        for flag_name in FLAG_NAMES:
+            context = WillContext()
+            setattr(context, flag_name, True)
+            contexts.append(context)
+        
+        assert select_clauses_batch(contexts) == [select_clauses(c) for c in contexts]
+
 
 class TestClauseOrder:
     def test_order_is_valid(self):
@@ -264,6 +287,25 @@ class TestClauseTitles:
         assert get_clause_number(CLAUSE_DEFINITIONS, selected) == 3
         assert get_clause_number(CLAUSE_GUARDIANSHIP, selected) == 0  # Not in list
 
+    def test_build_clause_numbers(self):
+        """Test that the numbering table matches get_clause_number."""
+        selected = select_clauses(WillContext())
+        numbers = build_clause_numbers(selected)
+        
+        assert numbers[CLAUSE_TITLE_IDENTIFICATION] == 1
+        assert numbers[CLAUSE_ATTESTATION] == len(selected)
+        for clause_id in selected:
+            assert numbers[clause_id] == get_clause_number(clause_id, selected)
+
+
+class TestClauseIds:
+    def test_clause_ids_serialize_as_strings(self):
+        """Test that clause IDs stay string-valued for the document plan."""
+        for clause_id in CLAUSE_ORDER:
+            assert isinstance(clause_id, str)
+            assert clause_id == clause_id.value
+            assert json.loads(json.dumps(clause_id)) == clause_id.value
+
 
 class TestClauseDescriptions:
     def test_all_clauses_have_descriptions(self):
@@ -296,6 +338,47 @@ class TestClauseDescriptions:
             assert len(description) > 0
 
 
+class TestClausesSummary:
+    def test_summary_contents(self):
+        """Test that the summary describes the selected clauses and flags."""
+        context = WillContext()
+        context.will_maker = WillMaker(full_name='Test Person')
+        context.has_pets = True
+        
+        summary = get_clauses_summary(context)
+        clauses = select_clauses(context)
+        
+        assert summary['total_clauses'] == len(clauses)
+        assert summary['selected_clauses'] == [c.value for c in clauses]
+        assert summary['flags']['has_pets'] is True
+        assert summary['flags']['has_guardianship'] is False
+        assert set(summary['flags']) == set(FLAG_NAMES)
+        assert summary['conflicts'] == []
+        assert summary['clauses_detail'][0] == {
+            'id': CLAUSE_TITLE_IDENTIFICATION.value,
+            'number': 1,
+            'title': get_clause_title(CLAUSE_TITLE_IDENTIFICATION),
+            'description': get_clause_description(CLAUSE_TITLE_IDENTIFICATION),
+        }
+
+    def test_summary_is_private_to_each_caller(self):
+        """Test that changing one summary does not affect later ones for the same flags."""
+        context = WillContext()
+        context.will_maker = WillMaker(full_name='Test Person')
+        
+        summary = get_clauses_summary(context)
+        summary['conflicts'].append('changed')
+        summary['flags']['has_pets'] = True
+        summary['selected_clauses'].pop()
+        summary['clauses_detail'][0]['title'] = 'changed'
+        
+        fresh = get_clauses_summary(context)
+        assert fresh['conflicts'] == []
+        assert fresh['flags']['has_pets'] is False
+        assert fresh['selected_clauses'][-1] == CLAUSE_ATTESTATION.value
+        assert fresh['clauses_detail'][0]['title'] == get_clause_title(CLAUSE_TITLE_IDENTIFICATION)
+
+
 class TestComplexScenarios:
     def test_full_will_clauses(self):
         """Test clause selection for a full will with all options."""
@@ -345,7 +428,7 @@ class TestComplexScenarios:
             CLAUSE_ATTESTATION,
         ]
         
-        assert clauses == expected_order
+        assert clauses == tuple(expected_order)
 
     def test_simple_will_clauses(self):
         """Test clause selection for a simple will with minimal options."""
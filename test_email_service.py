@@ -0,0 +1,283 @@
+"""
+Email Service Tests
+
+Tests for SMTP delivery against a stub server:
+- Pooled connection reuse, recycling and reconnects
+- Retry of dropped sends
+- Batched sends with bounded read-ahead and per-job failures
+"""
+
+import smtplib
+import unittest
+from unittest import mock
+
+from flask import Flask
+
+from app import email_service as email_module
+from app.email_service import EmailService
+
+
+SMTP_ENV = {
+    'SMTP_HOST': 'smtp.example.com',
+    'SMTP_USER': 'user',
+    'SMTP_PASSWORD': 'secret',
+    'SMTP_MAX_SENDS_PER_CONNECTION': '100',
+}
+
+
+class StubSMTP:
+    """Records connections and sends; failures are scripted per class."""
+    
+    instances = []
+    # Number of upcoming sendmail calls that drop the connection
+    disconnects = 0
+    
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.alive = True
+        self.sent = []
+        self.closed = False
+        StubSMTP.instances.append(self)
+    
+    def starttls(self):
+        pass
+    
+    def login(self, user, password):
+        pass
+    
+    def noop(self):
+        if not self.alive:
+            raise smtplib.SMTPServerDisconnected('Connection unexpectedly closed')
+        return (250, b'OK')
+    
+    def sendmail(self, from_addr, to_addrs, msg):
+        if StubSMTP.disconnects:
+            StubSMTP.disconnects -= 1
+            self.alive = False
+            raise smtplib.SMTPServerDisconnected('Connection unexpectedly closed')
+        self.sent.append((from_addr, to_addrs, msg))
+    
+    def quit(self):
+        self.closed = True
+    
+    def close(self):
+        self.closed = True
+
+
+class EmailServiceTestCase(unittest.TestCase):
+    """Runs each test with a stub SMTP server and audit logging mocked."""
+    
+    env = SMTP_ENV
+    
+    def setUp(self):
+        StubSMTP.instances = []
+        StubSMTP.disconnects = 0
+        
+        patches = [
+            mock.patch.dict('os.environ', self.env),
+            mock.patch.object(email_module.smtplib, 'SMTP', StubSMTP),
+            mock.patch.object(email_module, 'log_email_sent'),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.log_email_sent = email_module.log_email_sent
+        
+        ctx = Flask(__name__).app_context()
+        ctx.push()
+        self.addCleanup(ctx.pop)
+        
+        self.service = EmailService()
+        self.addCleanup(self.service.close)
+    
+    def send(self, recipient='jane@example.com'):
+        """Send one will email through the service."""
+        return self.service.send_will_email(
+            recipient, 'Jane Citizen', b'%PDF-will', b'%PDF-checklist', 'a' * 16, 1
+        )
+
+
+class TestConnectionPooling(EmailServiceTestCase):
+    """Test reuse and recycling of the pooled SMTP connection."""
+    
+    def test_connection_reused_between_sends(self):
+        """Test that consecutive sends share one connection."""
+        self.assertEqual(self.send(), (True, None))
+        self.assertEqual(self.send(), (True, None))
+        
+        self.assertEqual(len(StubSMTP.instances), 1)
+        self.assertEqual(len(StubSMTP.instances[0].sent), 2)
+    
+    def test_reconnects_when_noop_fails(self):
+        """Test that a connection dropped while idle is replaced."""
+        self.send()
+        StubSMTP.instances[0].alive = False
+        
+        self.assertEqual(self.send(), (True, None))
+        self.assertEqual(len(StubSMTP.instances), 2)
+        self.assertTrue(StubSMTP.instances[0].closed)
+        self.assertEqual(len(StubSMTP.instances[1].sent), 1)
+    
+    @mock.patch.dict('os.environ', {'SMTP_MAX_SENDS_PER_CONNECTION': '2'})
+    def test_connection_recycled_after_max_sends(self):
+        """Test that SMTP_MAX_SENDS_PER_CONNECTION rolls the connection over."""
+        service = EmailService()
+        self.addCleanup(service.close)
+        self.service = service
+        
+        for _ in range(3):
+            self.send()
+        
+        self.assertEqual([len(server.sent) for server in StubSMTP.instances], [2, 1])
+        self.assertTrue(StubSMTP.instances[0].closed)
+    
+    def test_close_quits_connection(self):
+        """Test that close() ends the pooled connection."""
+        self.send()
+        self.service.close()
+        
+        self.assertTrue(StubSMTP.instances[0].closed)
+        self.assertIsNone(self.service._smtp)
+
+
+class TestSendRetry(EmailServiceTestCase):
+    """Test resending when the server drops the connection mid-send."""
+    
+    def test_dropped_send_retried_with_same_bytes(self):
+        """Test that a send dropped mid-message goes out on a new connection."""
+        self.send()
+        StubSMTP.disconnects = 1
+        
+        self.assertEqual(self.send(), (True, None))
+        self.assertEqual(len(StubSMTP.instances), 2)
+        self.assertEqual(StubSMTP.instances[1].sent[0][1], ['jane@example.com'])
+        self.log_email_sent.assert_called_with(1, 'jane@example.com', True)
+    
+    def test_retries_exhausted(self):
+        """Test that a send is given up after _SEND_ATTEMPTS drops."""
+        StubSMTP.disconnects = email_module._SEND_ATTEMPTS
+        
+        success, error = self.send()
+        
+        self.assertFalse(success)
+        self.assertIn('unexpectedly closed', error)
+        self.assertEqual(len(StubSMTP.instances), email_module._SEND_ATTEMPTS)
+        self.assertIsNone(self.service._smtp)
+        self.log_email_sent.assert_called_with(1, 'jane@example.com', False, error)
+    
+    def test_recovers_after_exhausted_retries(self):
+        """Test that the next send opens a fresh connection."""
+        StubSMTP.disconnects = email_module._SEND_ATTEMPTS
+        self.send()
+        
+        self.assertEqual(self.send(), (True, None))
+
+
+class TestMessageContent(EmailServiceTestCase):
+    """Test the built will email."""
+    
+    def test_full_digest_shown_as_16_chars(self):
+        """Test that a caller passing the full hash still gets 16 chars."""
+        msg = self.service._build_message(
+            'jane@example.com', 'Jane Citizen', b'%PDF-will', b'%PDF-checklist', 'b' * 64
+        )
+        text = msg.get_payload(0).get_payload(decode=True).decode()
+        
+        self.assertIn('b' * 16, text)
+        self.assertNotIn('b' * 17, text)
+
+def batch_job(index, **overrides):
+    """Build a send_batch job for recipient number index."""
+    job = {
+        'recipient_email': f'client{index}@example.com',
+        'will_maker_name': f'Client {index}',
+        'pdf_bytes': b'%PDF-will',
+        'checklist_pdf_bytes': b'%PDF-checklist',
+        'document_hash_short': 'a' * 16,
+        'submission_id': index,
+    }
+    job.update(overrides)
+    return job
+
+
+class TestSendBatch(EmailServiceTestCase):
+    """Test send_batch ordering, memory bound and failure isolation."""
+    
+    def sent_recipients(self):
+        """Get recipients in send order across all connections."""
+        return [to_addrs[0] for server in StubSMTP.instances for _, to_addrs, _ in server.sent]
+    
+    def test_sends_in_job_order_on_one_connection(self):
+        """Test that batch results and sends follow job order."""
+        results = self.service.send_batch(batch_job(i) for i in range(5))
+        
+        self.assertEqual(results, [(True, None)] * 5)
+        self.assertEqual(len(StubSMTP.instances), 1)
+        self.assertEqual(self.sent_recipients(), [f'client{i}@example.com' for i in range(5)])
+    
+    def test_read_ahead_is_bounded(self):
+        """Test that only the next message is built while one is sent."""
+        built = []
+        sendmail = StubSMTP.sendmail
+        outstanding = []
+        build = self.service._build_message
+        
+        def counting_build(*args):
+            msg = build(*args)
+            built.append(msg)
+            return msg
+        
+        def counting_sendmail(server, *args):
+            # Messages built but not yet sent, including this one
+            outstanding.append(len(built) - len(self.sent_recipients()))
+            sendmail(server, *args)
+        
+        with mock.patch.object(self.service, '_build_message', counting_build), \
+                mock.patch.object(StubSMTP, 'sendmail', counting_sendmail):
+            self.service.send_batch(batch_job(i) for i in range(10))
+        
+        self.assertEqual(len(outstanding), 10)
+        self.assertLessEqual(max(outstanding), email_module._BATCH_READ_AHEAD + 1)
+    
+    def test_job_missing_key_fails_alone(self):
+        """Test that a malformed job does not abort the batch."""
+        jobs = [batch_job(0), batch_job(1), batch_job(2)]
+        del jobs[1]['pdf_bytes']
+        
+        results = self.service.send_batch(jobs)
+        
+        self.assertEqual(results[0], (True, None))
+        self.assertEqual(results[1], (False, 'Batch job is missing pdf_bytes'))
+        self.assertEqual(results[2], (True, None))
+        self.assertEqual(self.sent_recipients(), ['client0@example.com', 'client2@example.com'])
+    
+    def test_job_that_fails_to_build_fails_alone(self):
+        """Test that a build error is reported for that job only."""
+        results = self.service.send_batch([batch_job(0, pdf_bytes=None), batch_job(1)])
+        
+        self.assertFalse(results[0][0])
+        self.assertEqual(results[1], (True, None))
+        self.log_email_sent.assert_any_call(0, 'client0@example.com', False, results[0][1])
+    
+    def test_unconfigured_batch(self):
+        """Test that an unconfigured service fails every job."""
+        self.service.enabled = False
+        
+        results = self.service.send_batch(batch_job(i) for i in range(2))
+        
+        self.assertEqual(results, [(False, 'Email service not configured')] * 2)
+
+class TestUnconfigured(EmailServiceTestCase):
+    """Test behaviour without SMTP credentials."""
+    
+    env = {'SMTP_HOST': '', 'SMTP_USER': '', 'SMTP_PASSWORD': ''}
+    
+    def test_send_reports_not_configured(self):
+        """Test that sending fails without opening a connection."""
+        self.assertEqual(self.send(), (False, 'Email service not configured'))
+        self.assertEqual(StubSMTP.instances, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
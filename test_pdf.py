@@ -4,6 +4,9 @@ Unit tests for PDF generation module.
 
 import pytest
 import io
+import pickle
+from datetime import datetime
+from dataclasses import FrozenInstanceError
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import A4
 
@@ -11,8 +14,10 @@ from app.context_builder import (
     WillContext, WillMaker, Address, Executor, Beneficiary,
     SpecificGift, ResidueBeneficiary
 )
-from app.clause_renderer import render_document_plan
+from app.clause_renderer import render_document_plan, document_plan_to_dict
 from app.pdf_generator import generate_pdf_with_footer, create_styles
+from app import execution_checklist
+from app.execution_checklist import generate_execution_checklist
 
 
 class TestPDFStyles:
@@ -305,6 +310,70 @@ class TestDocumentPlanRendering:
                 assert block.content is not None
                 assert block.style is not None
 
+    def _render_simple_plan(self):
+        context = WillContext()
+        context.will_maker = WillMaker(full_name='John Test')
+        context.residue_beneficiaries = [
+            ResidueBeneficiary(beneficiary_id='b1', beneficiary_name='Jane', share_percent=100)
+        ]
+        return render_document_plan(context)
+
+    def _blocks(self, document_plan, clause_id):
+        return next(item.content_blocks for item in document_plan if item.id == clause_id)
+
+    def test_shared_blocks_are_read_only(self):
+        """Test that blocks shared between plans cannot be modified."""
+        document_plan = self._render_simple_plan()
+        witness = self._blocks(document_plan, 'attestation')[-1]
+        survivorship = self._blocks(document_plan, 'survivorship')[0]
+        
+        with pytest.raises(FrozenInstanceError):
+            witness.style = 'normal'
+        with pytest.raises(FrozenInstanceError):
+            survivorship.content = 'changed'
+        with pytest.raises(TypeError):
+            witness.content['label'] = 'changed'
+        
+        assert self._blocks(self._render_simple_plan(), 'attestation')[-1].content['label'] == 'Witness 2'
+
+    def test_serialized_content_is_a_private_copy(self):
+        """Test that changing a serialized plan does not leak into later plans."""
+        plan_dict = document_plan_to_dict(self._render_simple_plan())
+        attestation = next(item for item in plan_dict if item['id'] == 'attestation')
+        attestation['content_blocks'][-1]['content']['label'] = 'changed'
+        
+        plan_dict = document_plan_to_dict(self._render_simple_plan())
+        attestation = next(item for item in plan_dict if item['id'] == 'attestation')
+        assert type(attestation['content_blocks'][-1]['content']) is dict
+        assert attestation['content_blocks'][-1]['content']['label'] == 'Witness 2'
+
+    def test_blocks_pickle_round_trip(self):
+        """Test that plans survive pickling for worker processes."""
+        document_plan = self._render_simple_plan()
+        restored = pickle.loads(pickle.dumps(document_plan))
+        
+        assert document_plan_to_dict(restored) == document_plan_to_dict(document_plan)
+        with pytest.raises(TypeError):
+            self._blocks(restored, 'attestation')[-1].content['label'] = 'changed'
+
+
+class TestExecutionChecklist:
+    def test_builds_leave_prebuilt_flowables_untouched(self):
+        """Test that laying out a checklist writes nothing onto the shared flowables."""
+        context = WillContext()
+        context.will_maker = WillMaker(full_name='John Test')
+        timestamp = datetime(2024, 1, 2, 3, 4, 5)
+        prebuilt = execution_checklist._STATIC_HEAD + execution_checklist._STATIC_BODY
+        
+        first = generate_execution_checklist(context, 'a' * 64, timestamp)
+        second = generate_execution_checklist(context, 'a' * 64, timestamp)
+        
+        assert first == second
+        for flowable in prebuilt:
+            assert not hasattr(flowable, 'blPara')
+            for frag in getattr(flowable, 'frags', ()):
+                assert not hasattr(frag, '_fkind')
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -5,6 +5,7 @@ Utility functions for formatting, hashing, and text processing.
 import hashlib
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 
 
@@ -324,6 +325,18 @@ def ordinal(n: int) -> str:
     return f'{n}{suffix}'
 
 
+@lru_cache(maxsize=512)
+def _parse_dob(dob: str) -> Optional[datetime]:
+    """Parse an ISO or YYYY-MM-DD date of birth, or None if unparseable."""
+    try:
+        return datetime.fromisoformat(dob.replace('Z', '+00:00'))
+    except ValueError:
+        try:
+            return datetime.strptime(dob, '%Y-%m-%d')
+        except ValueError:
+            return None
+
+
 def is_minor_at_date(dob: Any, reference_date: Optional[datetime] = None) -> bool:
     """
     Determine if a person with given DOB would be a minor at a reference date.
@@ -342,13 +355,7 @@ def is_minor_at_date(dob: Any, reference_date: Optional[datetime] = None) -> boo
     if isinstance(dob, datetime):
         birth_date = dob
     elif isinstance(dob, str):
-        try:
-            birth_date = datetime.fromisoformat(dob.replace('Z', '+00:00'))
-        except ValueError:
-            try:
-                birth_date = datetime.strptime(dob, '%Y-%m-%d')
-            except ValueError:
-                return False
+        birth_date = _parse_dob(dob)
     
     if birth_date is None:
         return False
@@ -375,6 +382,9 @@ def chunk_list(lst: List[Any], chunk_size: int) -> List[List[Any]]:
     return [lst[i:i + chunk_size] for i in range(0, len(lst), chunk_size)]
 
 
+_BRISBANE_FORMAT = '%d %B %Y at %I:%M %p %Z'
+
+
 def get_brisbane_time() -> datetime:
     """
     Get current time in Brisbane timezone.
@@ -386,10 +396,23 @@ def get_brisbane_time() -> datetime:
     return datetime.now(ZoneInfo('Australia/Brisbane'))
 
 
+@lru_cache(maxsize=1024)
+def _format_brisbane(dt: datetime) -> str:
+    """Convert a datetime to Brisbane time and format it (naive means UTC)."""
+    from zoneinfo import ZoneInfo
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=ZoneInfo('UTC'))
+    return dt.astimezone(ZoneInfo('Australia/Brisbane')).strftime(_BRISBANE_FORMAT)
+
+
 def format_brisbane_datetime(dt: Optional[datetime] = None) -> str:
     """
     Format datetime in Brisbane timezone.
     
+    Formatting of a given datetime is memoized per second (the output only
+    shows minutes), so batches stamped with the same generation time skip
+    the timezone conversion and strftime.
+    
     Args:
         dt: Datetime to format (defaults to now)
     
@@ -397,11 +420,5 @@ def format_brisbane_datetime(dt: Optional[datetime] = None) -> str:
         Formatted datetime string
     """
     if dt is None:
-        dt = get_brisbane_time()
-    else:
-        from zoneinfo import ZoneInfo
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=ZoneInfo('UTC'))
-        dt = dt.astimezone(ZoneInfo('Australia/Brisbane'))
-    
-    return dt.strftime('%d %B %Y at %I:%M %p %Z')
+        return get_brisbane_time().strftime(_BRISBANE_FORMAT)
+    return _format_brisbane(dt.replace(microsecond=0))